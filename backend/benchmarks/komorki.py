@@ -0,0 +1,101 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import argparse
+import time
+from typing import Callable
+
+# Zewnętrzne biblioteki
+from bs4 import (
+    BeautifulSoup,
+    Tag
+)
+
+# Wewnętrzne importy
+from korpus import STRONY
+from src.handlers.timetables.helpers import (
+    podzielKomórkę,
+    sklasyfikujBlok
+)
+
+def przetwórzPonownie(blok: list[Tag | str]) -> None:
+    """
+    Rozpoznaje etykiety bloku komórki tak jak przed zmianą, serializując blok, przetwarzając go ponownie jako osobny dokument i wyszukując w nim etykiety selektorami CSS.
+
+    Args:
+        blok (list[Tag | str]): Blok komórki będący listą elementów HTML lub tekstu.
+    """
+
+    fragment = BeautifulSoup("".join(map(str, blok)), "html.parser")
+    fragment.select(".p")
+    fragment.select(".o")
+    fragment.select_one(".n")
+    fragment.select_one(".s")
+
+
+def zmierz(
+    wiersze: list[list[Tag]],
+    rozpoznaj: Callable[[list[Tag | str]], object],
+    powtórzenia: int
+) -> float:
+    """
+    Mierzy najkrótszy czas rozpoznania etykiet wszystkich bloków komórek w przeliczeniu na jeden wiersz tabeli planu lekcji.
+
+    Args:
+        wiersze (list[list[Tag]]): Lista wierszy tabeli, z których każdy jest listą komórek lekcji.
+        rozpoznaj (Callable[[list[Tag | str]], object]): Funkcja rozpoznająca etykiety bloku komórki.
+        powtórzenia (int): Liczba powtórzeń pomiaru.
+
+    Returns:
+        float: Czas przypadający na jeden wiersz tabeli (w mikrosekundach).
+    """
+
+    czasy: list[float] = []
+
+    for _ in range(powtórzenia):
+        początek = time.perf_counter()
+
+        for wiersz in wiersze:
+            for td in wiersz:
+                for blok in podzielKomórkę(td):
+                    rozpoznaj(blok)
+
+        czasy.append(time.perf_counter() - początek)
+
+    return min(czasy) / len(wiersze) * 1e6
+
+
+def main() -> None:
+    """
+    Porównuje koszt rozpoznania etykiet bloków komórek na jeden wiersz tabeli planu lekcji: w jednym przejściu po istniejących elementach oraz przez ponowne przetworzenie każdego bloku.
+    """
+
+    argumenty = argparse.ArgumentParser(description="Koszt rozpoznania etykiet bloków komórek na jeden wiersz tabeli planu lekcji.")
+    argumenty.add_argument("--powtorzenia", type=int, default=20, help="Liczba powtórzeń pomiaru.")
+    ustawienia = argumenty.parse_args()
+
+    wiersze: list[list[Tag]] = []
+    for ścieżka in sorted((STRONY / "plany").glob("*.html")):
+        tabela = BeautifulSoup(ścieżka.read_text(encoding="utf-8"), "html.parser").select_one("table.tabela")
+        wiersze.extend(komórki for komórki in (wiersz.find_all("td", class_="l") for wiersz in tabela.find_all("tr")) if komórki)
+
+    jednoPrzejście = zmierz(wiersze, sklasyfikujBlok, ustawienia.powtorzenia)
+    ponownePrzetwarzanie = zmierz(wiersze, przetwórzPonownie, ustawienia.powtorzenia)
+
+    print(f"wiersze: {len(wiersze)}")
+    print(f"jedno przejście: {jednoPrzejście:.1f} µs/wiersz")
+    print(f"ponowne przetwarzanie bloku: {ponownePrzetwarzanie:.1f} µs/wiersz ({ponownePrzetwarzanie / jednoPrzejście:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import argparse
+import asyncio
+import statistics
+import time
+
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+
+# Wewnętrzne importy
+from korpus import (
+    ADRESY,
+    STRONY,
+    zwróćŚcieżkę
+)
+from src.classes.cache import pamięć
+from src.classes.memo import zapamiętywanie
+from src.classes.parser import analizator
+from src.handlers.configuration import konfiguracja
+from src.handlers.lists.parser import wyodrębnijListy
+import src.handlers.timetables.resolver
+from src.handlers.timetables.parser import wyodrębnijPlanLekcji
+
+async def pobierzZawartośćStrony(atom: object, url: str, kodowanie: str, profil: str | None = None) -> BeautifulSoup:
+    """
+    Zastępuje pobieranie strony internetowej przetworzeniem zapisanej strony w puli wątków przetwarzania, tak jak przez moduł pobierający strony.
+
+    Returns:
+        BeautifulSoup: Obiekt BeautifulSoup reprezentujący stronę HTML.
+    """
+
+    ścieżka, kodowanieStrony = zwróćŚcieżkę(url)
+    return await analizator.wykonaj(analizator.przetwórz, ścieżka.read_bytes().decode(kodowanieStrony, errors="ignore"), profil, pamięć.zwróćŹródło(url))
+
+
+async def zmierz(zapytania: int) -> tuple[float, list[float]]:
+    """
+    Przetwarza zapisane strony planów lekcji w zadanej liczbie jednoczesnych zapytań, mierząc w tym czasie opóźnienie pętli zdarzeń zegarem budzonym co milisekundę.
+
+    Args:
+        zapytania (int): Liczba jednocześnie przetwarzanych stron planów lekcji.
+
+    Returns:
+        tuple[float, list[float]]: Czas przetworzenia wszystkich stron (w sekundach) oraz posortowana lista opóźnień pętli zdarzeń (w sekundach).
+    """
+
+    listaOddziałów = wyodrębnijListy(await pobierzZawartośćStrony(None, ADRESY["lista"], "utf-8"), ADRESY["lista"])["oddzialy"]
+    adresy = [ADRESY["plany"] + ścieżka.name for ścieżka in sorted((STRONY / "plany").glob("*.html"))]
+    adresy = [adresy[numer % len(adresy)] for numer in range(zapytania)]
+    opóźnienia: list[float] = []
+    koniec = False
+
+    async def zegar() -> None:
+        """
+        Odnotowuje, o ile później niż po milisekundzie pętla zdarzeń wznowiła uśpione zadanie.
+        """
+
+        while not koniec:
+            początek = time.perf_counter()
+            await asyncio.sleep(0.001)
+            opóźnienia.append(time.perf_counter() - początek - 0.001)
+
+    async def przetwórz(url: str) -> None:
+        """
+        Przetwarza stronę planu lekcji i wyodrębnia z niej plan lekcji.
+
+        Args:
+            url (str): Adres strony planu lekcji.
+        """
+
+        zawartośćStrony = await pobierzZawartośćStrony(None, url, "utf-8")
+        await wyodrębnijPlanLekcji(None, zawartośćStrony, listaOddziałów, None, None, None, url, None)
+
+    zapamiętywanie.fragmenty.clear()
+    zadanie = asyncio.create_task(zegar())
+    początek = time.perf_counter()
+    await asyncio.gather(*(przetwórz(url) for url in adresy))
+    czas = time.perf_counter() - początek
+    koniec = True
+    await zadanie
+
+    return czas, sorted(opóźnienia)
+
+
+def main() -> None:
+    """
+    Porównuje opóźnienie pętli zdarzeń i przepustowość przetwarzania stron bez puli wątków przetwarzania (`watki` równe 0) oraz z pulami wątków o podanych rozmiarach.
+    """
+
+    argumenty = argparse.ArgumentParser(description="Opóźnienie pętli zdarzeń i przepustowość przetwarzania stron w zależności od rozmiaru puli wątków przetwarzania.")
+    argumenty.add_argument("--watki", type=int, nargs="+", default=[0, 2, 4], help="Rozmiary puli wątków przetwarzania.")
+    argumenty.add_argument("--zapytania", type=int, default=30, help="Liczba jednocześnie przetwarzanych stron planów lekcji.")
+    argumenty.add_argument("--powtorzenia", type=int, default=3, help="Liczba powtórzeń pomiaru dla każdego rozmiaru puli.")
+    ustawienia = argumenty.parse_args()
+
+    for źródło, url in ADRESY.items():
+        konfiguracja[źródło]["url"] = url
+        konfiguracja[źródło]["lustra"] = []
+
+    src.handlers.timetables.resolver.pobierzZawartośćStrony = pobierzZawartośćStrony
+
+    for wątki in ustawienia.watki:
+        konfiguracja["przetwarzanie"]["watki"] = wątki
+        analizator.close()
+        analizator.start()
+
+        czasy: list[float] = []
+        opóźnienia: list[float] = []
+        for _ in range(ustawienia.powtorzenia):
+            czas, opóźnieniaPrzebiegu = asyncio.run(zmierz(ustawienia.zapytania))
+            czasy.append(czas)
+            opóźnienia.extend(opóźnieniaPrzebiegu)
+
+        opóźnienia.sort()
+        print(
+            f"watki={wątki}: {ustawienia.zapytania / statistics.median(czasy):.1f} stron/s, "
+            f"opóźnienie pętli zdarzeń mediana {statistics.median(opóźnienia) * 1000:.2f} ms, "
+            f"p99 {opóźnienia[int(len(opóźnienia) * 0.99)] * 1000:.2f} ms, "
+            f"maks. {opóźnienia[-1] * 1000:.2f} ms"
+        )
+
+    analizator.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import argparse
+import re
+import time
+from typing import Callable
+
+# Zewnętrzne biblioteki
+from bs4 import (
+    BeautifulSoup,
+    NavigableString,
+    Tag
+)
+
+# Wewnętrzne importy
+from korpus import STRONY
+from src.handlers.helpers import wyodrębnijTekst
+
+def przetwórzPonownie(węzeł: Tag) -> str:
+    """
+    Wyodrębnia tekst elementu tak jak przed zmianą, serializując go, przetwarzając ponownie jako osobny dokument, zamieniając znaczniki `<br>` na znaki nowej linii i odczytując tekst metodą `get_text`.
+
+    Args:
+        węzeł (Tag): Element strony internetowej.
+
+    Returns:
+        str: Oczyszczony i znormalizowany tekst.
+    """
+
+    tymczasowy = BeautifulSoup(str(węzeł), "html.parser")
+
+    for element in tymczasowy.find_all(string=True):
+        element.replace_with(element.replace("\n", "").replace("\r", ""))
+
+    for br in tymczasowy.find_all("br"):
+        br.replace_with(NavigableString("\n"))
+
+    for tag in tymczasowy.find_all(True):
+        tag.unwrap()
+
+    tekst = tymczasowy.get_text(separator="")
+    tekst = tekst.replace("\r\n", "\n").replace("\r", "\n")
+    tekst = tekst.replace("\xa0", " ")
+    tekst = re.sub(r"[ \t]*\n[ \t]*", "\n", tekst)
+    tekst = re.sub(r"[ \t]{2,}", " ", tekst)
+    tekst = re.sub(r"\n{3,}", "\n\n", tekst)
+
+    return tekst.strip("\n ")
+
+
+def odczytajTekst(węzeł: Tag) -> str:
+    """
+    Odczytuje tekst elementu metodą `get_text` bez ponownego przetwarzania i normalizacji, jako dolną granicę kosztu odczytu tekstu.
+
+    Args:
+        węzeł (Tag): Element strony internetowej.
+
+    Returns:
+        str: Tekst elementu.
+    """
+
+    return węzeł.get_text()
+
+
+def zmierz(
+    wiersze: list[list[Tag]],
+    wyodrębnij: Callable[[Tag], str],
+    powtórzenia: int
+) -> float:
+    """
+    Mierzy najkrótszy czas wyodrębnienia tekstu wszystkich komórek w przeliczeniu na jeden wiersz tabeli zastępstw.
+
+    Args:
+        wiersze (list[list[Tag]]): Lista wierszy tabeli, z których każdy jest listą komórek.
+        wyodrębnij (Callable[[Tag], str]): Funkcja wyodrębniająca tekst komórki.
+        powtórzenia (int): Liczba powtórzeń pomiaru.
+
+    Returns:
+        float: Czas przypadający na jeden wiersz tabeli (w mikrosekundach).
+    """
+
+    czasy: list[float] = []
+
+    for _ in range(powtórzenia):
+        początek = time.perf_counter()
+
+        for wiersz in wiersze:
+            for td in wiersz:
+                wyodrębnij(td)
+
+        czasy.append(time.perf_counter() - początek)
+
+    return min(czasy) / len(wiersze) * 1e6
+
+
+def main() -> None:
+    """
+    Porównuje koszt wyodrębnienia tekstu komórek na jeden wiersz tabeli zastępstw: w jednym przejściu po istniejącym drzewie, przez ponowne przetworzenie każdej komórki oraz samą metodą `get_text`.
+    """
+
+    argumenty = argparse.ArgumentParser(description="Koszt wyodrębnienia tekstu komórek na jeden wiersz tabeli zastępstw.")
+    argumenty.add_argument("--powtorzenia", type=int, default=20, help="Liczba powtórzeń pomiaru.")
+    ustawienia = argumenty.parse_args()
+
+    dokument = BeautifulSoup((STRONY / "zastepstwa" / "index.html").read_bytes().decode("iso-8859-2"), "html.parser")
+    wiersze = [komórki for komórki in (wiersz.find_all("td") for wiersz in dokument.find_all("tr")) if komórki]
+
+    różne = sum(wyodrębnijTekst(td) != przetwórzPonownie(td) for wiersz in wiersze for td in wiersz)
+    jednoPrzejście = zmierz(wiersze, wyodrębnijTekst, ustawienia.powtorzenia)
+    ponownePrzetwarzanie = zmierz(wiersze, przetwórzPonownie, ustawienia.powtorzenia)
+    getText = zmierz(wiersze, odczytajTekst, ustawienia.powtorzenia)
+
+    print(f"wiersze: {len(wiersze)}, komórki o różnym tekście: {różne}")
+    print(f"jedno przejście: {jednoPrzejście:.1f} µs/wiersz")
+    print(f"ponowne przetwarzanie komórki: {ponownePrzetwarzanie:.1f} µs/wiersz ({ponownePrzetwarzanie / jednoPrzejście:.1f}x)")
+    print(f"get_text bez normalizacji: {getText:.1f} µs/wiersz ({getText / jednoPrzejście:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+from pathlib import Path
+
+STRONY = Path(__file__).resolve().parent
+ADRESY = {
+    "plany": "https://plan.zse.bydgoszcz.pl/plany/",
+    "lista": "https://plan.zse.bydgoszcz.pl/lista.html",
+    "zastepstwa": "https://zastepstwa.zse.bydgoszcz.pl"
+}
+
+def zwróćŚcieżkę(url: str) -> tuple[Path, str]:
+    """
+    Zwraca ścieżkę zapisanej strony odpowiadającej adresowi strony internetowej oraz jej kodowanie.
+
+    Args:
+        url (str): Adres strony internetowej.
+
+    Returns:
+        tuple[Path, str]: Ścieżka pliku zapisanej strony oraz jej kodowanie.
+    """
+
+    if url == ADRESY["lista"]:
+        return STRONY / "lista.html", "utf-8"
+
+    if url.startswith(ADRESY["plany"]):
+        return STRONY / "plany" / url.rsplit("/", 1)[-1], "utf-8"
+
+    return STRONY / "zastepstwa" / "index.html", "iso-8859-2"
@@ -17,11 +17,18 @@ from contextlib import asynccontextmanager
 # Wewnętrzne importy
 from src.assets.ascii import ascii
 from src.classes.atom import atom
+from src.classes.collector import odśmiecanie
+from src.classes.crawler import odświeżanie
+from src.classes.epoch import epoka
+from src.classes.parser import analizator
+from src.classes.prefetcher import przewidywanie
+from src.classes.snapshots import wersje
 from src.handlers.configuration import konfiguracja
 from src.handlers.logging import logowanie
 from src.api.substitutions.router import router as routerZastępstw
 from src.api.lists.router import router as routerList
 from src.api.timetables.router import router as routerPlanówLekcji
+from src.api.status.router import router as routerStanu
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
@@ -30,6 +37,12 @@ async def lifespan(_: FastAPI):
         logowanie.info(ascii)
         await atom.start()
         uruchomiony = True
+        wersje.start()
+        analizator.start()
+        await epoka.start(atom)
+        await odświeżanie.start(atom)
+        await przewidywanie.start()
+        odśmiecanie.start()
         logowanie.info(
             "Atom API zostało poprawnie uruchomione. Enjoy!"
         )
@@ -42,6 +55,12 @@ async def lifespan(_: FastAPI):
         raise
     finally:
         if uruchomiony:
+            odśmiecanie.close()
+            await przewidywanie.close()
+            await odświeżanie.close()
+            await epoka.close()
+            analizator.close()
+            wersje.close()
             await atom.close()
 
 description = """
@@ -65,3 +84,4 @@ app = FastAPI(
 app.include_router(routerList)
 app.include_router(routerPlanówLekcji)
 app.include_router(routerZastępstw)
+app.include_router(routerStanu)
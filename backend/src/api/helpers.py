@@ -10,6 +10,9 @@
 #
 #
 
+# Standardowe biblioteki
+from typing import Any
+
 def zbudujPrzedmiotyDodatkowe(
     religia: bool | None,
     edukacjaZdrowotna: bool | None
@@ -37,3 +40,30 @@ def zbudujPrzedmiotyDodatkowe(
         przedmiotyDodatkowe["zdrowotna"] = edukacjaZdrowotna
 
     return przedmiotyDodatkowe
+
+
+def zbudujParametryZastępstw(
+    identyfikator: str | None,
+    grupy: list[str] | None,
+    religia: bool | None,
+    edukacjaZdrowotna: bool | None
+) -> dict[str, Any]:
+    """
+    Buduje słownik parametrów zapytania o zastępstwa, używany do rejestrowania i przewidywania zapytań.
+
+    Args:
+        identyfikator (str | None): Identyfikator oddziału lub nauczyciela, np. o17, n78.
+        grupy (list[str] | None): Lista oznaczeń określających grupę przedmiotów.
+        religia (bool | None): Flaga informująca, czy uwzględniać lekcje religii w planie lekcji.
+        edukacjaZdrowotna (bool | None): Flaga informująca, czy uwzględniać lekcje edukacji zdrowotnej w planie lekcji.
+
+    Returns:
+        dict[str, Any]: Słownik parametrów zapytania z uporządkowaną listą grup.
+    """
+
+    return {
+        "identyfikator": identyfikator,
+        "grupy": sorted(grupy) if grupy else None,
+        "religia": religia,
+        "edukacjaZdrowotna": edukacjaZdrowotna
+    }
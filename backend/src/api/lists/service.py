@@ -18,7 +18,6 @@ from src.api.lists.exceptions import (
 )
 from src.api.lists.schemas import Listy
 from src.classes.atom import atom
-from src.classes.semaphore import semafor
 from src.handlers.configuration import konfiguracja
 from src.handlers.lists.parser import wyodrębnijListy
 from src.handlers.logging import logowanie
@@ -57,8 +56,7 @@ async def pobierzListy(
             )
             raise BrakWymaganychDanych
 
-        async with semafor:
-            zawartośćStrony = await pobierzZawartośćStrony(atom.sesja, url, kodowanie)
+        zawartośćStrony = await pobierzZawartośćStrony(atom, url, kodowanie)
 
         suroweListy = wyodrębnijListy(zawartośćStrony, url)
         listy = Listy(**suroweListy)
@@ -0,0 +1,14 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+class BłądWewnętrzny(Exception):
+    pass
@@ -0,0 +1,44 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Zewnętrzne biblioteki
+from fastapi import (
+    APIRouter,
+    HTTPException
+)
+
+# Wewnętrzne importy
+from src.api.status.exceptions import BłądWewnętrzny
+from src.api.status.schemas import Stan
+from src.api.status.service import pobierzStan
+
+router = APIRouter(
+    prefix="/stan",
+    tags=["Stan"],
+)
+
+@router.get(
+        "",
+        response_model=Stan,
+        responses={
+            500: {"description": "Wystąpił nieoczekiwany błąd po stronie serwera."}
+        },
+        summary="Pobiera statystyki działania serwera.",
+        description="Pobiera bieżące statystyki działania serwera, w tym liczniki trafień, chybień i usunięć pamięci podręcznej pobranych stron liczniki scalonych zapytań oraz czas trwania odświeżania w tle i wiek odświeżonych stron."
+)
+async def stan() -> Stan:
+    try:
+        return await pobierzStan()
+    except BłądWewnętrzny:
+        raise HTTPException(500, "Wystąpił błąd podczas zbierania statystyk.")
+    except Exception:
+        raise HTTPException(500, "Wystąpił nieoczekiwany błąd po stronie serwera.")
@@ -0,0 +1,128 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+from pydantic import BaseModel
+
+class Pamiec(BaseModel):
+    wpisy: int
+    rozmiar: int
+    limit: int
+    trafienia: int
+    nieaktualne: int
+    chybienia: int
+    usuniecia: int
+
+
+class Scalanie(BaseModel):
+    wToku: int
+    wykonane: int
+    scalone: int
+
+
+class Odswiezanie(BaseModel):
+    aktywne: bool
+    przejscia: int
+    restarty: int
+    czasTrwania: float | None
+    zakonczono: str | None
+    strony: dict[str, float]
+
+
+class Ograniczenie(BaseModel):
+    limit: int
+    wToku: int
+    kolejka: int
+    zapytania: int
+    bledy: int
+    najkrotszyCzas: float | None
+
+
+class Bezpiecznik(BaseModel):
+    stan: str
+    bledy: int
+    otwarcia: int
+    odrzucone: int
+
+
+class Dublowanie(BaseModel):
+    zapytania: int
+    dublowane: int
+    wygrane: int
+    budzet: float
+
+
+class Epoka(BaseModel):
+    numer: int
+    zmiany: int
+    skrot: str | None
+    sprawdzono: str | None
+    zmieniono: str | None
+
+
+class Harmonogram(BaseModel):
+    ttl: float
+    strony: int
+    zmiany: int
+    mnoznik: float
+
+
+class Przewidywanie(BaseModel):
+    wykonane: int
+    nieudane: int
+    pominiete: int
+    najczestsze: dict[str, int]
+
+
+class Przetwarzanie(BaseModel):
+    silnik: str
+    przetworzone: int
+    strumieniowo: int
+    filtrowane: int
+    przerwane: int
+    pominieteBajty: int
+    niezmienione: int
+    watki: int
+    wTle: int
+
+
+class Zapamietywanie(BaseModel):
+    dokumenty: int
+    trafienia: int
+    chybienia: int
+    fragmenty: int
+    trafieniaFragmentow: int
+    chybieniaFragmentow: int
+
+
+class Odsmiecanie(BaseModel):
+    progi: list[int]
+    przebiegi: list[int]
+    zebrane: list[int]
+    zamrozone: int
+    rss: int | None
+    szczyt: int | None
+
+
+class Stan(BaseModel):
+    pamiec: Pamiec
+    scalanie: Scalanie
+    odswiezanie: Odswiezanie
+    ograniczenia: dict[str, Ograniczenie]
+    bezpieczniki: dict[str, Bezpiecznik]
+    dublowanie: Dublowanie
+    epoka: Epoka
+    harmonogram: dict[str, Harmonogram]
+    przewidywanie: Przewidywanie
+    przetwarzanie: Przetwarzanie
+    zapamietywanie: Zapamietywanie
+    odsmiecanie: Odsmiecanie
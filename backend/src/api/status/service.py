@@ -0,0 +1,60 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Wewnętrzne importy
+from src.api.status.exceptions import BłądWewnętrzny
+from src.api.status.schemas import Stan
+from src.classes.breaker import bezpiecznik
+from src.classes.cache import pamięć
+from src.classes.collector import odśmiecanie
+from src.classes.crawler import odświeżanie
+from src.classes.epoch import epoka
+from src.classes.flight import scalanie
+from src.classes.hedging import dublowanie
+from src.classes.memo import zapamiętywanie
+from src.classes.parser import analizator
+from src.classes.prefetcher import przewidywanie
+from src.classes.scheduler import harmonogram
+from src.classes.semaphore import semafor
+from src.handlers.logging import logowanie
+
+async def pobierzStan() -> Stan:
+    """
+    Pobiera bieżące statystyki działania Atom API.
+
+    Returns:
+        Stan: Słownik zawierający statystyki pamięci podręcznej, scalania zapytań, odświeżania w tle, ograniczeń zapytań do serwerów, ich bezpieczników, dublowania zapytań, epoki planu lekcji, harmonogramu odświeżania, przewidywania zapytań, przetwarzania stron, zapamiętywania wyników ich przetwarzania oraz odśmiecania i pamięci procesu.
+
+    Raises:
+        BłądWewnętrzny: Gdy wystąpi nieoczekiwany błąd przetwarzania.
+    """
+
+    try:
+        return Stan(
+            pamiec=pamięć.zwróćStatystyki(),
+            scalanie=scalanie.zwróćStatystyki(),
+            odswiezanie=odświeżanie.zwróćStatystyki(),
+            ograniczenia=semafor.zwróćStatystyki(),
+            bezpieczniki=bezpiecznik.zwróćStatystyki(),
+            dublowanie=dublowanie.zwróćStatystyki(),
+            epoka=epoka.zwróćStatystyki(),
+            harmonogram=harmonogram.zwróćStatystyki(),
+            przewidywanie=przewidywanie.zwróćStatystyki(),
+            przetwarzanie=analizator.zwróćStatystyki(),
+            zapamietywanie=zapamiętywanie.zwróćStatystyki(),
+            odsmiecanie=odśmiecanie.zwróćStatystyki()
+        )
+    except Exception as e:
+        logowanie.exception(
+            f"Wystąpił błąd podczas zbierania statystyk. Więcej informacji: {e}"
+        )
+        raise BłądWewnętrzny from e
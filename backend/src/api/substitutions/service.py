@@ -11,7 +11,10 @@
 #
 
 # Wewnętrzne importy
-from src.api.helpers import zbudujPrzedmiotyDodatkowe
+from src.api.helpers import (
+    zbudujParametryZastępstw,
+    zbudujPrzedmiotyDodatkowe
+)
 from src.api.substitutions.exceptions import (
     BłądWewnętrzny,
     BrakWymaganychDanych,
@@ -20,7 +23,7 @@ from src.api.substitutions.exceptions import (
 )
 from src.api.substitutions.schemas import Zastepstwa
 from src.classes.atom import atom
-from src.classes.semaphore import semafor
+from src.classes.prefetcher import przewidywanie
 from src.handlers.configuration import konfiguracja
 from src.handlers.lists.parser import wyodrębnijListy
 from src.handlers.logging import logowanie
@@ -67,8 +70,7 @@ async def pobierzZastępstwa(
             )
             raise BrakWymaganychDanych
 
-        async with semafor:
-            zawartośćStronyListy = await pobierzZawartośćStrony(atom.sesja, urlListy, kodowanieListy)
+        zawartośćStronyListy = await pobierzZawartośćStrony(atom, urlListy, kodowanieListy)
 
         przedmiotyDodatkowe = zbudujPrzedmiotyDodatkowe(religia, edukacjaZdrowotna)
         listy = wyodrębnijListy(zawartośćStronyListy, urlListy)
@@ -104,10 +106,10 @@ async def pobierzZastępstwa(
             if sekcja == "nauczyciele" and not wybranyNauczyciel:
                 raise NieprawidłowyIdentyfikator
 
-        async with semafor:
-            zawartośćStronyZastępstw = await pobierzZawartośćStrony(atom.sesja, urlZastępstw, kodowanieZastępstw)
+        przewidywanie.odnotuj("zastepstwa", zbudujParametryZastępstw(identyfikator, grupy, religia, edukacjaZdrowotna))
+        zawartośćStronyZastępstw = await pobierzZawartośćStrony(atom, urlZastępstw, kodowanieZastępstw)
 
-        return await wyodrębnijZastępstwa(atom.sesja, zawartośćStronyZastępstw, listaOddziałów, listaNauczycieli, wybranyOddział, wybranyNauczyciel, grupy, przedmiotyDodatkowe)
+        return await wyodrębnijZastępstwa(atom, zawartośćStronyZastępstw, listaOddziałów, listaNauczycieli, wybranyOddział, wybranyNauczyciel, grupy, przedmiotyDodatkowe)
     except NieprawidłowyIdentyfikator:
         raise
     except BrakWymaganychDanych:
@@ -122,3 +124,5 @@ async def pobierzZastępstwa(
             f"Wystąpił błąd podczas przetwarzania danych. Więcej informacji: {e}"
         )
         raise BłądWewnętrzny from e
+
+przewidywanie.zarejestrujObsługę("zastepstwa", pobierzZastępstwa)
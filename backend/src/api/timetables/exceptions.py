@@ -14,10 +14,18 @@ class BłądWewnętrzny(Exception):
     pass
 
 
+class BrakWersji(Exception):
+    pass
+
+
 class BrakWymaganychDanych(Exception):
     pass
 
 
+class NieprawidłowyDzień(Exception):
+    pass
+
+
 class NieprawidłowyIdentyfikator(Exception):
     pass
 
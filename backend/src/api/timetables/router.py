@@ -20,12 +20,22 @@ from fastapi import (
 # Wewnętrzne importy
 from src.api.timetables.exceptions import (
     BłądWewnętrzny,
+    BrakWersji,
     BrakWymaganychDanych,
+    NieprawidłowyDzień,
     NieprawidłowyIdentyfikator,
     ŹródłoNiedostępne
 )
-from src.api.timetables.schemas import PlanLekcji
-from src.api.timetables.service import pobierzPlanLekcji
+from src.api.timetables.schemas import (
+    PlanLekcji,
+    RoznicePlanu,
+    Wersja
+)
+from src.api.timetables.service import (
+    pobierzPlanLekcji,
+    pobierzWersjePlanuLekcji,
+    porównajWersjePlanuLekcji
+)
 
 router = APIRouter(
     prefix="/planlekcji",
@@ -36,7 +46,7 @@ router = APIRouter(
         "",
         response_model=PlanLekcji,
         responses={
-            400: {"description": "Otrzymano nieprawidłowy identyfikator."},
+            400: {"description": "Otrzymano nieprawidłowy identyfikator lub dzień tygodnia."},
             500: {"description": "Wystąpił nieoczekiwany błąd po stronie serwera."},
             502: {"description": "Wystąpił błąd podczas przetwarzania danych."},
             503: {"description": "Przekroczono czas oczekiwania na połączenie."}
@@ -49,10 +59,13 @@ async def planlekcji(
     grupy: list[str] | None = Query(None, description="Lista oznaczeń określających grupę przedmiotów."),
     skrocone: str | None = Query(None, description="Dzień tygodnia, dla którego obowiązuje skrócony rozkład zajęć."),
     religia: bool | None = Query(None, description="Określa, czy uwzględniać lekcje religii w planie lekcji."),
-    edukacjaZdrowotna: bool | None = Query(None, description="Określa, czy uwzględniać lekcje edukacji zdrowotnej w planie lekcji.")
+    edukacjaZdrowotna: bool | None = Query(None, description="Określa, czy uwzględniać lekcje edukacji zdrowotnej w planie lekcji."),
+    dzien: str | None = Query(None, description="Dzień tygodnia, do którego ma zostać ograniczony plan lekcji, np. Poniedziałek. Wielkość liter nie ma znaczenia.")
 ) -> PlanLekcji:
     try:
-        return await pobierzPlanLekcji(identyfikator, grupy, skrocone, religia, edukacjaZdrowotna)
+        return await pobierzPlanLekcji(identyfikator, grupy, skrocone, religia, edukacjaZdrowotna, dzien)
+    except NieprawidłowyDzień:
+        raise HTTPException(400, "Otrzymano nieprawidłowy dzień tygodnia.")
     except NieprawidłowyIdentyfikator:
         raise HTTPException(400, "Otrzymano nieprawidłowy identyfikator.")
     except BrakWymaganychDanych:
@@ -63,3 +76,59 @@ async def planlekcji(
         raise HTTPException(503, "Przekroczono czas oczekiwania na połączenie.")
     except Exception:
         raise HTTPException(500, "Wystąpił nieoczekiwany błąd po stronie serwera.")
+
+
+@router.get(
+        "/wersje",
+        response_model=list[Wersja],
+        responses={
+            400: {"description": "Otrzymano nieprawidłowy identyfikator."},
+            404: {"description": "Nie zapisano żadnej wersji planu lekcji."},
+            500: {"description": "Wystąpił nieoczekiwany błąd po stronie serwera."},
+            502: {"description": "Wystąpił błąd podczas przetwarzania danych."}
+        },
+        summary="Pobiera listę zapisanych wersji planu lekcji.",
+        description="Pobiera listę wszystkich zapisanych, różniących się od siebie wersji planu lekcji wraz z datami ich wygenerowania i obowiązywania."
+)
+async def wersjeplanulekcji(
+    identyfikator: str = Query(..., description="Identyfikator oddziału, nauczyciela lub sali, np. o17, n78, s45.")
+) -> list[Wersja]:
+    try:
+        return await pobierzWersjePlanuLekcji(identyfikator)
+    except NieprawidłowyIdentyfikator:
+        raise HTTPException(400, "Otrzymano nieprawidłowy identyfikator.")
+    except BrakWersji:
+        raise HTTPException(404, "Nie zapisano żadnej wersji planu lekcji.")
+    except BłądWewnętrzny:
+        raise HTTPException(502, "Wystąpił błąd podczas przetwarzania danych.")
+    except Exception:
+        raise HTTPException(500, "Wystąpił nieoczekiwany błąd po stronie serwera.")
+
+
+@router.get(
+        "/roznice",
+        response_model=RoznicePlanu,
+        responses={
+            400: {"description": "Otrzymano nieprawidłowy identyfikator."},
+            404: {"description": "Nie znaleziono porównywanych wersji planu lekcji."},
+            500: {"description": "Wystąpił nieoczekiwany błąd po stronie serwera."},
+            502: {"description": "Wystąpił błąd podczas przetwarzania danych."}
+        },
+        summary="Pobiera różnice pomiędzy wersjami planu lekcji.",
+        description="Porównuje dwie zapisane wersje planu lekcji i zwraca lekcje dodane oraz usunięte w poszczególnych godzinach lekcyjnych. W przypadku braku numeru wersji porównywanej, porównywana jest najnowsza wersja."
+)
+async def roznice(
+    identyfikator: str = Query(..., description="Identyfikator oddziału, nauczyciela lub sali, np. o17, n78, s45."),
+    od: int = Query(..., description="Numer wersji bazowej."),
+    do: int | None = Query(None, description="Numer wersji porównywanej.")
+) -> RoznicePlanu:
+    try:
+        return await porównajWersjePlanuLekcji(identyfikator, od, do)
+    except NieprawidłowyIdentyfikator:
+        raise HTTPException(400, "Otrzymano nieprawidłowy identyfikator.")
+    except BrakWersji:
+        raise HTTPException(404, "Nie znaleziono porównywanych wersji planu lekcji.")
+    except BłądWewnętrzny:
+        raise HTTPException(502, "Wystąpił błąd podczas przetwarzania danych.")
+    except Exception:
+        raise HTTPException(500, "Wystąpił nieoczekiwany błąd po stronie serwera.")
@@ -56,3 +56,27 @@ class PlanLekcji(BaseModel):
     wygenerowano: str | None
     data: Data | None
     plan: PlanTygodniowy
+
+
+class Wersja(BaseModel):
+    numer: int
+    wygenerowano: str | None
+    obowiazuje: str | None
+    wygasa: str | None
+    zapisano: str
+
+
+class ZmianaPlanu(BaseModel):
+    dzien: str
+    numer: int
+    poczatek: str
+    koniec: str
+    dodane: list[Lekcja]
+    usuniete: list[Lekcja]
+
+
+class RoznicePlanu(BaseModel):
+    identyfikator: str
+    od: int
+    do: int
+    zmiany: list[ZmianaPlanu]
@@ -10,21 +10,39 @@
 #
 #
 
+# Standardowe biblioteki
+import asyncio
+
 # Wewnętrzne importy
-from src.api.helpers import zbudujPrzedmiotyDodatkowe
+from src.api.helpers import (
+    zbudujParametryZastępstw,
+    zbudujPrzedmiotyDodatkowe
+)
 from src.api.timetables.exceptions import (
     BłądWewnętrzny,
+    BrakWersji,
     BrakWymaganychDanych,
+    NieprawidłowyDzień,
     NieprawidłowyIdentyfikator,
     ŹródłoNiedostępne
 )
-from src.api.timetables.schemas import PlanLekcji
+from src.api.timetables.schemas import (
+    PlanLekcji,
+    RoznicePlanu,
+    Wersja
+)
 from src.classes.atom import atom
-from src.classes.semaphore import semafor
+from src.classes.cache import pamięć
+from src.classes.crawler import odświeżanie
+from src.classes.prefetcher import przewidywanie
+from src.classes.snapshots import wersje
 from src.handlers.configuration import konfiguracja
 from src.handlers.lists.parser import wyodrębnijListy
 from src.handlers.logging import logowanie
-from src.handlers.scraper import pobierzZawartośćStrony
+from src.handlers.scraper import (
+    odświeżZawartośćStrony,
+    pobierzZawartośćStrony
+)
 from src.handlers.timetables.parser import wyodrębnijPlanLekcji
 
 async def pobierzPlanLekcji(
@@ -32,10 +50,11 @@ async def pobierzPlanLekcji(
     grupy: list[str] | None,
     dzieńSkróconych: str | None,
     religia: bool | None,
-    edukacjaZdrowotna: bool | None
+    edukacjaZdrowotna: bool | None,
+    dzień: str | None
 ) -> PlanLekcji:
     """
-    Pobiera i przetwarza plan lekcji na podstawie przekazanych parametrów wejściowych.
+    Pobiera i przetwarza plan lekcji na podstawie przekazanych parametrów wejściowych. Niefiltrowane plany lekcji zapisywane są jako kolejne wersje po każdym ponownym pobraniu i przetworzeniu strony, a ostatnia zapisana wersja zwracana jest od razu po ponownym uruchomieniu Atom API oraz w przypadku niedostępności źródła. Plan lekcji ograniczony do jednego dnia tygodnia, którego nazwa porównywana jest z nagłówkami tabeli planu lekcji bez względu na wielkość liter, przetwarzany jest wyłącznie dla tego dnia i nie jest zapisywany jako wersja. Zapytanie jest rejestrowane na potrzeby przewidywania zapytań o zastępstwa tego samego oddziału lub nauczyciela.
 
     Args:
         identyfikator (str | None): Identyfikator oddziału, nauczyciela lub sali, np. o17, n78, s45.
@@ -43,6 +62,7 @@ async def pobierzPlanLekcji(
         dzieńSkróconych (str | None): Dzień tygodnia, dla którego obowiązuje skrócony rozkład zajęć.
         religia (bool | None): Flaga informująca, czy uwzględniać lekcje religii w planie lekcji.
         edukacjaZdrowotna (bool | None): Flaga informująca, czy uwzględniać lekcje edukacji zdrowotnej w planie lekcji.
+        dzień (str | None): Dzień tygodnia, do którego ma zostać ograniczony plan lekcji.
 
     Returns:
         PlanLekcji: Słownik zawierający ustrukturyzowany plan lekcji.
@@ -50,6 +70,7 @@ async def pobierzPlanLekcji(
     Raises:
         BłądWewnętrzny: Gdy wystąpi nieoczekiwany błąd przetwarzania.
         BrakWymaganychDanych: Gdy w pliku konfiguracyjnym nie znajdują się wymagane dane.
+        NieprawidłowyDzień: Gdy przekazany dzień tygodnia nie występuje w planie lekcji.
         NieprawidłowyIdentyfikator: Gdy przekazany identyfikator ma nieprawidłowy format lub nie istnieje.
         ŹródłoNiedostępne: Gdy wystąpi problem z pobraniem danych.
     """
@@ -72,23 +93,66 @@ async def pobierzPlanLekcji(
         if not identyfikator or len(identyfikator) < 2:
             raise NieprawidłowyIdentyfikator
 
+        przewidywanie.odnotuj(
+            "planlekcji",
+            {
+                "identyfikator": identyfikator,
+                "grupy": sorted(grupy) if grupy else None,
+                "dzieńSkróconych": dzieńSkróconych,
+                "religia": religia,
+                "edukacjaZdrowotna": edukacjaZdrowotna,
+                "dzień": dzień
+            },
+            [("zastepstwa", zbudujParametryZastępstw(identyfikator, grupy, religia, edukacjaZdrowotna))] if identyfikator[0].lower() in ("o", "n") else None
+        )
+
         urlPlanu = f"{katalogPlanów}{identyfikator}.html"
+        bezFiltrów = not grupy and dzieńSkróconych is None and religia is None and edukacjaZdrowotna is None and dzień is None
+
+        if bezFiltrów and pamięć.wpisy.get(urlPlanu) is None:
+            zapisanyPlan = await asyncio.to_thread(wersje.pobierz, identyfikator)
 
-        async with semafor:
-            zawartośćStronyListy = await pobierzZawartośćStrony(atom.sesja, urlListy, kodowanieListy)
+            if zapisanyPlan is not None:
+                pamięć.zaplanujOdświeżenie(urlPlanu, lambda: odświeżZawartośćStrony(atom, urlPlanu, kodowaniePlanów))
+                return zapisanyPlan
 
-        async with semafor:
-            zawartośćStronyPlanu = await pobierzZawartośćStrony(atom.sesja, urlPlanu, kodowaniePlanów)
+        zawartośćStronyListy = await pobierzZawartośćStrony(atom, urlListy, kodowanieListy)
+
+        zawartośćStronyPlanu = await pobierzZawartośćStrony(atom, urlPlanu, kodowaniePlanów)
 
         przedmiotyDodatkowe = zbudujPrzedmiotyDodatkowe(religia, edukacjaZdrowotna)
         listy = wyodrębnijListy(zawartośćStronyListy, urlListy)
         listaOddziałów = listy.get("oddzialy", {})
 
-        return await wyodrębnijPlanLekcji(atom.sesja, zawartośćStronyPlanu, listaOddziałów, dzieńSkróconych, grupy, przedmiotyDodatkowe, urlPlanu)
+        planLekcji = await wyodrębnijPlanLekcji(atom, zawartośćStronyPlanu, listaOddziałów, dzieńSkróconych, grupy, przedmiotyDodatkowe, urlPlanu, [dzień] if dzień is not None else None)
+
+        if bezFiltrów:
+            if planLekcji is not None:
+                await odświeżanie.zapiszPlan(urlPlanu, zawartośćStronyPlanu, planLekcji)
+            else:
+                zapisanyPlan = await asyncio.to_thread(wersje.pobierz, identyfikator)
+
+                if zapisanyPlan is not None:
+                    logowanie.warning(
+                        f"Zwracanie ostatniej zapisanej wersji planu lekcji ({identyfikator})."
+                    )
+                    return zapisanyPlan
+
+        if planLekcji is None:
+            raise ŹródłoNiedostępne
+
+        if dzień is not None and not planLekcji["plan"]:
+            raise NieprawidłowyDzień
+
+        return planLekcji
+    except NieprawidłowyDzień:
+        raise
     except NieprawidłowyIdentyfikator:
         raise
     except BrakWymaganychDanych:
         raise
+    except ŹródłoNiedostępne:
+        raise
     except TimeoutError as e:
         logowanie.exception(
             f"Przekroczono czas oczekiwania na połączenie. Więcej informacji: {e}"
@@ -99,3 +163,83 @@ async def pobierzPlanLekcji(
             f"Wystąpił błąd podczas przetwarzania danych. Więcej informacji: {e}"
         )
         raise BłądWewnętrzny from e
+
+
+async def pobierzWersjePlanuLekcji(identyfikator: str) -> list[Wersja]:
+    """
+    Pobiera opisy zapisanych wersji planu lekcji.
+
+    Args:
+        identyfikator (str): Identyfikator oddziału, nauczyciela lub sali, np. o17, n78, s45.
+
+    Returns:
+        list[Wersja]: Lista opisów zapisanych wersji planu lekcji, od najstarszej do najnowszej.
+
+    Raises:
+        BłądWewnętrzny: Gdy wystąpi nieoczekiwany błąd przetwarzania.
+        BrakWersji: Gdy nie zapisano żadnej wersji planu lekcji.
+        NieprawidłowyIdentyfikator: Gdy przekazany identyfikator ma nieprawidłowy format.
+    """
+
+    try:
+        if not identyfikator or len(identyfikator) < 2:
+            raise NieprawidłowyIdentyfikator
+
+        opisy = await asyncio.to_thread(wersje.zwróćWersje, identyfikator)
+        if not opisy:
+            raise BrakWersji
+
+        return [Wersja(**opis) for opis in opisy]
+    except NieprawidłowyIdentyfikator:
+        raise
+    except BrakWersji:
+        raise
+    except Exception as e:
+        logowanie.exception(
+            f"Wystąpił błąd podczas pobierania wersji planu lekcji. Więcej informacji: {e}"
+        )
+        raise BłądWewnętrzny from e
+
+
+async def porównajWersjePlanuLekcji(
+    identyfikator: str,
+    od: int,
+    do: int | None
+) -> RoznicePlanu:
+    """
+    Porównuje dwie zapisane wersje planu lekcji i zwraca różnice na poziomie pojedynczych lekcji.
+
+    Args:
+        identyfikator (str): Identyfikator oddziału, nauczyciela lub sali, np. o17, n78, s45.
+        od (int): Numer wersji bazowej.
+        do (int | None): Numer wersji porównywanej. W przypadku jego braku porównywana jest najnowsza wersja.
+
+    Returns:
+        RoznicePlanu: Słownik zawierający zmiany lekcji pomiędzy wersjami.
+
+    Raises:
+        BłądWewnętrzny: Gdy wystąpi nieoczekiwany błąd przetwarzania.
+        BrakWersji: Gdy którakolwiek z porównywanych wersji nie istnieje.
+        NieprawidłowyIdentyfikator: Gdy przekazany identyfikator ma nieprawidłowy format.
+    """
+
+    try:
+        if not identyfikator or len(identyfikator) < 2:
+            raise NieprawidłowyIdentyfikator
+
+        różnice = await asyncio.to_thread(wersje.porównaj, identyfikator, od, do)
+        if różnice is None:
+            raise BrakWersji
+
+        return RoznicePlanu(**różnice)
+    except NieprawidłowyIdentyfikator:
+        raise
+    except BrakWersji:
+        raise
+    except Exception as e:
+        logowanie.exception(
+            f"Wystąpił błąd podczas porównywania wersji planu lekcji. Więcej informacji: {e}"
+        )
+        raise BłądWewnętrzny from e
+
+przewidywanie.zarejestrujObsługę("planlekcji", pobierzPlanLekcji)
@@ -19,50 +19,88 @@ from src.handlers.logging import logowanie
 
 class Atom:
     """
-    Odpowiada za zarządzanie wspólnymi zasobami Atom API.
+    Odpowiada za zarządzanie wspólnymi zasobami Atom API. Każde źródło danych korzysta z osobnej sesji HTTP z własną pulą połączeń i czasami oczekiwania, dzięki czemu spowolnienie jednego serwera nie blokuje zapytań do pozostałych.
     """
 
     def __init__(self) -> None:
         """
-        Inicjalizuje obiekt, ustawiając początkowy stan bez aktywnej sesji HTTP.
+        Inicjalizuje obiekt, ustawiając początkowy stan bez aktywnych sesji HTTP.
         """
 
-        self.sesja: aiohttp.ClientSession | None = None
+        self.sesje: dict[str, aiohttp.ClientSession] = {}
 
     async def start(self) -> None:
         """
-        Tworzy i konfiguruje sesję HTTP wywoływaną przy uruchomieniu Atom API.
+        Tworzy i konfiguruje sesje HTTP poszczególnych źródeł danych wywoływane przy uruchomieniu Atom API.
         """
 
-        if self.sesja and not self.sesja.closed:
+        if self.sesje:
             return
 
         try:
             wersja = konfiguracja.get("wersja", "Brak danych")
-            self.sesja = aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(limit=10, limit_per_host=5, ttl_dns_cache=300),
-                timeout=aiohttp.ClientTimeout(total=10),
-                headers={"User-Agent": f"Atom API/{wersja} (https://github.com/kacpergorka/atom)"}
-            )
+
+            for źródło in ("plany", "lista", "zastepstwa"):
+                ustawienia = konfiguracja.get(źródło, {}).get("sesja", {})
+                połączenia = int(ustawienia.get("polaczenia", 10))
+
+                self.sesje[źródło] = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=połączenia, limit_per_host=połączenia, ttl_dns_cache=300),
+                    timeout=aiohttp.ClientTimeout(
+                        total=ustawienia.get("calkowity", 10),
+                        connect=ustawienia.get("polaczenie", 3),
+                        sock_read=ustawienia.get("odczyt", 8)
+                    ),
+                    headers={"User-Agent": f"Atom API/{wersja} (https://github.com/kacpergorka/atom)"}
+                )
         except Exception as e:
             logowanie.exception(
                 f"Nie udało się utworzyć sesji HTTP. Więcej informacji: {e}"
             )
+            await self.close()
             raise
 
+    def zwróćSesję(self, url: str) -> aiohttp.ClientSession:
+        """
+        Zwraca sesję HTTP źródła danych, z którego pochodzi strona internetowa. Strony spoza zdefiniowanych źródeł danych pobierane są w sesji planów lekcji.
+
+        Args:
+            url (str): Adres strony internetowej na serwerze głównym.
+
+        Returns:
+            aiohttp.ClientSession: Sesja HTTP źródła danych.
+
+        Raises:
+            RuntimeError: Gdy sesje HTTP nie zostały utworzone.
+        """
+
+        if not self.sesje:
+            raise RuntimeError("Sesje HTTP nie zostały utworzone.")
+
+        for źródło in ("lista", "plany", "zastepstwa"):
+            adres = konfiguracja.get(źródło, {}).get("url")
+
+            if adres and url.startswith(adres):
+                return self.sesje[źródło]
+
+        return self.sesje["plany"]
+
     async def close(self) -> None:
         """
-        Bezpiecznie zamyka aktywną sesję HTTP utworzoną przy uruchomieniu Atom API.
+        Bezpiecznie zamyka aktywne sesje HTTP utworzone przy uruchomieniu Atom API.
         """
 
-        if self.sesja and not self.sesja.closed:
+        for źródło, sesja in self.sesje.items():
+            if sesja.closed:
+                continue
+
             try:
-                await self.sesja.close()
+                await sesja.close()
             except Exception as e:
                 logowanie.exception(
-                    f"Wystąpił błąd podczas zamykania sesji HTTP. Więcej informacji: {e}"
+                    f"Wystąpił błąd podczas zamykania sesji HTTP ({źródło}). Więcej informacji: {e}"
                 )
-            finally:
-                self.sesja = None
+
+        self.sesje = {}
 
 atom = Atom()
@@ -0,0 +1,152 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import time
+from urllib.parse import urlparse
+
+# Wewnętrzne importy
+from src.classes.types import StatystykiBezpiecznika
+from src.handlers.configuration import konfiguracja
+from src.handlers.logging import logowanie
+
+class Obwód:
+    """
+    Przechowuje stan bezpiecznika pojedynczego serwera.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt w stanie zamkniętym, bez zarejestrowanych błędów.
+        """
+
+        self.stan: str = "zamkniety"
+        self.błędy: int = 0
+        self.otwarto: float = 0.0
+        self.otwarcia: int = 0
+        self.odrzucone: int = 0
+
+
+class Breaker:
+    """
+    Bezpiecznik odcinający zapytania do serwera, który zwrócił zbyt wiele błędów z rzędu. Po upływie przerwy przepuszczane jest pojedyncze zapytanie próbne, którego wynik decyduje o ponownym zamknięciu lub otwarciu bezpiecznika.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając początkowy stan bez obserwowanych serwerów.
+        """
+
+        self.obwody: dict[str, Obwód] = {}
+
+    def zwróćObwód(self, url: str) -> Obwód:
+        """
+        Zwraca stan bezpiecznika serwera, do którego kierowane jest zapytanie.
+
+        Args:
+            url (str): Adres strony internetowej.
+
+        Returns:
+            Obwód: Stan bezpiecznika serwera.
+        """
+
+        host = urlparse(url).netloc
+
+        if host not in self.obwody:
+            self.obwody[host] = Obwód()
+
+        return self.obwody[host]
+
+    def sprawdź(self, url: str) -> bool:
+        """
+        Sprawdza, czy zapytanie do serwera może zostać wykonane. Po upływie przerwy otwarty bezpiecznik przechodzi w stan półotwarty i przepuszcza jedno zapytanie próbne, a kolejne dopiero po upływie następnej przerwy.
+
+        Args:
+            url (str): Adres strony internetowej.
+
+        Returns:
+            bool: Flaga informująca, czy zapytanie może zostać wykonane.
+        """
+
+        obwód = self.zwróćObwód(url)
+
+        if obwód.stan == "zamkniety":
+            return True
+
+        przerwa = float(konfiguracja.get("bezpiecznik", {}).get("przerwa", 30))
+        teraz = time.monotonic()
+
+        if teraz - obwód.otwarto >= przerwa:
+            obwód.stan = "polotwarty"
+            obwód.otwarto = teraz
+            return True
+
+        obwód.odrzucone += 1
+        return False
+
+    def zgłośSukces(self, url: str) -> None:
+        """
+        Rejestruje poprawną odpowiedź serwera, zamykając jego bezpiecznik.
+
+        Args:
+            url (str): Adres strony internetowej.
+        """
+
+        obwód = self.zwróćObwód(url)
+
+        if obwód.stan != "zamkniety":
+            logowanie.info(
+                f"Serwer ponownie odpowiada. Zamykanie bezpiecznika ({urlparse(url).netloc})."
+            )
+
+        obwód.stan = "zamkniety"
+        obwód.błędy = 0
+
+    def zgłośBłąd(self, url: str) -> None:
+        """
+        Rejestruje błąd serwera, otwierając jego bezpiecznik po przekroczeniu progu kolejnych błędów lub po nieudanym zapytaniu próbnym.
+
+        Args:
+            url (str): Adres strony internetowej.
+        """
+
+        obwód = self.zwróćObwód(url)
+        obwód.błędy += 1
+        próg = int(konfiguracja.get("bezpiecznik", {}).get("prog", 5))
+
+        if obwód.stan == "polotwarty" or (obwód.stan == "zamkniety" and obwód.błędy >= próg):
+            logowanie.warning(
+                f"Serwer nie odpowiada poprawnie. Otwieranie bezpiecznika ({urlparse(url).netloc})."
+            )
+            obwód.stan = "otwarty"
+            obwód.otwarto = time.monotonic()
+            obwód.otwarcia += 1
+
+    def zwróćStatystyki(self) -> dict[str, StatystykiBezpiecznika]:
+        """
+        Zwraca bieżący stan bezpieczników każdego serwera.
+
+        Returns:
+            dict[str, StatystykiBezpiecznika]: Słownik statystyk bezpieczników według nazwy serwera.
+        """
+
+        return {
+            host: {
+                "stan": obwód.stan,
+                "bledy": obwód.błędy,
+                "otwarcia": obwód.otwarcia,
+                "odrzucone": obwód.odrzucone
+            }
+            for host, obwód in self.obwody.items()
+        }
+
+bezpiecznik = Breaker()
@@ -0,0 +1,313 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+from collections import OrderedDict
+import time
+from typing import (
+    Awaitable,
+    Callable
+)
+
+# Wewnętrzne importy
+from src.classes.types import (
+    StatystykiPamięci,
+    WpisPamięci
+)
+from src.handlers.configuration import konfiguracja
+
+class Cache:
+    """
+    Przechowuje pobrane strony internetowe wraz z ich walidatorami HTTP (`ETag`, `Last-Modified`), ograniczając łączny rozmiar zapisanych stron i usuwając najdawniej używane wpisy. Limit z pliku konfiguracyjnego dotyczy szacowanej pamięci zajmowanej przez przetworzone drzewa dokumentów i zapamiętane wyniki ich przetwarzania, wyznaczanej jako rozmiar treści strony pomnożony przez mnożnik z pliku konfiguracyjnego. Strony planów lekcji przypisywane są do bieżącej epoki planu lekcji i po jej zmianie przestają być aktualne.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając początkowy stan bez zapisanych stron.
+        """
+
+        self.wpisy: OrderedDict[str, WpisPamięci] = OrderedDict()
+        self.rozmiar: int = 0
+        self.limit: int = int(konfiguracja.get("pamiec", {}).get("limit", 0))
+        self.mnożnik: float = float(konfiguracja.get("pamiec", {}).get("mnoznik", 1))
+        self.epoka: int = 0
+        self.odświeżane: set[str] = set()
+        self.zadania: set[asyncio.Task] = set()
+        self.statystyki: dict[str, int] = {
+            "trafienia": 0,
+            "nieaktualne": 0,
+            "chybienia": 0,
+            "usuniecia": 0
+        }
+
+    def zwróćŹródło(self, url: str) -> str | None:
+        """
+        Ustala, z którego źródła danych zdefiniowanego w pliku konfiguracyjnym pochodzi strona internetowa.
+
+        Args:
+            url (str): Adres strony internetowej.
+
+        Returns:
+            str | None: Nazwa źródła danych (`lista`, `plany` lub `zastepstwa`), jeśli udało się je ustalić.
+        """
+
+        for źródło in ("lista", "plany", "zastepstwa"):
+            adres = konfiguracja.get(źródło, {}).get("url")
+
+            if adres and url.startswith(adres):
+                return źródło
+
+        return None
+
+    def zwróćWiek(
+        self,
+        wpis: WpisPamięci,
+        klucz: str | None = None
+    ) -> tuple[float, float]:
+        """
+        Zwraca wiek wpisu oraz dopuszczalny czas jego wykorzystania, wynikający z czasu świeżości ustalonego podczas pobrania strony i konfiguracji źródła danych.
+
+        Args:
+            wpis (WpisPamięci): Wpis strony internetowej.
+            klucz (str | None): Klucz konfiguracji źródła danych określający dodatkowy czas ponad czas świeżości (`nieaktualne` lub `awaryjne`).
+
+        Returns:
+            tuple[float, float]: Krotka wieku wpisu oraz dopuszczalnego czasu jego wykorzystania (w sekundach).
+        """
+
+        ustawienia = konfiguracja.get(wpis["źródło"], {}) if wpis["źródło"] else {}
+        wiek = time.monotonic() - wpis["pobrano"]
+        czas = wpis["ttl"]
+
+        if klucz:
+            czas += int(ustawienia.get(klucz, 0))
+
+        return wiek, czas
+
+    def sprawdźŚwieżość(self, wpis: WpisPamięci) -> bool:
+        """
+        Sprawdza, czy wpis może zostać zwrócony bez ponownego odpytywania serwera.
+
+        Args:
+            wpis (WpisPamięci): Wpis strony internetowej.
+
+        Returns:
+            bool: True, jeśli wpis jest świeży, False w przeciwnym razie.
+        """
+
+        if not self.sprawdźEpokę(wpis):
+            return False
+
+        wiek, czas = self.zwróćWiek(wpis)
+        return wiek < czas
+
+    def sprawdźPrzydatność(
+        self,
+        wpis: WpisPamięci,
+        awaryjnie: bool = False
+    ) -> bool:
+        """
+        Sprawdza, czy nieaktualny wpis może zostać zwrócony podczas odświeżania strony w tle lub, w trybie awaryjnym, podczas niedostępności serwera.
+
+        Args:
+            wpis (WpisPamięci): Wpis strony internetowej.
+            awaryjnie (bool): Flaga informująca, czy serwer jest niedostępny.
+
+        Returns:
+            bool: True, jeśli wpis mieści się w dopuszczalnym czasie nieaktualności, False w przeciwnym razie.
+        """
+
+        if not awaryjnie and not self.sprawdźEpokę(wpis):
+            return False
+
+        wiek, czas = self.zwróćWiek(wpis, "awaryjne" if awaryjnie else "nieaktualne")
+        return wiek < czas
+
+    def sprawdźEpokę(self, wpis: WpisPamięci) -> bool:
+        """
+        Sprawdza, czy wpis strony planu lekcji pochodzi z bieżącej epoki planu lekcji. Wpisy pozostałych źródeł danych nie są przypisywane do epok.
+
+        Args:
+            wpis (WpisPamięci): Wpis strony internetowej.
+
+        Returns:
+            bool: True, jeśli wpis pochodzi z bieżącej epoki lub nie jest do niej przypisywany, False w przeciwnym razie.
+        """
+
+        return wpis["źródło"] != "plany" or wpis["epoka"] == self.epoka
+
+    def rozpocznijEpokę(self) -> None:
+        """
+        Rozpoczyna nową epokę planu lekcji, przez co wszystkie zapisane strony planów lekcji przestają być aktualne. Wpisy pozostają w pamięci jako awaryjne kopie, a ich walidatory HTTP pozwalają potwierdzić niezmienione strony zapytaniem warunkowym.
+        """
+
+        self.epoka += 1
+
+    def oszacujRozmiar(self, bajty: int) -> int:
+        """
+        Szacuje pamięć zajmowaną przez przetworzoną stronę internetową na podstawie rozmiaru jej treści.
+
+        Args:
+            bajty (int): Rozmiar treści strony internetowej (w bajtach).
+
+        Returns:
+            int: Szacowany rozmiar przetworzonej strony (w bajtach).
+        """
+
+        return int(bajty * self.mnożnik)
+
+    def pobierz(self, url: str) -> WpisPamięci | None:
+        """
+        Zwraca zapisany wpis strony internetowej, oznaczając go jako ostatnio używany.
+
+        Args:
+            url (str): Adres strony internetowej.
+
+        Returns:
+            WpisPamięci | None: Wpis strony internetowej, jeśli został wcześniej zapisany.
+        """
+
+        wpis = self.wpisy.get(url)
+
+        if wpis is None:
+            self.statystyki["chybienia"] += 1
+            return None
+
+        self.wpisy.move_to_end(url)
+
+        if self.sprawdźŚwieżość(wpis):
+            self.statystyki["trafienia"] += 1
+        elif self.sprawdźPrzydatność(wpis):
+            self.statystyki["nieaktualne"] += 1
+        else:
+            self.statystyki["chybienia"] += 1
+
+        return wpis
+
+    def zapisz(
+        self,
+        url: str,
+        wpis: WpisPamięci
+    ) -> None:
+        """
+        Zapisuje wpis strony internetowej i usuwa najdawniej używane wpisy, jeśli przekroczony zostanie limit rozmiaru.
+
+        Args:
+            url (str): Adres strony internetowej.
+            wpis (WpisPamięci): Wpis strony internetowej przeznaczony do zapisania.
+        """
+
+        poprzedni = self.wpisy.pop(url, None)
+        if poprzedni is not None:
+            self.rozmiar -= poprzedni["rozmiar"]
+
+        if self.limit and wpis["rozmiar"] > self.limit:
+            return
+
+        self.wpisy[url] = wpis
+        self.rozmiar += wpis["rozmiar"]
+
+        while self.limit and self.rozmiar > self.limit and self.wpisy:
+            _, usunięty = self.wpisy.popitem(last=False)
+            self.rozmiar -= usunięty["rozmiar"]
+            self.statystyki["usuniecia"] += 1
+
+    def odnów(
+        self,
+        url: str,
+        ttl: float
+    ) -> None:
+        """
+        Oznacza zapisany wpis jako świeży i należący do bieżącej epoki po potwierdzeniu jego aktualności przez serwer.
+
+        Args:
+            url (str): Adres strony internetowej.
+            ttl (float): Nowy czas świeżości wpisu (w sekundach).
+        """
+
+        wpis = self.wpisy.get(url)
+        if wpis is not None:
+            wpis["pobrano"] = time.monotonic()
+            wpis["ttl"] = ttl
+            wpis["epoka"] = self.epoka
+
+    def zwróćNagłówki(self, wpis: WpisPamięci | None) -> dict[str, str]:
+        """
+        Buduje nagłówki zapytania warunkowego dla wpisu strony internetowej, na podstawie którego zostanie obsłużona odpowiedź `304 Not Modified`.
+
+        Args:
+            wpis (WpisPamięci | None): Wpis strony internetowej, jeśli został wcześniej zapisany.
+
+        Returns:
+            dict[str, str]: Słownik nagłówków `If-None-Match` i/lub `If-Modified-Since`.
+        """
+
+        nagłówki: dict[str, str] = {}
+
+        if wpis is None:
+            return nagłówki
+
+        if wpis["etag"]:
+            nagłówki["If-None-Match"] = wpis["etag"]
+
+        if wpis["ostatniaModyfikacja"]:
+            nagłówki["If-Modified-Since"] = wpis["ostatniaModyfikacja"]
+
+        return nagłówki
+
+    def zaplanujOdświeżenie(
+        self,
+        url: str,
+        odśwież: Callable[[], Awaitable[object]]
+    ) -> None:
+        """
+        Uruchamia w tle odświeżenie nieaktualnego wpisu, o ile nie jest ono już wykonywane.
+
+        Args:
+            url (str): Adres strony internetowej.
+            odśwież (Callable[[], Awaitable[object]]): Funkcja asynchroniczna odświeżająca stronę.
+        """
+
+        if url in self.odświeżane:
+            return
+
+        async def wykonaj() -> None:
+            try:
+                await odśwież()
+            finally:
+                self.odświeżane.discard(url)
+
+        self.odświeżane.add(url)
+        zadanie = asyncio.create_task(wykonaj())
+        self.zadania.add(zadanie)
+        zadanie.add_done_callback(self.zadania.discard)
+
+    def zwróćStatystyki(self) -> StatystykiPamięci:
+        """
+        Zwraca statystyki wykorzystania pamięci podręcznej.
+
+        Returns:
+            StatystykiPamięci: Słownik liczników trafień, chybień i usunięć oraz bieżącego rozmiaru.
+        """
+
+        return {
+            "wpisy": len(self.wpisy),
+            "rozmiar": self.rozmiar,
+            "limit": self.limit,
+            "trafienia": self.statystyki["trafienia"],
+            "nieaktualne": self.statystyki["nieaktualne"],
+            "chybienia": self.statystyki["chybienia"],
+            "usuniecia": self.statystyki["usuniecia"]
+        }
+
+pamięć = Cache()
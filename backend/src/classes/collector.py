@@ -0,0 +1,114 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import gc
+from pathlib import Path
+import sys
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Wewnętrzne importy
+from src.classes.types import StatystykiOdśmiecania
+from src.handlers.configuration import konfiguracja
+from src.handlers.logging import logowanie
+
+class Collector:
+    """
+    Dostosowuje cykliczne odśmiecanie do obiektów BeautifulSoup, których drzewa pełne są cyklicznych odwołań. Ustawia progi odśmiecania z pliku konfiguracyjnego, zamraża obiekty utworzone podczas uruchamiania, tak aby nie były ponownie przeglądane przez kolejne przebiegi odśmiecania, oraz udostępnia statystyki odśmiecania i pamięci procesu.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając ścieżkę odczytu pamięci procesu i rozmiar strony pamięci.
+        """
+
+        self.ścieżka = Path("/proc/self/statm")
+        self.strona: int = resource.getpagesize() if resource is not None else 4096
+
+    def start(self) -> None:
+        """
+        Ustawia progi odśmiecania z pliku konfiguracyjnego, a jeśli zamrożenie jest włączone, przenosi obiekty utworzone podczas uruchamiania do generacji stałej. Domyślny próg najmłodszej generacji jest znacznie wyższy niż w CPython, ponieważ przetworzenie jednej strony tworzy tysiące obiektów, przez co przy domyślnym progu odśmiecanie uruchamiane byłoby kilkukrotnie podczas przetwarzania każdej strony.
+        """
+
+        ustawienia = konfiguracja.get("odsmiecanie", {})
+        progi = ustawienia.get("progi", [])
+
+        if progi:
+            try:
+                gc.set_threshold(*[int(próg) for próg in progi[:3]])
+            except (TypeError, ValueError) as e:
+                logowanie.warning(
+                    f"Nieprawidłowe progi odśmiecania w pliku konfiguracyjnym ({progi}). Więcej informacji: {e}"
+                )
+
+        if ustawienia.get("zamrozenie", False):
+            gc.collect()
+            gc.freeze()
+
+    def close(self) -> None:
+        """
+        Przywraca zamrożone obiekty do zwykłego odśmiecania.
+        """
+
+        gc.unfreeze()
+
+    def zwróćRSS(self) -> int | None:
+        """
+        Zwraca bieżący rozmiar pamięci rezydentnej procesu (RSS).
+
+        Returns:
+            int | None: Rozmiar pamięci w bajtach lub None, jeśli system go nie udostępnia.
+        """
+
+        try:
+            return int(self.ścieżka.read_text().split()[1]) * self.strona
+        except (OSError, IndexError, ValueError):
+            return None
+
+    def zwróćSzczyt(self) -> int | None:
+        """
+        Zwraca największy rozmiar pamięci rezydentnej procesu od jego uruchomienia.
+
+        Returns:
+            int | None: Rozmiar pamięci w bajtach lub None, jeśli system go nie udostępnia.
+        """
+
+        if resource is None:
+            return None
+
+        szczyt = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return szczyt if sys.platform == "darwin" else szczyt * 1024
+
+    def zwróćStatystyki(self) -> StatystykiOdśmiecania:
+        """
+        Zwraca statystyki odśmiecania i pamięci procesu.
+
+        Returns:
+            StatystykiOdśmiecania: Słownik zawierający progi odśmiecania, liczbę przebiegów odśmiecania i zebranych obiektów w każdej generacji, liczbę zamrożonych obiektów oraz bieżący i największy rozmiar pamięci procesu (w bajtach).
+        """
+
+        statystyki = gc.get_stats()
+
+        return {
+            "progi": list(gc.get_threshold()),
+            "przebiegi": [generacja["collections"] for generacja in statystyki],
+            "zebrane": [generacja["collected"] for generacja in statystyki],
+            "zamrozone": gc.get_freeze_count(),
+            "rss": self.zwróćRSS(),
+            "szczyt": self.zwróćSzczyt()
+        }
+
+odśmiecanie = Collector()
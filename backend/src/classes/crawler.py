@@ -0,0 +1,336 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+from datetime import datetime
+import random
+import time
+import weakref
+from zoneinfo import ZoneInfo
+
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+
+# Wewnętrzne importy
+from src.classes.atom import Atom
+from src.classes.cache import pamięć
+from src.classes.epoch import epoka
+from src.classes.scheduler import harmonogram
+from src.classes.snapshots import wersje
+from src.classes.types import (
+    ListaOddziałów,
+    PlanLekcji,
+    StatystykiOdświeżania
+)
+from src.handlers.configuration import konfiguracja
+from src.handlers.lists.parser import wyodrębnijListy
+from src.handlers.logging import logowanie
+from src.handlers.scraper import odświeżZawartośćStrony
+from src.handlers.timetables.parser import wyodrębnijPlanLekcji
+
+class Crawler:
+    """
+    Odpowiada za cykliczne odświeżanie w tle listy, zastępstw oraz wszystkich planów lekcji oddziałów, nauczycieli i sal, gdy upłynie ich czas świeżości wyznaczony przez harmonogram, tak aby zapytania do Atom API były obsługiwane z pamięci podręcznej, oraz za zapisywanie zmienionych planów lekcji jako kolejnych wersji.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając początkowy stan bez uruchomionego zadania.
+        """
+
+        self.zadanie: asyncio.Task | None = None
+        self.odświeżono: dict[str, float] = {}
+        self.próby: dict[str, float] = {}
+        self.zapisane: weakref.WeakValueDictionary[str, BeautifulSoup] = weakref.WeakValueDictionary()
+        self.przejścia: int = 0
+        self.restarty: int = 0
+        self.czasTrwania: float | None = None
+        self.zakończono: datetime | None = None
+        self.wybudzenie = asyncio.Event()
+
+    async def start(self, atom: Atom) -> None:
+        """
+        Uruchamia nadzorowane zadanie odświeżania w tle, jeśli zostało ono włączone w pliku konfiguracyjnym. Zmiana epoki planu lekcji rozpoczyna kolejne przejście odświeżania bez oczekiwania na upływ interwału.
+
+        Args:
+            atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonywania zapytań.
+        """
+
+        if self.zadanie and not self.zadanie.done():
+            return
+
+        if not konfiguracja.get("odswiezanie", {}).get("wlaczone", False):
+            return
+
+        epoka.zarejestruj(self.wybudź)
+        self.zadanie = asyncio.create_task(self.nadzoruj(atom))
+
+    async def close(self) -> None:
+        """
+        Bezpiecznie zatrzymuje zadanie odświeżania w tle.
+        """
+
+        if self.zadanie and not self.zadanie.done():
+            self.zadanie.cancel()
+
+            try:
+                await self.zadanie
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logowanie.exception(
+                    f"Wystąpił błąd podczas zatrzymywania odświeżania w tle. Więcej informacji: {e}"
+                )
+
+        self.zadanie = None
+
+    def wybudź(self) -> None:
+        """
+        Przerywa oczekiwanie na kolejne przejście odświeżania.
+        """
+
+        self.wybudzenie.set()
+
+    def zwróćOpóźnienie(self, czas: float) -> float:
+        """
+        Zwraca czas oczekiwania zmodyfikowany o losowy rozrzut, aby uniknąć odpytywania serwera w stałych odstępach.
+
+        Args:
+            czas (float): Bazowy czas oczekiwania (w sekundach).
+
+        Returns:
+            float: Czas oczekiwania z uwzględnionym rozrzutem (w sekundach).
+        """
+
+        rozrzut = float(konfiguracja.get("odswiezanie", {}).get("rozrzut", 0))
+        return max(0.0, czas * (1 + random.uniform(-rozrzut, rozrzut)))
+
+    async def nadzoruj(self, atom: Atom) -> None:
+        """
+        Wykonuje kolejne przejścia odświeżania i ponownie je uruchamia po wystąpieniu błędu, zwiększając wykładniczo czas oczekiwania.
+
+        Args:
+            atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonywania zapytań.
+        """
+
+        niepowodzenia = 0
+
+        while True:
+            try:
+                await self.przeszukaj(atom)
+                niepowodzenia = 0
+                opóźnienie = float(konfiguracja.get("odswiezanie", {}).get("interwal", 600))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                niepowodzenia += 1
+                self.restarty += 1
+                opóźnienie = min(300.0, 5.0 * 2 ** (niepowodzenia - 1))
+                logowanie.exception(
+                    f"Wystąpił błąd podczas odświeżania planów lekcji w tle. Ponowna próba za {opóźnienie:.0f} s. Więcej informacji: {e}"
+                )
+
+            try:
+                await asyncio.wait_for(self.wybudzenie.wait(), self.zwróćOpóźnienie(opóźnienie))
+            except asyncio.TimeoutError:
+                pass
+
+    def sprawdźTermin(self, url: str) -> bool:
+        """
+        Sprawdza, czy strona powinna zostać odświeżona, czyli czy nie ma jej w pamięci podręcznej lub przestała być świeża, a od ostatniej próby jej odświeżenia upłynął czas świeżości wyznaczony przez harmonogram.
+
+        Args:
+            url (str): Adres strony internetowej.
+
+        Returns:
+            bool: True, jeśli strona powinna zostać odświeżona, False w przeciwnym razie.
+        """
+
+        wpis = pamięć.wpisy.get(url)
+        if wpis is not None and pamięć.sprawdźŚwieżość(wpis):
+            return False
+
+        próba = self.próby.get(url)
+        return próba is None or time.monotonic() - próba >= harmonogram.zwróćInterwał(url, pamięć.zwróćŹródło(url))
+
+    async def przeszukaj(self, atom: Atom) -> None:
+        """
+        Odświeża listę, stronę zastępstw oraz strony planów lekcji, których czas świeżości wyznaczony przez harmonogram upłynął, z ograniczoną liczbą jednoczesnych zapytań.
+
+        Args:
+            atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonywania zapytań.
+
+        Raises:
+            RuntimeError: Gdy nie udało się pobrać listy oddziałów, nauczycieli oraz sal.
+        """
+
+        ustawienia = konfiguracja.get("odswiezanie", {})
+        lista = konfiguracja.get("lista", {})
+        plany = konfiguracja.get("plany", {})
+        zastępstwa = konfiguracja.get("zastepstwa", {})
+        urlListy = lista.get("url")
+        kodowanieListy = lista.get("kodowanie")
+        katalogPlanów = plany.get("url")
+        kodowaniePlanów = plany.get("kodowanie")
+        urlZastępstw = zastępstwa.get("url")
+        kodowanieZastępstw = zastępstwa.get("kodowanie")
+
+        if not urlListy or not kodowanieListy or not katalogPlanów or not kodowaniePlanów:
+            raise RuntimeError("Brak wymaganych danych w pliku konfiguracyjnym.")
+
+        początek = time.monotonic()
+
+        wpisListy = pamięć.wpisy.get(urlListy)
+
+        if wpisListy is None or self.sprawdźTermin(urlListy):
+            self.próby[urlListy] = time.monotonic()
+            zawartośćStronyListy = await epoka.sprawdź(atom)
+        else:
+            zawartośćStronyListy = wpisListy["dokument"]
+
+        self.wybudzenie.clear()
+
+        if zawartośćStronyListy is None:
+            raise RuntimeError("Nie udało się pobrać listy oddziałów, nauczycieli oraz sal.")
+
+        if urlListy not in self.odświeżono or self.próby.get(urlListy, 0) >= początek:
+            self.odświeżono[urlListy] = time.time()
+        listy = wyodrębnijListy(zawartośćStronyListy, urlListy)
+        adresy = list(dict.fromkeys(
+            f"{katalogPlanów}{element['identyfikator']}.html"
+            for sekcja in ("oddzialy", "nauczyciele", "sale")
+            for element in listy.get(sekcja, {}).values()
+            if element.get("identyfikator")
+        ))
+
+        ograniczenie = asyncio.Semaphore(max(1, int(ustawienia.get("wspolbieznosc", 3))))
+        nieudane = 0
+
+        async def odśwież(
+            url: str,
+            kodowanie: str
+        ) -> None:
+            """
+            Odświeża pojedynczą stronę i zapisuje nową wersję planu lekcji.
+
+            Args:
+                url (str): Adres strony internetowej.
+                kodowanie (str): Kodowanie strony internetowej potrzebne do prawidłowego odczytu jej treści.
+            """
+
+            nonlocal nieudane
+
+            async with ograniczenie:
+                self.próby[url] = time.monotonic()
+                dokument = await odświeżZawartośćStrony(atom, url, kodowanie)
+
+            if dokument is None:
+                nieudane += 1
+                return
+
+            self.odświeżono[url] = time.time()
+
+            if url != urlZastępstw:
+                await self.zapiszWersję(atom, url, dokument, listy.get("oddzialy", {}))
+
+        zadania = [(url, kodowaniePlanów) for url in adresy if self.sprawdźTermin(url)]
+
+        if urlZastępstw and kodowanieZastępstw and self.sprawdźTermin(urlZastępstw):
+            zadania.append((urlZastępstw, kodowanieZastępstw))
+
+        await asyncio.gather(*[odśwież(url, kodowanie) for url, kodowanie in zadania])
+
+        for url in list(self.odświeżono):
+            if url not in (urlListy, urlZastępstw) and url not in adresy:
+                del self.odświeżono[url]
+                self.próby.pop(url, None)
+
+        self.przejścia += 1
+        self.czasTrwania = time.monotonic() - początek
+        self.zakończono = datetime.now(ZoneInfo("Europe/Warsaw"))
+
+        if nieudane:
+            logowanie.warning(
+                f"Nie udało się odświeżyć {nieudane} z {len(zadania)} stron."
+            )
+
+    async def zapiszWersję(
+        self,
+        atom: Atom,
+        url: str,
+        dokument: BeautifulSoup,
+        listaOddziałów: ListaOddziałów
+    ) -> None:
+        """
+        Przetwarza odświeżoną stronę planu lekcji i zapisuje ją jako nową wersję, jeśli jej zawartość zmieniła się od ostatniego zapisu.
+
+        Args:
+            atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonywania zapytań.
+            url (str): Adres strony planu lekcji.
+            dokument (BeautifulSoup): Obiekt BeautifulSoup reprezentujący stronę HTML.
+            listaOddziałów (ListaOddziałów): Słownik wszystkich oddziałów.
+        """
+
+        if wersje.baza is None or self.zapisane.get(url) is dokument:
+            return
+
+        planLekcji = await wyodrębnijPlanLekcji(atom, dokument, listaOddziałów, None, None, None, url, None)
+        if planLekcji is None:
+            return
+
+        await self.zapiszPlan(url, dokument, planLekcji)
+
+    async def zapiszPlan(
+        self,
+        url: str,
+        dokument: BeautifulSoup,
+        planLekcji: PlanLekcji
+    ) -> None:
+        """
+        Zapisuje przetworzony, niefiltrowany plan lekcji jako nową wersję, jeśli pochodzi on z dokumentu innego niż ostatnio zapisany dla tej strony, czyli strona została od tego czasu ponownie pobrana i przetworzona.
+
+        Args:
+            url (str): Adres strony planu lekcji.
+            dokument (BeautifulSoup): Obiekt BeautifulSoup reprezentujący stronę HTML, z której wyodrębniono plan lekcji.
+            planLekcji (PlanLekcji): Słownik zawierający ustrukturyzowany, niefiltrowany plan lekcji.
+        """
+
+        if wersje.baza is None or self.zapisane.get(url) is dokument:
+            return
+
+        await asyncio.to_thread(wersje.zapisz, planLekcji)
+        self.zapisane[url] = dokument
+
+    def zwróćStatystyki(self) -> StatystykiOdświeżania:
+        """
+        Zwraca statystyki odświeżania w tle.
+
+        Returns:
+            StatystykiOdświeżania: Słownik zawierający liczbę przejść i restartów, czas trwania ostatniego przejścia oraz wiek każdej odświeżonej strony (w sekundach).
+        """
+
+        teraz = time.time()
+
+        return {
+            "aktywne": bool(self.zadanie and not self.zadanie.done()),
+            "przejscia": self.przejścia,
+            "restarty": self.restarty,
+            "czasTrwania": self.czasTrwania,
+            "zakonczono": self.zakończono.isoformat() if self.zakończono else None,
+            "strony": {
+                url: round(teraz - odświeżono, 1)
+                for url, odświeżono in self.odświeżono.items()
+            }
+        }
+
+odświeżanie = Crawler()
@@ -0,0 +1,182 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+from datetime import datetime
+from typing import Callable
+from zoneinfo import ZoneInfo
+
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+
+# Wewnętrzne importy
+from src.classes.atom import Atom
+from src.classes.cache import pamięć
+from src.classes.types import StatystykiEpoki
+from src.handlers.configuration import konfiguracja
+from src.handlers.logging import logowanie
+from src.handlers.scraper import odświeżZawartośćStrony
+
+class Epoch:
+    """
+    Wykrywa ponowne wygenerowanie planu lekcji na podstawie skrótu zawartości listy oddziałów, nauczycieli i sal. Każda zmiana listy rozpoczyna nową epokę planu lekcji, w której wszystkie zapisane strony planów lekcji przestają być aktualne, a zarejestrowani obserwatorzy są powiadamiani o zmianie.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając początkowy stan bez sprawdzonej listy.
+        """
+
+        self.zadanie: asyncio.Task | None = None
+        self.skrót: str | None = None
+        self.zmiany: int = 0
+        self.sprawdzono: datetime | None = None
+        self.zmieniono: datetime | None = None
+        self.obserwatorzy: list[Callable[[], None]] = []
+
+    async def start(self, atom: Atom) -> None:
+        """
+        Uruchamia zadanie cyklicznie sprawdzające listę, jeśli zostało ono włączone w pliku konfiguracyjnym.
+
+        Args:
+            atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonywania zapytań.
+        """
+
+        if self.zadanie and not self.zadanie.done():
+            return
+
+        if not konfiguracja.get("epoka", {}).get("wlaczone", False):
+            return
+
+        self.zadanie = asyncio.create_task(self.obserwuj(atom))
+
+    async def close(self) -> None:
+        """
+        Bezpiecznie zatrzymuje zadanie sprawdzające listę.
+        """
+
+        if self.zadanie and not self.zadanie.done():
+            self.zadanie.cancel()
+
+            try:
+                await self.zadanie
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logowanie.exception(
+                    f"Wystąpił błąd podczas zatrzymywania sprawdzania epoki planu lekcji. Więcej informacji: {e}"
+                )
+
+        self.zadanie = None
+
+    def zarejestruj(self, obserwator: Callable[[], None]) -> None:
+        """
+        Rejestruje funkcję wywoływaną po rozpoczęciu nowej epoki planu lekcji.
+
+        Args:
+            obserwator (Callable[[], None]): Funkcja wywoływana po zmianie epoki.
+        """
+
+        if obserwator not in self.obserwatorzy:
+            self.obserwatorzy.append(obserwator)
+
+    async def obserwuj(self, atom: Atom) -> None:
+        """
+        Cyklicznie sprawdza, czy lista została zmieniona.
+
+        Args:
+            atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonywania zapytań.
+        """
+
+        while True:
+            try:
+                await self.sprawdź(atom)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logowanie.exception(
+                    f"Wystąpił błąd podczas sprawdzania epoki planu lekcji. Więcej informacji: {e}"
+                )
+
+            await asyncio.sleep(float(konfiguracja.get("epoka", {}).get("interwal", 60)))
+
+    async def sprawdź(self, atom: Atom) -> BeautifulSoup | None:
+        """
+        Odświeża listę zapytaniem warunkowym i porównuje skrót jej zawartości z poprzednim. Jeśli lista się zmieniła, rozpoczyna nową epokę planu lekcji.
+
+        Args:
+            atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonywania zapytań.
+
+        Returns:
+            BeautifulSoup | None: Obiekt BeautifulSoup reprezentujący stronę HTML listy.
+        """
+
+        lista = konfiguracja.get("lista", {})
+        urlListy = lista.get("url")
+        kodowanieListy = lista.get("kodowanie")
+
+        if not urlListy or not kodowanieListy:
+            return None
+
+        zawartośćStronyListy = await odświeżZawartośćStrony(atom, urlListy, kodowanieListy)
+        wpis = pamięć.wpisy.get(urlListy)
+
+        if zawartośćStronyListy is None or wpis is None:
+            return zawartośćStronyListy
+
+        self.sprawdzono = datetime.now(ZoneInfo("Europe/Warsaw"))
+        skrót = wpis["skrot"]
+
+        if self.skrót is None:
+            self.skrót = skrót
+            return zawartośćStronyListy
+
+        if skrót == self.skrót:
+            return zawartośćStronyListy
+
+        self.skrót = skrót
+        self.zmiany += 1
+        self.zmieniono = self.sprawdzono
+        pamięć.rozpocznijEpokę()
+
+        logowanie.info(
+            f"Wykryto nową wersję planu lekcji. Rozpoczęto epokę {pamięć.epoka}."
+        )
+
+        for obserwator in self.obserwatorzy:
+            try:
+                obserwator()
+            except Exception as e:
+                logowanie.exception(
+                    f"Wystąpił błąd podczas powiadamiania o zmianie epoki planu lekcji. Więcej informacji: {e}"
+                )
+
+        return zawartośćStronyListy
+
+    def zwróćStatystyki(self) -> StatystykiEpoki:
+        """
+        Zwraca statystyki wykrywania zmian planu lekcji.
+
+        Returns:
+            StatystykiEpoki: Słownik zawierający numer bieżącej epoki, liczbę wykrytych zmian, skrót listy oraz czas ostatniego sprawdzenia i ostatniej zmiany.
+        """
+
+        return {
+            "numer": pamięć.epoka,
+            "zmiany": self.zmiany,
+            "skrot": self.skrót,
+            "sprawdzono": self.sprawdzono.isoformat() if self.sprawdzono else None,
+            "zmieniono": self.zmieniono.isoformat() if self.zmieniono else None
+        }
+
+epoka = Epoch()
@@ -0,0 +1,87 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable
+)
+
+# Wewnętrzne importy
+from src.classes.types import StatystykiScalania
+
+class SingleFlight:
+    """
+    Scala jednocześnie wykonywane operacje asynchroniczne o tym samym kluczu w jedno wykonanie, którego wynik otrzymują wszyscy oczekujący.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając początkowy stan bez wykonywanych operacji.
+        """
+
+        self.wToku: dict[str, asyncio.Future] = {}
+        self.statystyki: dict[str, int] = {
+            "wykonane": 0,
+            "scalone": 0
+        }
+
+    async def wykonaj(
+        self,
+        klucz: str,
+        operacja: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Wykonuje operację lub dołącza do jej trwającego wykonania o tym samym kluczu. Przerwanie oczekiwania jednego z wywołujących nie przerywa operacji pozostałym.
+
+        Args:
+            klucz (str): Klucz identyfikujący operację (np. adres strony internetowej).
+            operacja (Callable[[], Awaitable[Any]]): Funkcja asynchroniczna wykonująca operację.
+
+        Returns:
+            Any: Wynik operacji.
+        """
+
+        zadanie = self.wToku.get(klucz)
+
+        if zadanie is None:
+            zadanie = asyncio.ensure_future(operacja())
+            self.wToku[klucz] = zadanie
+            self.statystyki["wykonane"] += 1
+
+            def zakończ(_: asyncio.Future) -> None:
+                if self.wToku.get(klucz) is zadanie:
+                    del self.wToku[klucz]
+
+            zadanie.add_done_callback(zakończ)
+        else:
+            self.statystyki["scalone"] += 1
+
+        return await asyncio.shield(zadanie)
+
+    def zwróćStatystyki(self) -> StatystykiScalania:
+        """
+        Zwraca statystyki scalania operacji.
+
+        Returns:
+            StatystykiScalania: Słownik liczby trwających, wykonanych i scalonych operacji.
+        """
+
+        return {
+            "wToku": len(self.wToku),
+            "wykonane": self.statystyki["wykonane"],
+            "scalone": self.statystyki["scalone"]
+        }
+
+scalanie = SingleFlight()
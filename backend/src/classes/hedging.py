@@ -0,0 +1,86 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Wewnętrzne importy
+from src.classes.semaphore import semafor
+from src.classes.types import StatystykiDublowania
+from src.handlers.configuration import konfiguracja
+
+class Hedging:
+    """
+    Zarządza globalnym budżetem dublowanych zapytań. Każde zapytanie do serwera zasila budżet ułamkiem zapytania, a każde zapytanie dublujące go zużywa, dzięki czemu dodatkowe obciążenie serwerów nie przekracza ustalonej części wszystkich zapytań.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając początkowy stan z pustym budżetem.
+        """
+
+        self.budżet: float = 0.0
+        self.zapytania: int = 0
+        self.dublowane: int = 0
+        self.wygrane: int = 0
+
+    def zwróćPróg(self, url: str) -> float | None:
+        """
+        Zwraca czas, po którym zapytanie do serwera powinno zostać zdublowane, i zasila budżet zapytań dublujących.
+
+        Args:
+            url (str): Adres strony internetowej.
+
+        Returns:
+            float | None: Czas oczekiwania (w sekundach) przed zdublowaniem zapytania lub None, jeśli dublowanie jest wyłączone albo brakuje pomiarów czasów odpowiedzi serwera.
+        """
+
+        ustawienia = konfiguracja.get("dublowanie", {})
+        if not ustawienia.get("wlaczone", True):
+            return None
+
+        self.zapytania += 1
+        self.budżet = min(10.0, self.budżet + float(ustawienia.get("budzet", 0.05)))
+
+        return semafor.zwróćPercentyl(url, float(ustawienia.get("percentyl", 0.95)))
+
+    def zezwól(self, url: str) -> bool:
+        """
+        Sprawdza, czy zapytanie może zostać zdublowane, i pobiera je z budżetu. Zapytania nie są dublowane, jeśli budżet jest wyczerpany lub zapytania do serwera oczekują już w kolejce.
+
+        Args:
+            url (str): Adres strony internetowej.
+
+        Returns:
+            bool: Flaga informująca, czy zapytanie może zostać zdublowane.
+        """
+
+        if self.budżet < 1 or semafor.zwróćLimit(url).kolejka:
+            return False
+
+        self.budżet -= 1
+        self.dublowane += 1
+        return True
+
+    def zwróćStatystyki(self) -> StatystykiDublowania:
+        """
+        Zwraca statystyki dublowania zapytań.
+
+        Returns:
+            StatystykiDublowania: Słownik zawierający liczbę zapytań, zapytań zdublowanych, zapytań, w których szybsze okazało się zapytanie dublujące, oraz pozostały budżet.
+        """
+
+        return {
+            "zapytania": self.zapytania,
+            "dublowane": self.dublowane,
+            "wygrane": self.wygrane,
+            "budzet": round(self.budżet, 2)
+        }
+
+dublowanie = Hedging()
@@ -0,0 +1,120 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import hashlib
+
+# Wewnętrzne importy
+from src.handlers.configuration import konfiguracja
+
+class HotKeys:
+    """
+    Szacuje częstotliwość występowania kluczy za pomocą szkicu Count-Min o stałym rozmiarze i śledzi K najczęstszych kluczy. Liczniki są okresowo zmniejszane o połowę, dzięki czemu szacunki odzwierciedlają przede wszystkim ostatnio obserwowany ruch.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, tworząc pusty szkic o rozmiarze z pliku konfiguracyjnego.
+        """
+
+        ustawienia = konfiguracja.get("przewidywanie", {})
+        self.szerokość: int = max(16, int(ustawienia.get("szerokosc", 1024)))
+        self.głębokość: int = max(1, int(ustawienia.get("glebokosc", 4)))
+        self.k: int = max(1, int(ustawienia.get("k", 20)))
+        self.liczniki: list[list[int]] = [[0] * self.szerokość for _ in range(self.głębokość)]
+        self.najczęstsze: dict[str, int] = {}
+        self.zdarzenia: int = 0
+
+    def zwróćIndeksy(self, klucz: str) -> list[int]:
+        """
+        Zwraca indeksy liczników klucza w każdym wierszu szkicu.
+
+        Args:
+            klucz (str): Klucz, dla którego wyznaczane są indeksy.
+
+        Returns:
+            list[int]: Lista indeksów liczników, po jednym dla każdego wiersza.
+        """
+
+        skrót = hashlib.blake2b(klucz.encode("utf-8"), digest_size=8 * self.głębokość).digest()
+        return [int.from_bytes(skrót[i * 8:(i + 1) * 8], "little") % self.szerokość for i in range(self.głębokość)]
+
+    def oszacuj(self, klucz: str) -> int:
+        """
+        Zwraca szacowaną liczbę wystąpień klucza. Szacunek może być zawyżony, lecz nigdy zaniżony względem liczników po ostatnim zmniejszeniu.
+
+        Args:
+            klucz (str): Klucz, którego częstotliwość jest szacowana.
+
+        Returns:
+            int: Szacowana liczba wystąpień klucza.
+        """
+
+        return min(wiersz[indeks] for wiersz, indeks in zip(self.liczniki, self.zwróćIndeksy(klucz)))
+
+    def zarejestruj(self, klucz: str) -> int:
+        """
+        Rejestruje wystąpienie klucza i aktualizuje listę najczęstszych kluczy.
+
+        Args:
+            klucz (str): Klucz, którego wystąpienie jest rejestrowane.
+
+        Returns:
+            int: Szacowana liczba wystąpień klucza po jego zarejestrowaniu.
+        """
+
+        indeksy = self.zwróćIndeksy(klucz)
+        szacunek = min(wiersz[indeks] for wiersz, indeks in zip(self.liczniki, indeksy)) + 1
+
+        for wiersz, indeks in zip(self.liczniki, indeksy):
+            if wiersz[indeks] < szacunek:
+                wiersz[indeks] = szacunek
+
+        if klucz in self.najczęstsze or len(self.najczęstsze) < self.k:
+            self.najczęstsze[klucz] = szacunek
+        else:
+            najrzadszy = min(self.najczęstsze, key=self.najczęstsze.__getitem__)
+
+            if szacunek > self.najczęstsze[najrzadszy]:
+                del self.najczęstsze[najrzadszy]
+                self.najczęstsze[klucz] = szacunek
+
+        self.zdarzenia += 1
+        if self.zdarzenia >= self.szerokość * 10:
+            self.zmniejsz()
+
+        return szacunek
+
+    def zmniejsz(self) -> None:
+        """
+        Zmniejsza o połowę wszystkie liczniki szkicu oraz listy najczęstszych kluczy, usuwając z niej klucze, których liczniki spadły do zera.
+        """
+
+        self.liczniki = [[licznik // 2 for licznik in wiersz] for wiersz in self.liczniki]
+        self.najczęstsze = {
+            klucz: licznik // 2
+            for klucz, licznik in self.najczęstsze.items()
+            if licznik // 2 > 0
+        }
+        self.zdarzenia = 0
+
+    def zwróćNajczęstsze(self) -> list[tuple[str, int]]:
+        """
+        Zwraca najczęstsze klucze uporządkowane malejąco według szacowanej liczby wystąpień.
+
+        Returns:
+            list[tuple[str, int]]: Lista krotek klucza oraz szacowanej liczby jego wystąpień.
+        """
+
+        return sorted(self.najczęstsze.items(), key=lambda element: element[1], reverse=True)
+
+popularność = HotKeys()
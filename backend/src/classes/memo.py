@@ -0,0 +1,180 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+from collections import OrderedDict
+import threading
+from typing import (
+    Any,
+    Callable,
+    Hashable
+)
+import weakref
+
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+
+# Wewnętrzne importy
+from src.classes.parser import analizator
+from src.classes.types import StatystykiZapamiętywania
+from src.handlers.configuration import konfiguracja
+
+class Memo:
+    """
+    Zapamiętuje ustrukturyzowane wyniki przetwarzania stron internetowych dla obiektów BeautifulSoup, z których zostały wyodrębnione. Strona, której treść nie zmieniła się od ostatniego pobrania, nie jest przetwarzana ponownie, więc kolejne zapytania otrzymują ten sam obiekt dokumentu i jego zapamiętane wyniki. Wyniki usuwane są razem z dokumentem, gdy przestaje on być używany. Fragmenty powtarzające się na wielu stronach (np. komórki planów lekcji) zapamiętywane są niezależnie od dokumentu według ich treści, w ograniczonej liczbie najdawniej używanych wpisów.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając początkowy stan bez zapamiętanych wyników.
+        """
+
+        self.wyniki: dict[int, dict[Hashable, Any]] = {}
+        self.trafienia: int = 0
+        self.chybienia: int = 0
+        self.fragmenty: OrderedDict[Hashable, Any] = OrderedDict()
+        self.trafieniaFragmentów: int = 0
+        self.chybieniaFragmentów: int = 0
+        self.blokada = threading.Lock()
+
+    def zawiera(
+        self,
+        dokument: BeautifulSoup,
+        klucz: Hashable
+    ) -> bool:
+        """
+        Sprawdza, czy dla dokumentu zapamiętano już wynik przetwarzania o podanym kluczu.
+
+        Args:
+            dokument (BeautifulSoup): Obiekt BeautifulSoup reprezentujący stronę HTML.
+            klucz (Hashable): Klucz identyfikujący rodzaj wyniku (np. nazwa funkcji i adres strony internetowej).
+
+        Returns:
+            bool: Informacja, czy wynik został zapamiętany.
+        """
+
+        return klucz in self.wyniki.get(id(dokument), {})
+
+    def pobierz(
+        self,
+        dokument: BeautifulSoup,
+        klucz: Hashable,
+        utwórz: Callable[[], Any]
+    ) -> Any:
+        """
+        Zwraca zapamiętany wynik przetwarzania dokumentu lub tworzy go i zapamiętuje. Zwracane wyniki są współdzielone między wywołującymi i nie mogą być przez nich modyfikowane.
+
+        Args:
+            dokument (BeautifulSoup): Obiekt BeautifulSoup reprezentujący stronę HTML.
+            klucz (Hashable): Klucz identyfikujący rodzaj wyniku (np. nazwa funkcji i adres strony internetowej).
+            utwórz (Callable[[], Any]): Funkcja tworząca wynik, jeśli nie został on jeszcze zapamiętany.
+
+        Returns:
+            Any: Zapamiętany lub utworzony wynik przetwarzania dokumentu.
+        """
+
+        identyfikator = id(dokument)
+        wyniki = self.wyniki.get(identyfikator)
+
+        if wyniki is None:
+            wyniki = self.wyniki[identyfikator] = {}
+            weakref.finalize(dokument, self.wyniki.pop, identyfikator, None)
+
+        if klucz in wyniki:
+            self.trafienia += 1
+            return wyniki[klucz]
+
+        self.chybienia += 1
+        wynik = wyniki[klucz] = utwórz()
+        return wynik
+
+    async def pobierzWTle(
+        self,
+        dokument: BeautifulSoup,
+        klucz: Hashable,
+        utwórz: Callable[[], Any]
+    ) -> Any:
+        """
+        Zwraca zapamiętany wynik przetwarzania dokumentu lub tworzy go w puli wątków przetwarzania i zapamiętuje, tak aby przetwarzanie nie blokowało pętli zdarzeń.
+
+        Args:
+            dokument (BeautifulSoup): Obiekt BeautifulSoup reprezentujący stronę HTML.
+            klucz (Hashable): Klucz identyfikujący rodzaj wyniku (np. nazwa funkcji i adres strony internetowej).
+            utwórz (Callable[[], Any]): Funkcja tworząca wynik, która nie może modyfikować dokumentu.
+
+        Returns:
+            Any: Zapamiętany lub utworzony wynik przetwarzania dokumentu.
+        """
+
+        wyniki = self.wyniki.get(id(dokument))
+
+        if wyniki is not None and klucz in wyniki:
+            self.trafienia += 1
+            return wyniki[klucz]
+
+        wynik = await analizator.wykonaj(utwórz)
+        return self.pobierz(dokument, klucz, lambda: wynik)
+
+    def pobierzFragment(
+        self,
+        klucz: Hashable,
+        utwórz: Callable[[], Any]
+    ) -> Any:
+        """
+        Zwraca wynik przetwarzania fragmentu strony zapamiętany dla jego treści lub tworzy go i zapamiętuje, usuwając najdawniej używane wyniki po przekroczeniu limitu z pliku konfiguracyjnego. Metoda może być wywoływana z wątków puli przetwarzania, a zwracane wyniki są współdzielone między stronami i nie mogą być modyfikowane.
+
+        Args:
+            klucz (Hashable): Klucz jednoznacznie opisujący treść fragmentu strony oraz parametry wpływające na wynik.
+            utwórz (Callable[[], Any]): Funkcja tworząca wynik, jeśli nie został on jeszcze zapamiętany.
+
+        Returns:
+            Any: Zapamiętany lub utworzony wynik przetwarzania fragmentu strony.
+        """
+
+        with self.blokada:
+            if klucz in self.fragmenty:
+                self.fragmenty.move_to_end(klucz)
+                self.trafieniaFragmentów += 1
+                return self.fragmenty[klucz]
+
+        wynik = utwórz()
+        limit = int(konfiguracja.get("przetwarzanie", {}).get("fragmenty", 0))
+
+        with self.blokada:
+            self.chybieniaFragmentów += 1
+
+            if limit > 0:
+                self.fragmenty[klucz] = wynik
+
+                while len(self.fragmenty) > limit:
+                    self.fragmenty.popitem(last=False)
+
+        return wynik
+
+    def zwróćStatystyki(self) -> StatystykiZapamiętywania:
+        """
+        Zwraca statystyki zapamiętywania wyników przetwarzania.
+
+        Returns:
+            StatystykiZapamiętywania: Słownik zawierający liczbę dokumentów z zapamiętanymi wynikami, liczbę trafień oraz chybień, a także liczbę zapamiętanych fragmentów stron oraz trafień i chybień ich wyników.
+        """
+
+        return {
+            "dokumenty": len(self.wyniki),
+            "trafienia": self.trafienia,
+            "chybienia": self.chybienia,
+            "fragmenty": len(self.fragmenty),
+            "trafieniaFragmentow": self.trafieniaFragmentów,
+            "chybieniaFragmentow": self.chybieniaFragmentów
+        }
+
+zapamiętywanie = Memo()
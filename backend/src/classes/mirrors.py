@@ -0,0 +1,69 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Wewnętrzne importy
+from src.classes.breaker import bezpiecznik
+from src.classes.semaphore import semafor
+from src.handlers.configuration import konfiguracja
+
+class Mirrors:
+    """
+    Wybiera serwer, z którego pobierana jest strona internetowa, spośród głównego adresu źródła danych i jego serwerów lustrzanych, na podstawie stanu ich bezpieczników i zaobserwowanych czasów odpowiedzi.
+    """
+
+    def zwróćAdresy(self, url: str) -> list[str]:
+        """
+        Zwraca adresy strony internetowej na serwerze głównym i wszystkich serwerach lustrzanych jej źródła danych, w kolejności z pliku konfiguracyjnego.
+
+        Args:
+            url (str): Adres strony internetowej na serwerze głównym.
+
+        Returns:
+            list[str]: Lista adresów strony internetowej.
+        """
+
+        for źródło in ("lista", "plany", "zastepstwa"):
+            ustawienia = konfiguracja.get(źródło, {})
+            adres = ustawienia.get("url")
+
+            if adres and url.startswith(adres):
+                ścieżka = url[len(adres):]
+                return [url] + [f"{lustro}{ścieżka}" for lustro in ustawienia.get("lustra", []) if lustro]
+
+        return [url]
+
+    def wybierz(
+        self,
+        url: str,
+        pominięte: set[str]
+    ) -> str | None:
+        """
+        Wybiera adres strony internetowej na najszybszym dostępnym serwerze. Serwery bez wystarczającej liczby pomiarów traktowane są jako najszybsze, dzięki czemu są sprawdzane w kolejności z pliku konfiguracyjnego.
+
+        Args:
+            url (str): Adres strony internetowej na serwerze głównym.
+            pominięte (set[str]): Zbiór adresów, które zawiodły podczas bieżącego pobierania.
+
+        Returns:
+            str | None: Adres strony internetowej na wybranym serwerze lub None, jeśli żaden serwer nie jest dostępny.
+        """
+
+        adresy = [adres for adres in self.zwróćAdresy(url) if adres not in pominięte]
+        adresy.sort(key=lambda adres: semafor.zwróćPercentyl(adres, 0.5) or 0.0)
+
+        for adres in adresy:
+            if bezpiecznik.sprawdź(adres):
+                return adres
+
+        return None
+
+lustra = Mirrors()
@@ -0,0 +1,481 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+import codecs
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import re
+from typing import (
+    Any,
+    Callable
+)
+
+# Zewnętrzne biblioteki
+from bs4 import (
+    BeautifulSoup,
+    SoupStrainer
+)
+from bs4.builder import builder_registry
+from bs4.builder._htmlparser import (
+    BeautifulSoupHTMLParser,
+    HTMLParserTreeBuilder
+)
+from bs4.filter import ElementFilter
+
+# Wewnętrzne importy
+from src.classes.types import StatystykiPrzetwarzania
+from src.handlers.configuration import konfiguracja
+from src.handlers.logging import logowanie
+
+class Filtr(ElementFilter):
+    """
+    Ogranicza budowane drzewo dokumentu do elementów pasujących do któregokolwiek z prostych selektorów CSS wraz z całą ich zawartością. Pozostałe elementy i tekst strony są pomijane już podczas jej przetwarzania.
+    """
+
+    wzorzec = re.compile(r"^([a-zA-Z][\w-]*)?(?:\.([\w-]+))?(?:\[([\w-]+)\])?$")
+
+    def __init__(self, selektory: list[str]) -> None:
+        """
+        Inicjalizuje obiekt, zamieniając selektory CSS na reguły dopasowania elementów.
+
+        Args:
+            selektory (list[str]): Lista prostych selektorów CSS w postaci `znacznik`, `.klasa`, `znacznik.klasa` lub `znacznik[atrybut]`.
+
+        Raises:
+            ValueError: Gdy którykolwiek z selektorów nie jest prostym selektorem CSS.
+        """
+
+        super().__init__()
+        self.reguły: list[SoupStrainer] = []
+
+        for selektor in selektory:
+            dopasowanie = self.wzorzec.match(selektor.strip())
+            if dopasowanie is None or not any(dopasowanie.groups()):
+                raise ValueError(f"Nieobsługiwany selektor CSS ({selektor}).")
+
+            znacznik, klasa, atrybut = dopasowanie.groups()
+            atrybuty: dict[str, str | bool] = {}
+
+            if klasa:
+                atrybuty["class"] = klasa
+
+            if atrybut:
+                atrybuty[atrybut] = True
+
+            self.reguły.append(SoupStrainer(znacznik, atrybuty))
+
+    @property
+    def includes_everything(self) -> bool:
+        """
+        Informuje BeautifulSoup, że filtr nie dopuszcza wszystkich elementów strony.
+
+        Returns:
+            bool: Zawsze False.
+        """
+
+        return False
+
+    @property
+    def excludes_everything(self) -> bool:
+        """
+        Informuje BeautifulSoup, czy filtr odrzuca wszystkie elementy strony.
+
+        Returns:
+            bool: True, jeśli filtr nie zawiera żadnej reguły, False w przeciwnym razie.
+        """
+
+        return not self.reguły
+
+    def allow_tag_creation(
+        self,
+        nsprefix: str | None,
+        name: str,
+        attrs: dict[str, str] | None
+    ) -> bool:
+        """
+        Sprawdza, czy element poza dopuszczonymi już elementami powinien zostać dodany do drzewa dokumentu.
+
+        Args:
+            nsprefix (str | None): Prefiks przestrzeni nazw elementu.
+            name (str): Nazwa znacznika elementu.
+            attrs (dict[str, str] | None): Atrybuty elementu.
+
+        Returns:
+            bool: True, jeśli element pasuje do którejkolwiek z reguł, False w przeciwnym razie.
+        """
+
+        return any(reguła.allow_tag_creation(nsprefix, name, attrs) for reguła in self.reguły)
+
+    def allow_string_creation(self, string: str) -> bool:
+        """
+        Sprawdza, czy tekst poza dopuszczonymi elementami powinien zostać dodany do drzewa dokumentu.
+
+        Args:
+            string (str): Tekst strony.
+
+        Returns:
+            bool: Zawsze False, ponieważ zachowywane są wyłącznie dopuszczone elementy wraz z ich zawartością.
+        """
+
+        return False
+
+
+class Analiza:
+    """
+    Przyrostowo dekoduje i przetwarza kolejne fragmenty treści strony internetowej wybranym silnikiem, budując obiekt BeautifulSoup w trakcie jej pobierania. Jeśli podano selektory wymaganych elementów, pozwala zakończyć przetwarzanie, gdy wszystkie te elementy zostały w całości przetworzone.
+    """
+
+    def __init__(
+        self,
+        kodowanie: str,
+        silnik: str = "html.parser",
+        selektory: list[str] | None = None,
+        filtr: Filtr | None = None,
+        krok: int = 4096
+    ) -> None:
+        """
+        Inicjalizuje obiekt, przygotowując pusty dokument, parser wybranego silnika oraz dekoder wybranego kodowania.
+
+        Args:
+            kodowanie (str): Kodowanie strony internetowej potrzebne do prawidłowego odczytu jej treści.
+            silnik (str): Nazwa silnika przetwarzania HTML obsługiwanego przez BeautifulSoup.
+            selektory (list[str] | None): Lista selektorów CSS elementów, których przetworzenie kończy analizę.
+            filtr (Filtr | None): Filtr ograniczający budowane drzewo dokumentu do wybranych elementów.
+            krok (int): Rozmiar części fragmentu (w bajtach), po której przetworzeniu sprawdzana jest obecność wymaganych elementów.
+        """
+
+        self.dekoder = codecs.getincrementaldecoder(kodowanie)(errors="ignore")
+        self.selektory: list[str] = list(selektory or [])
+        self.dokument = BeautifulSoup("", silnik, parse_only=filtr)
+        self.dokument.reset()
+        self.dokument.builder.initialize_soup(self.dokument)
+        self.dokument.builder.reset()
+
+        if isinstance(self.dokument.builder, HTMLParserTreeBuilder):
+            argumenty, parametry = self.dokument.builder.parser_args
+            self.parser = BeautifulSoupHTMLParser(self.dokument, *argumenty, **parametry)
+        else:
+            self.parser = self.dokument.builder.parser_for(None)
+        self.krok: int = max(1, krok)
+        self.rozmiar: int = 0
+        self.pominięte: int = 0
+        self.kompletna: bool = False
+
+    def dodaj(self, dane: bytes) -> bool:
+        """
+        Dekoduje i przetwarza kolejny fragment treści strony. Jeśli określono wymagane elementy, fragment przetwarzany jest w częściach, a po przetworzeniu wszystkich wymaganych elementów pozostała treść jest pomijana.
+
+        Args:
+            dane (bytes): Fragment treści strony w postaci otrzymanej od serwera.
+
+        Returns:
+            bool: True, jeśli wszystkie wymagane elementy zostały już w całości przetworzone, False w przeciwnym razie.
+        """
+
+        if self.kompletna:
+            self.pominięte += len(dane)
+            return True
+
+        krok = self.krok if self.selektory else max(1, len(dane))
+
+        for początek in range(0, len(dane), krok):
+            część = dane[początek:początek + krok]
+            self.rozmiar += len(część)
+            tekst = self.dekoder.decode(część)
+
+            if tekst:
+                self.parser.feed(tekst)
+
+            if self.sprawdźKompletność():
+                self.kompletna = True
+                self.pominięte += len(dane) - początek - len(część)
+                break
+
+        return self.kompletna
+
+    def sprawdźKompletność(self) -> bool:
+        """
+        Sprawdza, czy wszystkie wymagane elementy zostały znalezione i zamknięte w przetwarzanym dokumencie.
+
+        Returns:
+            bool: True, jeśli wszystkie wymagane elementy zostały w całości przetworzone, False w przeciwnym razie lub gdy nie określono wymaganych elementów.
+        """
+
+        if not self.selektory:
+            return False
+
+        otwarte = {id(tag) for tag in self.dokument.tagStack}
+
+        for selektor in self.selektory:
+            element = self.dokument.select_one(selektor)
+
+            if element is None or id(element) in otwarte:
+                return False
+
+        return True
+
+    def zakończ(self) -> BeautifulSoup:
+        """
+        Przetwarza pozostałą treść strony i zamyka wszystkie otwarte elementy dokumentu.
+
+        Returns:
+            BeautifulSoup: Obiekt BeautifulSoup reprezentujący stronę HTML.
+        """
+
+        tekst = self.dekoder.decode(b"", final=True)
+
+        if tekst:
+            self.parser.feed(tekst)
+
+        self.parser.close()
+
+        if isinstance(self.parser, BeautifulSoupHTMLParser):
+            self.parser.already_closed_empty_element = []
+        self.dokument.endData()
+
+        while self.dokument.currentTag is not None and self.dokument.currentTag.name != self.dokument.ROOT_TAG_NAME:
+            self.dokument.popTag()
+
+        self.dokument.builder.soup = None
+        return self.dokument
+
+
+class Parser:
+    """
+    Tworzy obiekty BeautifulSoup z treści pobieranych stron internetowych silnikiem wybranym w pliku konfiguracyjnym, w całości lub przyrostowo w trakcie ich pobierania, oraz udostępnia profile wymaganych elementów, do których ograniczane jest drzewo dokumentu i po których przetworzeniu można zakończyć pobieranie strony. Dla źródeł danych, których strony zawsze wykorzystywane są tylko częściowo, drzewo dokumentu ograniczane jest do elementów wskazanych w pliku konfiguracyjnym. Przetwarzanie może być wykonywane w puli wątków, aby nie blokowało pętli zdarzeń.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając początkowy stan bez przetworzonych stron.
+        """
+
+        self.przetworzone: int = 0
+        self.strumieniowo: int = 0
+        self.przerwane: int = 0
+        self.pominięte: int = 0
+        self.filtrowane: int = 0
+        self.niezmienione: int = 0
+        self.wTle: int = 0
+        self.wątki: int = 0
+        self.pula: ThreadPoolExecutor | None = None
+        self.silniki: dict[str, str] = {}
+        self.filtry: dict[tuple[str, ...], Filtr | None] = {}
+
+    def start(self) -> None:
+        """
+        Tworzy pulę wątków, w których przetwarzane są strony internetowe, jeśli jej rozmiar w pliku konfiguracyjnym jest większy od zera.
+        """
+
+        if self.pula is not None:
+            return
+
+        self.wątki = max(0, int(konfiguracja.get("przetwarzanie", {}).get("watki", 0)))
+
+        if self.wątki > 0:
+            self.pula = ThreadPoolExecutor(max_workers=self.wątki, thread_name_prefix="przetwarzanie")
+
+    def close(self) -> None:
+        """
+        Zamyka pulę wątków przetwarzania, anulując zadania oczekujące na wykonanie.
+        """
+
+        if self.pula is None:
+            return
+
+        self.pula.shutdown(wait=False, cancel_futures=True)
+        self.pula = None
+        self.wątki = 0
+
+    async def wykonaj(
+        self,
+        funkcja: Callable[..., Any],
+        *argumenty: Any
+    ) -> Any:
+        """
+        Wykonuje przetwarzanie w puli wątków, tak aby nie blokowało ono pętli zdarzeń i obsługi pozostałych zapytań. Jeśli pula nie została utworzona, przetwarzanie wykonywane jest bezpośrednio.
+
+        Args:
+            funkcja (Callable[..., Any]): Funkcja przetwarzająca, która nie może modyfikować współdzielonych obiektów.
+            *argumenty (Any): Argumenty przekazywane do funkcji.
+
+        Returns:
+            Any: Wynik funkcji przetwarzającej.
+        """
+
+        if self.pula is None:
+            return funkcja(*argumenty)
+
+        self.wTle += 1
+        return await asyncio.get_running_loop().run_in_executor(self.pula, functools.partial(funkcja, *argumenty))
+
+    def zwróćSilnik(self) -> str:
+        """
+        Zwraca nazwę silnika przetwarzania HTML wybranego w pliku konfiguracyjnym. Jeśli wybrany silnik nie jest dostępny (np. nie zainstalowano biblioteki `lxml`), używany jest wbudowany silnik `html.parser`.
+
+        Returns:
+            str: Nazwa silnika przetwarzania HTML obsługiwanego przez BeautifulSoup.
+        """
+
+        silnik = konfiguracja.get("przetwarzanie", {}).get("silnik", "html.parser")
+
+        if silnik not in self.silniki:
+            if builder_registry.lookup(silnik) is None:
+                logowanie.warning(
+                    f"Silnik przetwarzania HTML ({silnik}) nie jest dostępny. Używanie silnika html.parser."
+                )
+                self.silniki[silnik] = "html.parser"
+            else:
+                self.silniki[silnik] = silnik
+
+        return self.silniki[silnik]
+
+    def zwróćUstawienia(self) -> tuple[bool, int]:
+        """
+        Zwraca ustawienia przetwarzania strumieniowego z pliku konfiguracyjnego.
+
+        Returns:
+            tuple[bool, int]: Flaga informująca, czy przetwarzanie strumieniowe jest włączone, oraz rozmiar odczytywanych fragmentów (w bajtach).
+        """
+
+        ustawienia = konfiguracja.get("strumieniowanie", {})
+        return bool(ustawienia.get("wlaczone", True)), max(1024, int(ustawienia.get("fragment", 16384)))
+
+    def zwróćProfil(self, profil: str | None) -> list[str] | None:
+        """
+        Zwraca selektory CSS elementów wymaganych przez profil przetwarzania.
+
+        Args:
+            profil (str | None): Nazwa profilu przetwarzania zdefiniowanego w pliku konfiguracyjnym.
+
+        Returns:
+            list[str] | None: Lista selektorów CSS lub None, jeśli strona ma zostać przetworzona w całości.
+        """
+
+        if profil is None:
+            return None
+
+        return konfiguracja.get("strumieniowanie", {}).get("profile", {}).get(profil) or None
+
+    def zwróćFiltr(
+        self,
+        profil: str | None,
+        źródło: str | None
+    ) -> Filtr | None:
+        """
+        Zwraca filtr ograniczający drzewo dokumentu do elementów wymaganych przez profil przetwarzania lub, w przypadku jego braku, do elementów wskazanych dla źródła danych w pliku konfiguracyjnym.
+
+        Args:
+            profil (str | None): Nazwa profilu przetwarzania zdefiniowanego w pliku konfiguracyjnym.
+            źródło (str | None): Nazwa źródła danych (`lista`, `plany` lub `zastepstwa`).
+
+        Returns:
+            Filtr | None: Filtr drzewa dokumentu lub None, jeśli strona ma zostać przetworzona w całości.
+        """
+
+        selektory = self.zwróćProfil(profil)
+
+        if selektory is None and źródło is not None:
+            selektory = konfiguracja.get("przetwarzanie", {}).get("filtry", {}).get(źródło) or None
+
+        if not selektory:
+            return None
+
+        klucz = tuple(selektory)
+
+        if klucz not in self.filtry:
+            try:
+                self.filtry[klucz] = Filtr(selektory)
+            except ValueError as e:
+                logowanie.warning(
+                    f"Nie udało się utworzyć filtru przetwarzania. Strony będą przetwarzane w całości. Więcej informacji: {e}"
+                )
+                self.filtry[klucz] = None
+
+        return self.filtry[klucz]
+
+    def przetwórz(
+        self,
+        tekst: str,
+        profil: str | None = None,
+        źródło: str | None = None
+    ) -> BeautifulSoup:
+        """
+        Przetwarza całą treść strony internetowej.
+
+        Args:
+            tekst (str): Zdekodowana treść strony internetowej.
+            profil (str | None): Nazwa profilu przetwarzania określającego elementy wymagane przez wywołującego.
+            źródło (str | None): Nazwa źródła danych, z którego pochodzi strona.
+
+        Returns:
+            BeautifulSoup: Obiekt BeautifulSoup reprezentujący stronę HTML.
+        """
+
+        filtr = self.zwróćFiltr(profil, źródło)
+
+        self.przetworzone += 1
+        if filtr is not None:
+            self.filtrowane += 1
+
+        return BeautifulSoup(tekst, self.zwróćSilnik(), parse_only=filtr)
+
+    def rozpocznij(
+        self,
+        kodowanie: str,
+        profil: str | None = None,
+        źródło: str | None = None
+    ) -> Analiza:
+        """
+        Rozpoczyna przyrostowe przetwarzanie treści strony internetowej.
+
+        Args:
+            kodowanie (str): Kodowanie strony internetowej potrzebne do prawidłowego odczytu jej treści.
+            profil (str | None): Nazwa profilu przetwarzania określającego elementy, po których przetworzeniu można zakończyć analizę.
+            źródło (str | None): Nazwa źródła danych, z którego pochodzi strona.
+
+        Returns:
+            Analiza: Obiekt przyrostowego przetwarzania strony.
+        """
+
+        filtr = self.zwróćFiltr(profil, źródło)
+
+        self.przetworzone += 1
+        self.strumieniowo += 1
+        if filtr is not None:
+            self.filtrowane += 1
+
+        return Analiza(kodowanie, self.zwróćSilnik(), self.zwróćProfil(profil), filtr)
+
+    def zwróćStatystyki(self) -> StatystykiPrzetwarzania:
+        """
+        Zwraca statystyki przetwarzania stron.
+
+        Returns:
+            StatystykiPrzetwarzania: Słownik zawierający nazwę używanego silnika, liczbę przetworzonych stron, stron przetworzonych strumieniowo, stron przetworzonych tylko w wybranej części, stron, których przetwarzanie zakończono po znalezieniu wymaganych elementów, liczbę pominiętych w ten sposób bajtów oraz liczbę stron, których treść nie zmieniła się od ostatniego pobrania i które nie zostały przetworzone ponownie, a także rozmiar puli wątków przetwarzania i liczbę wykonanych w niej zadań.
+        """
+
+        return {
+            "silnik": self.zwróćSilnik(),
+            "przetworzone": self.przetworzone,
+            "strumieniowo": self.strumieniowo,
+            "filtrowane": self.filtrowane,
+            "przerwane": self.przerwane,
+            "pominieteBajty": self.pominięte,
+            "niezmienione": self.niezmienione,
+            "watki": self.wątki,
+            "wTle": self.wTle
+        }
+
+analizator = Parser()
@@ -0,0 +1,244 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+from contextvars import ContextVar
+import json
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable
+)
+
+# Wewnętrzne importy
+from src.classes.hotkeys import popularność
+from src.classes.semaphore import semafor
+from src.classes.types import StatystykiPrzewidywania
+from src.handlers.configuration import konfiguracja
+from src.handlers.logging import logowanie
+
+spekulacja: ContextVar[bool] = ContextVar("spekulacja", default=False)
+
+class Prefetcher:
+    """
+    Odpowiada za przewidywanie kolejnych zapytań do Atom API na podstawie częstotliwości dotychczasowych zapytań i wykonywanie ich z wyprzedzeniem, gdy serwery źródłowe mają wolną przepustowość. Zapytania wykonane z wyprzedzeniem odświeżają wszystkie strony, których wymaga obsługa zapytania, dzięki czemu rzeczywiste zapytanie obsługiwane jest z pamięci podręcznej.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając początkowy stan bez zarejestrowanych obsług zapytań.
+        """
+
+        self.zadanie: asyncio.Task | None = None
+        self.obsługi: dict[str, Callable[..., Awaitable[Any]]] = {}
+        self.wykonywane: set[str] = set()
+        self.wykonano: dict[str, float] = {}
+        self.zadania: set[asyncio.Task] = set()
+        self.wykonane: int = 0
+        self.nieudane: int = 0
+        self.pominięte: int = 0
+
+    async def start(self) -> None:
+        """
+        Uruchamia zadanie cyklicznie wykonujące najczęstsze zapytania, jeśli zostało ono włączone w pliku konfiguracyjnym.
+        """
+
+        if self.zadanie and not self.zadanie.done():
+            return
+
+        if not konfiguracja.get("przewidywanie", {}).get("wlaczone", False):
+            return
+
+        self.zadanie = asyncio.create_task(self.obserwuj())
+
+    async def close(self) -> None:
+        """
+        Bezpiecznie zatrzymuje zadanie cykliczne oraz wszystkie wykonywane zapytania.
+        """
+
+        zadania = list(self.zadania)
+        if self.zadanie and not self.zadanie.done():
+            zadania.append(self.zadanie)
+
+        for zadanie in zadania:
+            zadanie.cancel()
+
+        for zadanie in zadania:
+            try:
+                await zadanie
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logowanie.exception(
+                    f"Wystąpił błąd podczas zatrzymywania przewidywania zapytań. Więcej informacji: {e}"
+                )
+
+        self.zadanie = None
+
+    def zarejestrujObsługę(
+        self,
+        nazwa: str,
+        obsługa: Callable[..., Awaitable[Any]]
+    ) -> None:
+        """
+        Rejestruje funkcję obsługującą zapytania danego rodzaju, wywoływaną podczas wykonywania zapytań z wyprzedzeniem.
+
+        Args:
+            nazwa (str): Nazwa rodzaju zapytania.
+            obsługa (Callable[..., Awaitable[Any]]): Funkcja obsługująca zapytanie, wywoływana z parametrami zapytania.
+        """
+
+        self.obsługi[nazwa] = obsługa
+
+    def zwróćKlucz(
+        self,
+        nazwa: str,
+        parametry: dict[str, Any]
+    ) -> str:
+        """
+        Zwraca klucz jednoznacznie identyfikujący zapytanie wraz z jego parametrami.
+
+        Args:
+            nazwa (str): Nazwa rodzaju zapytania.
+            parametry (dict[str, Any]): Parametry zapytania.
+
+        Returns:
+            str: Klucz zapytania.
+        """
+
+        return json.dumps([nazwa, parametry], ensure_ascii=False, sort_keys=True)
+
+    def odnotuj(
+        self,
+        nazwa: str,
+        parametry: dict[str, Any],
+        następne: list[tuple[str, dict[str, Any]]] | None = None
+    ) -> None:
+        """
+        Rejestruje zapytanie do Atom API i planuje wykonanie z wyprzedzeniem zapytań, które zwykle po nim następują, jeśli są one wystarczająco częste. Zapytania wykonywane z wyprzedzeniem nie są rejestrowane.
+
+        Args:
+            nazwa (str): Nazwa rodzaju zapytania.
+            parametry (dict[str, Any]): Parametry zapytania.
+            następne (list[tuple[str, dict[str, Any]]] | None): Lista zapytań, które zwykle następują po danym zapytaniu.
+        """
+
+        if spekulacja.get() or not konfiguracja.get("przewidywanie", {}).get("wlaczone", False):
+            return
+
+        popularność.zarejestruj(self.zwróćKlucz(nazwa, parametry))
+        próg = int(konfiguracja.get("przewidywanie", {}).get("prog", 3))
+
+        for nazwaNastępnego, parametryNastępnego in następne or []:
+            klucz = self.zwróćKlucz(nazwaNastępnego, parametryNastępnego)
+
+            if popularność.oszacuj(klucz) >= próg:
+                self.zaplanuj(klucz)
+
+    def zaplanuj(self, klucz: str) -> bool:
+        """
+        Planuje wykonanie zapytania w tle, jeśli serwery źródłowe mają wolną przepustowość, zapytanie nie było niedawno wykonywane, a liczba jednocześnie wykonywanych zapytań nie przekracza limitu z pliku konfiguracyjnego.
+
+        Args:
+            klucz (str): Klucz zapytania.
+
+        Returns:
+            bool: Flaga informująca, czy zapytanie zostało zaplanowane.
+        """
+
+        ustawienia = konfiguracja.get("przewidywanie", {})
+        odstęp = float(ustawienia.get("odstep", 60))
+        nazwa, parametry = json.loads(klucz)
+        obsługa = self.obsługi.get(nazwa)
+
+        if obsługa is None or klucz in self.wykonywane:
+            return False
+
+        if len(self.wykonywane) >= int(ustawienia.get("wspolbieznosc", 2)):
+            return False
+
+        if time.monotonic() - self.wykonano.get(klucz, float("-inf")) < odstęp:
+            return False
+
+        if not semafor.sprawdźBezczynność():
+            self.pominięte += 1
+            return False
+
+        async def wykonaj() -> None:
+            """
+            Wykonuje zapytanie, oznaczając je jako wykonywane z wyprzedzeniem.
+            """
+
+            spekulacja.set(True)
+
+            try:
+                await obsługa(**parametry)
+                self.wykonane += 1
+            except Exception as e:
+                self.nieudane += 1
+                logowanie.exception(
+                    f"Wystąpił błąd podczas wykonywania zapytania z wyprzedzeniem ({klucz}). Więcej informacji: {e}"
+                )
+            finally:
+                self.wykonywane.discard(klucz)
+                self.wykonano[klucz] = time.monotonic()
+
+        self.wykonywane.add(klucz)
+        zadanie = asyncio.create_task(wykonaj())
+        self.zadania.add(zadanie)
+        zadanie.add_done_callback(self.zadania.discard)
+        return True
+
+    async def obserwuj(self) -> None:
+        """
+        Cyklicznie planuje wykonanie najczęstszych zapytań, których szacowana liczba wystąpień osiąga próg z pliku konfiguracyjnego.
+        """
+
+        while True:
+            ustawienia = konfiguracja.get("przewidywanie", {})
+
+            try:
+                próg = int(ustawienia.get("prog", 3))
+                obecne = {klucz for klucz in self.wykonano if klucz in popularność.najczęstsze}
+                self.wykonano = {klucz: czas for klucz, czas in self.wykonano.items() if klucz in obecne}
+
+                for klucz, licznik in popularność.zwróćNajczęstsze():
+                    if licznik < próg:
+                        break
+
+                    self.zaplanuj(klucz)
+                    await asyncio.sleep(0)
+            except Exception as e:
+                logowanie.exception(
+                    f"Wystąpił błąd podczas przewidywania zapytań. Więcej informacji: {e}"
+                )
+
+            await asyncio.sleep(float(ustawienia.get("interwal", 20)))
+
+    def zwróćStatystyki(self) -> StatystykiPrzewidywania:
+        """
+        Zwraca statystyki przewidywania zapytań.
+
+        Returns:
+            StatystykiPrzewidywania: Słownik zawierający liczbę zapytań wykonanych, nieudanych i pominiętych z powodu braku wolnej przepustowości oraz najczęstsze zapytania wraz z ich szacowaną liczbą wystąpień.
+        """
+
+        return {
+            "wykonane": self.wykonane,
+            "nieudane": self.nieudane,
+            "pominiete": self.pominięte,
+            "najczestsze": dict(popularność.zwróćNajczęstsze()[:10])
+        }
+
+przewidywanie = Prefetcher()
@@ -0,0 +1,153 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+from datetime import (
+    datetime,
+    timedelta
+)
+from zoneinfo import ZoneInfo
+
+# Wewnętrzne importy
+from src.classes.types import StatystykiHarmonogramu
+from src.handlers.configuration import konfiguracja
+
+class Scheduler:
+    """
+    Ustala czas świeżości pobranych stron internetowych na podstawie okien harmonogramu z pliku konfiguracyjnego (w strefie czasowej Europe/Warsaw) oraz zaobserwowanej częstotliwości zmian każdej strony. Czas świeżości strony, która nie zmieniła się od ostatniego pobrania, jest stopniowo wydłużany, a po wykryciu zmiany wraca do wartości z harmonogramu.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając początkowy stan bez obserwowanych stron.
+        """
+
+        self.skróty: dict[str, str] = {}
+        self.mnożniki: dict[str, float] = {}
+        self.zmiany: dict[str, int] = {}
+
+    def zwróćOkno(
+        self,
+        źródło: str,
+        teraz: datetime
+    ) -> tuple[float, float]:
+        """
+        Zwraca czas świeżości obowiązujący w bieżącym oknie harmonogramu źródła danych oraz czas pozostały do najbliższej zmiany okna.
+
+        Args:
+            źródło (str): Nazwa źródła danych (`lista`, `plany` lub `zastepstwa`).
+            teraz (datetime): Bieżący czas w strefie czasowej Europe/Warsaw.
+
+        Returns:
+            tuple[float, float]: Krotka czasu świeżości oraz czasu pozostałego do najbliższej zmiany okna (w sekundach).
+        """
+
+        ustawienia = konfiguracja.get(źródło, {})
+        czas = float(ustawienia.get("ttl", 0))
+        północ = teraz.replace(hour=0, minute=0, second=0, microsecond=0)
+        granica = północ + timedelta(days=1)
+
+        for okno in ustawienia.get("okna", []):
+            if teraz.weekday() not in okno.get("dni", []):
+                continue
+
+            godzina, minuta = map(int, okno.get("od", "00:00").split(":"))
+            początek = północ + timedelta(hours=godzina, minutes=minuta)
+            godzina, minuta = map(int, okno.get("do", "00:00").split(":"))
+            koniec = północ + timedelta(hours=godzina, minutes=minuta)
+
+            if początek <= teraz < koniec:
+                czas = float(okno.get("ttl", czas))
+                granica = min(granica, koniec)
+            elif teraz < początek:
+                granica = min(granica, początek)
+
+        return czas, (granica - teraz).total_seconds()
+
+    def zwróćInterwał(
+        self,
+        url: str,
+        źródło: str | None
+    ) -> float:
+        """
+        Zwraca czas świeżości strony internetowej, uwzględniając bieżące okno harmonogramu i wydłużenie wynikające z braku zmian strony. Czas świeżości nie przekracza najbliższej zmiany okna harmonogramu.
+
+        Args:
+            url (str): Adres strony internetowej.
+            źródło (str | None): Nazwa źródła danych, z którego pochodzi strona.
+
+        Returns:
+            float: Czas świeżości strony (w sekundach).
+        """
+
+        if not źródło:
+            return 0.0
+
+        czas, doGranicy = self.zwróćOkno(źródło, datetime.now(ZoneInfo("Europe/Warsaw")))
+        return max(1.0, min(czas * self.mnożniki.get(url, 1.0), doGranicy))
+
+    def zarejestruj(
+        self,
+        url: str,
+        źródło: str | None,
+        skrót: str
+    ) -> float:
+        """
+        Rejestruje pobranie strony internetowej, wydłużając jej czas świeżości, jeśli strona się nie zmieniła, lub przywracając go do wartości z harmonogramu po wykryciu zmiany.
+
+        Args:
+            url (str): Adres strony internetowej.
+            źródło (str | None): Nazwa źródła danych, z którego pochodzi strona.
+            skrót (str): Skrót zawartości pobranej strony.
+
+        Returns:
+            float: Nowy czas świeżości strony (w sekundach).
+        """
+
+        maksymalny = max(1.0, float(konfiguracja.get(źródło, {}).get("mnoznik", 1))) if źródło else 1.0
+        poprzedni = self.skróty.get(url)
+
+        if poprzedni is not None and poprzedni != skrót:
+            self.mnożniki[url] = 1.0
+            self.zmiany[url] = self.zmiany.get(url, 0) + 1
+        elif poprzedni is not None:
+            self.mnożniki[url] = min(maksymalny, self.mnożniki.get(url, 1.0) * 1.5)
+
+        self.skróty[url] = skrót
+        return self.zwróćInterwał(url, źródło)
+
+    def zwróćStatystyki(self) -> dict[str, StatystykiHarmonogramu]:
+        """
+        Zwraca bieżący czas świeżości z harmonogramu, liczbę obserwowanych stron, liczbę wykrytych zmian oraz średnie wydłużenie czasu świeżości dla każdego źródła danych.
+
+        Returns:
+            dict[str, StatystykiHarmonogramu]: Słownik statystyk harmonogramu według nazwy źródła danych.
+        """
+
+        teraz = datetime.now(ZoneInfo("Europe/Warsaw"))
+        statystyki: dict[str, StatystykiHarmonogramu] = {}
+
+        for źródło in ("lista", "plany", "zastepstwa"):
+            adres = konfiguracja.get(źródło, {}).get("url")
+            adresy = [url for url in self.skróty if adres and url.startswith(adres)]
+            mnożniki = [self.mnożniki.get(url, 1.0) for url in adresy]
+
+            statystyki[źródło] = {
+                "ttl": self.zwróćOkno(źródło, teraz)[0],
+                "strony": len(adresy),
+                "zmiany": sum(self.zmiany.get(url, 0) for url in adresy),
+                "mnoznik": round(sum(mnożniki) / len(mnożniki), 2) if mnożniki else 1.0
+            }
+
+        return statystyki
+
+harmonogram = Scheduler()
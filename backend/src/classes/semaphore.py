@@ -12,13 +12,240 @@
 
 # Standardowe biblioteki
 import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+import time
+from typing import AsyncIterator
+from urllib.parse import urlparse
+
+# Zewnętrzne biblioteki
+import aiohttp
+
+# Wewnętrzne importy
+from src.classes.types import StatystykiOgraniczenia
+from src.handlers.configuration import konfiguracja
+
+class Limit:
+    """
+    Przechowuje stan ograniczenia liczby jednoczesnych zapytań do pojedynczego serwera.
+    """
+
+    def __init__(self, limit: float) -> None:
+        """
+        Inicjalizuje obiekt z początkową wartością limitu.
+
+        Args:
+            limit (float): Początkowa liczba jednoczesnych zapytań.
+        """
+
+        self.limit: float = limit
+        self.wToku: int = 0
+        self.kolejka: int = 0
+        self.warunek = asyncio.Condition()
+        self.czasy: deque[float] = deque(maxlen=200)
+        self.najkrótszyCzas: float | None = None
+        self.ostatnieZmniejszenie: float = 0.0
+        self.zapytania: int = 0
+        self.błędy: int = 0
+
+
+class Pomiar:
+    """
+    Przechowuje czas, który upłynął w trakcie zapytania, lecz nie jest czasem oczekiwania na serwer (np. czas przetwarzania odbieranej strony), i nie powinien wpływać na limit ani na obserwowane czasy odpowiedzi serwera.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt bez pominiętego czasu.
+        """
+
+        self.pominięte: float = 0.0
+
 
 class Semaphore:
     """
-    Semafor służący do ograniczania liczby jednocześnie wykonywanych operacji asynchronicznych.
+    Adaptacyjny semafor ograniczający liczbę jednocześnie wykonywanych zapytań do każdego serwera osobno. Limit zwiększany jest addytywnie, dopóki czasy odpowiedzi pozostają bliskie najkrótszym zaobserwowanym, a zmniejszany multiplikatywnie po błędach lub wyraźnym spowolnieniu serwera (AIMD).
     """
 
-    def __init__(self, limit: int = 5):
-        self.semafor = asyncio.Semaphore(limit)
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając początkowy stan bez obserwowanych serwerów.
+        """
+
+        self.hosty: dict[str, Limit] = {}
+
+    def zwróćUstawienia(self) -> tuple[float, float, float, float]:
+        """
+        Zwraca ustawienia ograniczania zapytań z pliku konfiguracyjnego.
+
+        Returns:
+            tuple[float, float, float, float]: Krotka początkowego, minimalnego i maksymalnego limitu oraz tolerancji spowolnienia.
+        """
+
+        ustawienia = konfiguracja.get("ograniczenia", {})
+        minimalny = max(1.0, float(ustawienia.get("minimalny", 1)))
+        maksymalny = max(minimalny, float(ustawienia.get("maksymalny", 20)))
+        początkowy = min(maksymalny, max(minimalny, float(ustawienia.get("poczatkowy", 5))))
+
+        return początkowy, minimalny, maksymalny, float(ustawienia.get("tolerancja", 2.0))
+
+    def zwróćLimit(self, url: str) -> Limit:
+        """
+        Zwraca stan ograniczenia dla serwera, do którego kierowane jest zapytanie.
+
+        Args:
+            url (str): Adres strony internetowej.
+
+        Returns:
+            Limit: Stan ograniczenia serwera.
+        """
+
+        host = urlparse(url).netloc
+
+        if host not in self.hosty:
+            self.hosty[host] = Limit(self.zwróćUstawienia()[0])
+
+        return self.hosty[host]
+
+    def zwróćPercentyl(
+        self,
+        url: str,
+        percentyl: float
+    ) -> float | None:
+        """
+        Zwraca percentyl ostatnio zaobserwowanych czasów odpowiedzi serwera.
+
+        Args:
+            url (str): Adres strony internetowej.
+            percentyl (float): Percentyl z zakresu od 0 do 1.
+
+        Returns:
+            float | None: Czas odpowiedzi (w sekundach), jeśli zaobserwowano wystarczającą liczbę zapytań.
+        """
+
+        czasy = sorted(self.zwróćLimit(url).czasy)
+
+        if len(czasy) < 10:
+            return None
+
+        return czasy[min(len(czasy) - 1, int(len(czasy) * percentyl))]
+
+    def dostosuj(
+        self,
+        limit: Limit,
+        czas: float,
+        błąd: bool
+    ) -> None:
+        """
+        Dostosowuje limit serwera na podstawie wyniku i czasu trwania zakończonego zapytania.
+
+        Args:
+            limit (Limit): Stan ograniczenia serwera.
+            czas (float): Czas trwania zapytania (w sekundach).
+            błąd (bool): Flaga informująca, czy zapytanie zakończyło się błędem wskazującym na przeciążenie serwera.
+        """
+
+        _, minimalny, maksymalny, tolerancja = self.zwróćUstawienia()
+        teraz = time.monotonic()
+        limit.zapytania += 1
+
+        if błąd:
+            limit.błędy += 1
+            spowolnienie = True
+        else:
+            limit.czasy.append(czas)
+            limit.najkrótszyCzas = czas if limit.najkrótszyCzas is None else min(czas, limit.najkrótszyCzas * 1.01)
+            spowolnienie = czas > limit.najkrótszyCzas * tolerancja
+
+        if not spowolnienie:
+            limit.limit = min(maksymalny, limit.limit + 1 / limit.limit)
+            return
+
+        if teraz - limit.ostatnieZmniejszenie < max(czas, 0.1):
+            return
+
+        limit.limit = max(minimalny, limit.limit * (0.5 if błąd else 0.8))
+        limit.ostatnieZmniejszenie = teraz
+
+    @asynccontextmanager
+    async def ogranicz(self, url: str) -> AsyncIterator[Pomiar]:
+        """
+        Oczekuje na wolne miejsce w limicie serwera, a po zakończeniu zapytania dostosowuje limit do jego wyniku i czasu trwania, pomniejszonego o czas oznaczony przez wywołującego jako pominięty. Anulowane zapytania nie wpływają na limit.
+
+        Args:
+            url (str): Adres strony internetowej, do której kierowane jest zapytanie.
+
+        Yields:
+            Pomiar: Obiekt, w którym wywołujący odnotowuje czas niezwiązany z oczekiwaniem na serwer.
+        """
+
+        limit = self.zwróćLimit(url)
+
+        async with limit.warunek:
+            limit.kolejka += 1
+
+            try:
+                await limit.warunek.wait_for(lambda: limit.wToku < int(limit.limit))
+            finally:
+                limit.kolejka -= 1
+
+            limit.wToku += 1
+
+        pomiar = Pomiar()
+        początek = time.monotonic()
+        błąd = False
+        anulowane = False
+
+        try:
+            yield pomiar
+        except asyncio.CancelledError:
+            anulowane = True
+            raise
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+            błąd = True
+            raise
+        except aiohttp.ClientResponseError as e:
+            błąd = e.status >= 500 or e.status == 429
+            raise
+        finally:
+            if not anulowane:
+                self.dostosuj(limit, max(0.0, time.monotonic() - początek - pomiar.pominięte), błąd)
+
+            async with limit.warunek:
+                limit.wToku -= 1
+                limit.warunek.notify_all()
+
+    def sprawdźBezczynność(self) -> bool:
+        """
+        Sprawdza, czy żaden serwer nie ma oczekujących zapytań, a liczba wykonywanych zapytań nie przekracza połowy jego limitu.
+
+        Returns:
+            bool: True, jeśli serwery mają wolną przepustowość, False w przeciwnym razie.
+        """
+
+        return all(
+            not limit.kolejka and limit.wToku < limit.limit / 2
+            for limit in self.hosty.values()
+        )
+
+    def zwróćStatystyki(self) -> dict[str, StatystykiOgraniczenia]:
+        """
+        Zwraca bieżące limity, liczbę wykonywanych i oczekujących zapytań dla każdego serwera.
+
+        Returns:
+            dict[str, StatystykiOgraniczenia]: Słownik statystyk ograniczeń według nazwy serwera.
+        """
+
+        return {
+            host: {
+                "limit": int(limit.limit),
+                "wToku": limit.wToku,
+                "kolejka": limit.kolejka,
+                "zapytania": limit.zapytania,
+                "bledy": limit.błędy,
+                "najkrotszyCzas": limit.najkrótszyCzas
+            }
+            for host, limit in self.hosty.items()
+        }
 
-semafor = Semaphore().semafor
+semafor = Semaphore()
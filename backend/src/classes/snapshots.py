@@ -0,0 +1,343 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+from collections import Counter
+from datetime import datetime
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import threading
+from zoneinfo import ZoneInfo
+
+# Wewnętrzne importy
+from src.classes.types import (
+    OpisWersji,
+    PlanLekcji,
+    RóżnicePlanu,
+    WpisPlanu,
+    ZmianaPlanu
+)
+from src.handlers.configuration import konfiguracja
+from src.handlers.logging import logowanie
+
+class Snapshots:
+    """
+    Przechowuje w osadzonej bazie SQLite kolejne, różniące się od siebie wersje planów lekcji.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicjalizuje obiekt, ustawiając początkowy stan bez otwartej bazy danych.
+        """
+
+        self.baza: sqlite3.Connection | None = None
+        self.blokada = threading.Lock()
+
+    def start(self, katalog: Path | None = None) -> None:
+        """
+        Otwiera bazę danych wersji planów lekcji i tworzy jej strukturę, jeśli przechowywanie wersji zostało włączone w pliku konfiguracyjnym.
+
+        Args:
+            katalog (Path | None): Katalog bazy danych. W przypadku jego braku używany jest katalog `data` Atom API.
+        """
+
+        if self.baza is not None:
+            return
+
+        if not konfiguracja.get("wersje", {}).get("wlaczone", False):
+            return
+
+        try:
+            katalog = katalog or Path(__file__).resolve().parents[2] / "data"
+            katalog.mkdir(parents=True, exist_ok=True)
+
+            self.baza = sqlite3.connect(katalog / "wersje.sqlite3", check_same_thread=False)
+            self.baza.execute("PRAGMA journal_mode=WAL")
+
+            self.baza.execute(
+                """
+                CREATE TABLE IF NOT EXISTS wersje (
+                    numer INTEGER PRIMARY KEY AUTOINCREMENT,
+                    identyfikator TEXT NOT NULL,
+                    skrot TEXT NOT NULL,
+                    wygenerowano TEXT,
+                    obowiazuje TEXT,
+                    wygasa TEXT,
+                    zapisano TEXT NOT NULL,
+                    plan TEXT NOT NULL
+                )
+                """
+            )
+
+            self.baza.execute("CREATE INDEX IF NOT EXISTS wersje_identyfikator ON wersje (identyfikator, numer)")
+            self.baza.commit()
+        except Exception as e:
+            logowanie.exception(
+                f"Nie udało się otworzyć bazy danych wersji planów lekcji. Więcej informacji: {e}"
+            )
+            self.baza = None
+
+    def close(self) -> None:
+        """
+        Bezpiecznie zamyka bazę danych wersji planów lekcji.
+        """
+
+        if self.baza is None:
+            return
+
+        with self.blokada:
+            try:
+                self.baza.close()
+            except Exception as e:
+                logowanie.exception(
+                    f"Wystąpił błąd podczas zamykania bazy danych wersji planów lekcji. Więcej informacji: {e}"
+                )
+            finally:
+                self.baza = None
+
+    def zapisz(self, planLekcji: PlanLekcji) -> int | None:
+        """
+        Zapisuje plan lekcji jako nową wersję, o ile różni się on od najnowszej zapisanej wersji tego samego planu, oraz usuwa najstarsze wersje przekraczające limit. Powrót planu lekcji do wcześniejszej postaci zapisywany jest jako nowa wersja.
+
+        Args:
+            planLekcji (PlanLekcji): Słownik zawierający ustrukturyzowany, niefiltrowany plan lekcji.
+
+        Returns:
+            int | None: Numer zapisanej wersji, jeśli plan lekcji został zapisany.
+        """
+
+        identyfikator = planLekcji.get("identyfikator")
+
+        if self.baza is None or not identyfikator:
+            return None
+
+        treść = json.dumps(planLekcji, ensure_ascii=False, sort_keys=True)
+        skrót = hashlib.sha256(treść.encode("utf-8")).hexdigest()
+        data = planLekcji.get("data") or {}
+        limit = int(konfiguracja.get("wersje", {}).get("limit", 0))
+
+        with self.blokada:
+            najnowsza = self.baza.execute(
+                "SELECT skrot FROM wersje WHERE identyfikator = ? ORDER BY numer DESC LIMIT 1",
+                (identyfikator,)
+            ).fetchone()
+
+            if najnowsza is not None and najnowsza[0] == skrót:
+                return None
+
+            kursor = self.baza.execute(
+                """
+                INSERT INTO wersje (identyfikator, skrot, wygenerowano, obowiazuje, wygasa, zapisano, plan)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    identyfikator,
+                    skrót,
+                    planLekcji.get("wygenerowano"),
+                    data.get("obowiazuje"),
+                    data.get("wygasa"),
+                    datetime.now(ZoneInfo("Europe/Warsaw")).isoformat(),
+                    treść
+                )
+            )
+
+            if limit:
+                self.baza.execute(
+                    """
+                    DELETE FROM wersje WHERE identyfikator = ? AND numer NOT IN (
+                        SELECT numer FROM wersje WHERE identyfikator = ? ORDER BY numer DESC LIMIT ?
+                    )
+                    """,
+                    (identyfikator, identyfikator, limit)
+                )
+
+            self.baza.commit()
+            return kursor.lastrowid
+
+    def zwróćWersje(self, identyfikator: str) -> list[OpisWersji]:
+        """
+        Zwraca opisy wszystkich zapisanych wersji planu lekcji, od najstarszej do najnowszej.
+
+        Args:
+            identyfikator (str): Identyfikator oddziału, nauczyciela lub sali.
+
+        Returns:
+            list[OpisWersji]: Lista opisów zapisanych wersji planu lekcji.
+        """
+
+        if self.baza is None:
+            return []
+
+        with self.blokada:
+            wiersze = self.baza.execute(
+                """
+                SELECT numer, wygenerowano, obowiazuje, wygasa, zapisano
+                FROM wersje WHERE identyfikator = ? ORDER BY numer
+                """,
+                (identyfikator,)
+            ).fetchall()
+
+        return [
+            {
+                "numer": numer,
+                "wygenerowano": wygenerowano,
+                "obowiazuje": obowiązuje,
+                "wygasa": wygasa,
+                "zapisano": zapisano
+            }
+            for numer, wygenerowano, obowiązuje, wygasa, zapisano in wiersze
+        ]
+
+    def pobierz(
+        self,
+        identyfikator: str,
+        numer: int | None = None
+    ) -> PlanLekcji | None:
+        """
+        Zwraca zapisaną wersję planu lekcji.
+
+        Args:
+            identyfikator (str): Identyfikator oddziału, nauczyciela lub sali.
+            numer (int | None): Numer wersji planu lekcji. W przypadku jego braku zwracana jest najnowsza wersja.
+
+        Returns:
+            PlanLekcji | None: Słownik zawierający ustrukturyzowany plan lekcji, jeśli wersja istnieje.
+        """
+
+        if self.baza is None:
+            return None
+
+        with self.blokada:
+            if numer is None:
+                wiersz = self.baza.execute(
+                    "SELECT plan FROM wersje WHERE identyfikator = ? ORDER BY numer DESC LIMIT 1",
+                    (identyfikator,)
+                ).fetchone()
+            else:
+                wiersz = self.baza.execute(
+                    "SELECT plan FROM wersje WHERE identyfikator = ? AND numer = ?",
+                    (identyfikator, numer)
+                ).fetchone()
+
+        return json.loads(wiersz[0]) if wiersz else None
+
+    def porównaj(
+        self,
+        identyfikator: str,
+        od: int,
+        do: int | None = None
+    ) -> RóżnicePlanu | None:
+        """
+        Porównuje dwie zapisane wersje planu lekcji na poziomie pojedynczych lekcji.
+
+        Args:
+            identyfikator (str): Identyfikator oddziału, nauczyciela lub sali.
+            od (int): Numer wersji bazowej.
+            do (int | None): Numer wersji porównywanej. W przypadku jego braku porównywana jest najnowsza wersja.
+
+        Returns:
+            RóżnicePlanu | None: Słownik zawierający zmiany lekcji pomiędzy wersjami, jeśli obie wersje istnieją.
+        """
+
+        if do is None:
+            wersje = self.zwróćWersje(identyfikator)
+            do = wersje[-1]["numer"] if wersje else None
+
+        if do is None:
+            return None
+
+        poprzedni = self.pobierz(identyfikator, od)
+        następny = self.pobierz(identyfikator, do)
+
+        if poprzedni is None or następny is None:
+            return None
+
+        def zwróćGodziny(planLekcji: PlanLekcji) -> dict[tuple[str, int], WpisPlanu]:
+            """
+            Indeksuje wpisy planu lekcji według dnia tygodnia i numeru lekcji.
+
+            Args:
+                planLekcji (PlanLekcji): Słownik zawierający ustrukturyzowany plan lekcji.
+
+            Returns:
+                dict[tuple[str, int], WpisPlanu]: Słownik wpisów planu lekcji.
+            """
+
+            return {
+                (dzień, wpis["numer"]): wpis
+                for dzień, wpisy in (planLekcji.get("plan") or {}).items()
+                for wpis in wpisy
+            }
+
+        def zwróćLekcje(wpis: WpisPlanu | None) -> Counter:
+            """
+            Zlicza lekcje wpisu planu lekcji w postaci kanonicznej, umożliwiającej ich porównanie.
+
+            Args:
+                wpis (WpisPlanu | None): Wpis planu lekcji.
+
+            Returns:
+                Counter: Wielozbiór lekcji zapisanych w formacie `JSON`.
+            """
+
+            return Counter(
+                json.dumps(lekcja, ensure_ascii=False, sort_keys=True)
+                for lekcja in (wpis or {}).get("lekcje", [])
+            )
+
+        godzinyPoprzednie = zwróćGodziny(poprzedni)
+        godzinyNastępne = zwróćGodziny(następny)
+        dni = list(dict.fromkeys([*(następny.get("plan") or {}), *(poprzedni.get("plan") or {})]))
+        zmiany: list[ZmianaPlanu] = []
+
+        for dzień in dni:
+            numery = sorted({
+                numer
+                for (dzieńGodziny, numer) in (*godzinyPoprzednie, *godzinyNastępne)
+                if dzieńGodziny == dzień
+            })
+
+            for numer in numery:
+                wpisPoprzedni = godzinyPoprzednie.get((dzień, numer))
+                wpisNastępny = godzinyNastępne.get((dzień, numer))
+                lekcjePoprzednie = zwróćLekcje(wpisPoprzedni)
+                lekcjeNastępne = zwróćLekcje(wpisNastępny)
+                dodane = lekcjeNastępne - lekcjePoprzednie
+                usunięte = lekcjePoprzednie - lekcjeNastępne
+                wpis = wpisNastępny or wpisPoprzedni
+
+                if not dodane and not usunięte and (
+                    wpisPoprzedni is None
+                    or wpisNastępny is None
+                    or (wpisPoprzedni["poczatek"], wpisPoprzedni["koniec"]) == (wpisNastępny["poczatek"], wpisNastępny["koniec"])
+                ):
+                    continue
+
+                zmiany.append({
+                    "dzien": dzień,
+                    "numer": numer,
+                    "poczatek": wpis["poczatek"],
+                    "koniec": wpis["koniec"],
+                    "dodane": [json.loads(lekcja) for lekcja in dodane.elements()],
+                    "usuniete": [json.loads(lekcja) for lekcja in usunięte.elements()]
+                })
+
+        return {
+            "identyfikator": identyfikator,
+            "od": od,
+            "do": do,
+            "zmiany": zmiany
+        }
+
+wersje = Snapshots()
@@ -16,21 +16,134 @@ from typing import (
     TypedDict
 )
 
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+
 # Konfiguracja aplikacji
 
+class KonfiguracjaSesji(TypedDict):
+    polaczenia: int
+    polaczenie: float
+    odczyt: float
+    calkowity: float
+
+
+class OknoHarmonogramu(TypedDict):
+    dni: list[int]
+    od: str
+    do: str
+    ttl: int
+
+
 class KonfiguracjaPlanów(TypedDict):
     url: str
+    lustra: list[str]
     kodowanie: str
+    ttl: int
+    okna: list[OknoHarmonogramu]
+    mnoznik: float
+    nieaktualne: int
+    awaryjne: int
+    sesja: KonfiguracjaSesji
 
 
 class KonfiguracjaListy(TypedDict):
     url: str
+    lustra: list[str]
     kodowanie: str
+    ttl: int
+    okna: list[OknoHarmonogramu]
+    mnoznik: float
+    nieaktualne: int
+    awaryjne: int
+    sesja: KonfiguracjaSesji
 
 
 class KonfiguracjaZastępstw(TypedDict):
     url: str
+    lustra: list[str]
     kodowanie: str
+    ttl: int
+    okna: list[OknoHarmonogramu]
+    mnoznik: float
+    nieaktualne: int
+    awaryjne: int
+    sesja: KonfiguracjaSesji
+
+
+class KonfiguracjaPamięci(TypedDict):
+    limit: int
+    mnoznik: float
+
+
+class KonfiguracjaWersji(TypedDict):
+    wlaczone: bool
+    limit: int
+
+
+class KonfiguracjaOdświeżania(TypedDict):
+    wlaczone: bool
+    interwal: int
+    wspolbieznosc: int
+    rozrzut: float
+
+
+class KonfiguracjaOgraniczeń(TypedDict):
+    poczatkowy: int
+    minimalny: int
+    maksymalny: int
+    tolerancja: float
+
+
+class KonfiguracjaPonawiania(TypedDict):
+    proby: int
+    opoznienie: float
+    maksymalne: float
+
+
+class KonfiguracjaBezpiecznika(TypedDict):
+    prog: int
+    przerwa: int
+
+
+class KonfiguracjaDublowania(TypedDict):
+    wlaczone: bool
+    percentyl: float
+    budzet: float
+
+
+class KonfiguracjaEpoki(TypedDict):
+    wlaczone: bool
+    interwal: int
+
+
+class KonfiguracjaPrzewidywania(TypedDict):
+    wlaczone: bool
+    interwal: int
+    k: int
+    prog: int
+    odstep: int
+    wspolbieznosc: int
+    szerokosc: int
+    glebokosc: int
+
+
+class KonfiguracjaStrumieniowania(TypedDict):
+    wlaczone: bool
+    fragment: int
+    profile: dict[str, list[str]]
+
+
+class KonfiguracjaPrzetwarzania(TypedDict):
+    silnik: str
+    watki: int
+    fragmenty: int
+    filtry: dict[str, list[str]]
+
+
+class KonfiguracjaOdśmiecania(TypedDict):
+    progi: list[int]
+    zamrozenie: bool
 
 
 class Konfiguracja(TypedDict):
@@ -40,6 +153,18 @@ class Konfiguracja(TypedDict):
     zastepstwa: KonfiguracjaZastępstw
     grupy: list[str]
     skrocone: dict[str, str]
+    pamiec: KonfiguracjaPamięci
+    odswiezanie: KonfiguracjaOdświeżania
+    wersje: KonfiguracjaWersji
+    ograniczenia: KonfiguracjaOgraniczeń
+    ponawianie: KonfiguracjaPonawiania
+    bezpiecznik: KonfiguracjaBezpiecznika
+    dublowanie: KonfiguracjaDublowania
+    epoka: KonfiguracjaEpoki
+    przewidywanie: KonfiguracjaPrzewidywania
+    strumieniowanie: KonfiguracjaStrumieniowania
+    przetwarzanie: KonfiguracjaPrzetwarzania
+    odsmiecanie: KonfiguracjaOdśmiecania
 
 
 # Struktury list oddziałów, nauczycieli i sal
@@ -87,6 +212,28 @@ class LekcjaStandardowa(TypedDict):
 
 Lekcja = LekcjaStandardowa | LekcjaNiestandardowa
 
+class BlokLekcji(TypedDict):
+    przedmioty: list[str]
+    nauczyciel: ElementPlanu
+    sala: ElementPlanu
+    oddzialy: list[ElementPlanu]
+
+BlokKomórki = BlokLekcji | LekcjaNiestandardowa
+
+class WierszPlanu(TypedDict):
+    numer: int
+    godziny: str
+    komorki: list[list[BlokKomórki]]
+
+
+class StrukturaPlanu(TypedDict):
+    nazwa: str | None
+    wygenerowano: str | None
+    data: Data
+    dni: list[str]
+    wiersze: list[WierszPlanu]
+
+
 class WpisPlanu(TypedDict):
     numer: int
     poczatek: str
@@ -105,6 +252,30 @@ class PlanLekcji(TypedDict):
     plan: PlanTygodniowy
 
 
+class OpisWersji(TypedDict):
+    numer: int
+    wygenerowano: str | None
+    obowiazuje: str | None
+    wygasa: str | None
+    zapisano: str
+
+
+class ZmianaPlanu(TypedDict):
+    dzien: str
+    numer: int
+    poczatek: str
+    koniec: str
+    dodane: list[Lekcja]
+    usuniete: list[Lekcja]
+
+
+class RóżnicePlanu(TypedDict):
+    identyfikator: str
+    od: int
+    do: int
+    zmiany: list[ZmianaPlanu]
+
+
 # Struktury zastępstw
 
 class Zastępstwo(TypedDict):
@@ -117,9 +288,139 @@ class Zastępstwo(TypedDict):
     uwagi: str | None
 
 
+class WierszZastępstw(TypedDict):
+    nauczyciel: str | None
+    nauczyciele: set[str]
+    lekcja: str
+    opis: str
+    zastepca: str
+    uwagi: str
+
+
+class StrukturaZastępstw(TypedDict):
+    informacje: str
+    dzien: str | None
+    skrocone: bool
+    wiersze: list[WierszZastępstw]
+
+
 class Zastępstwa(TypedDict):
     identyfikator: str | None
     dzien: str | None
     informacje: str
     skrocone: bool | None
     zastepstwa: list[Zastępstwo]
+
+
+# Struktury pamięci podręcznej
+
+class WpisPamięci(TypedDict):
+    etag: str | None
+    ostatniaModyfikacja: str | None
+    dokument: BeautifulSoup
+    źródło: str | None
+    pobrano: float
+    ttl: float
+    rozmiar: int
+    skrot: str
+    epoka: int
+
+
+class StatystykiPamięci(TypedDict):
+    wpisy: int
+    rozmiar: int
+    limit: int
+    trafienia: int
+    nieaktualne: int
+    chybienia: int
+    usuniecia: int
+
+
+class StatystykiScalania(TypedDict):
+    wToku: int
+    wykonane: int
+    scalone: int
+
+
+class StatystykiOdświeżania(TypedDict):
+    aktywne: bool
+    przejscia: int
+    restarty: int
+    czasTrwania: float | None
+    zakonczono: str | None
+    strony: dict[str, float]
+
+
+class StatystykiOgraniczenia(TypedDict):
+    limit: int
+    wToku: int
+    kolejka: int
+    zapytania: int
+    bledy: int
+    najkrotszyCzas: float | None
+
+
+class StatystykiBezpiecznika(TypedDict):
+    stan: str
+    bledy: int
+    otwarcia: int
+    odrzucone: int
+
+
+class StatystykiDublowania(TypedDict):
+    zapytania: int
+    dublowane: int
+    wygrane: int
+    budzet: float
+
+
+class StatystykiEpoki(TypedDict):
+    numer: int
+    zmiany: int
+    skrot: str | None
+    sprawdzono: str | None
+    zmieniono: str | None
+
+
+class StatystykiHarmonogramu(TypedDict):
+    ttl: float
+    strony: int
+    zmiany: int
+    mnoznik: float
+
+
+class StatystykiPrzewidywania(TypedDict):
+    wykonane: int
+    nieudane: int
+    pominiete: int
+    najczestsze: dict[str, int]
+
+
+class StatystykiPrzetwarzania(TypedDict):
+    silnik: str
+    przetworzone: int
+    strumieniowo: int
+    filtrowane: int
+    przerwane: int
+    pominieteBajty: int
+    niezmienione: int
+    watki: int
+    wTle: int
+
+
+class StatystykiZapamiętywania(TypedDict):
+    dokumenty: int
+    trafienia: int
+    chybienia: int
+    fragmenty: int
+    trafieniaFragmentow: int
+    chybieniaFragmentow: int
+
+
+class StatystykiOdśmiecania(TypedDict):
+    progi: list[int]
+    przebiegi: list[int]
+    zebrane: list[int]
+    zamrozone: int
+    rss: int | None
+    szczyt: int | None
@@ -93,15 +93,64 @@ def wczytajKonfiguracje() -> Konfiguracja:
         "wersja": "0.2.2-custom",
         "plany": {
             "url": "https://plan.zse.bydgoszcz.pl/plany/",
-            "kodowanie": "utf-8"
+            "lustra": [],
+            "kodowanie": "utf-8",
+            "ttl": 900,
+            "okna": [],
+            "mnoznik": 16,
+            "nieaktualne": 3600,
+            "awaryjne": 604800,
+            "sesja": {
+                "polaczenia": 20,
+                "polaczenie": 3,
+                "odczyt": 8,
+                "calkowity": 10
+            }
         },
         "lista": {
             "url": "https://plan.zse.bydgoszcz.pl/lista.html",
-            "kodowanie": "utf-8"
+            "lustra": [],
+            "kodowanie": "utf-8",
+            "ttl": 900,
+            "okna": [],
+            "mnoznik": 1,
+            "nieaktualne": 3600,
+            "awaryjne": 604800,
+            "sesja": {
+                "polaczenia": 4,
+                "polaczenie": 3,
+                "odczyt": 8,
+                "calkowity": 10
+            }
         },
         "zastepstwa": {
             "url": "https://zastepstwa.zse.bydgoszcz.pl",
-            "kodowanie": "iso-8859-2"
+            "lustra": [],
+            "kodowanie": "iso-8859-2",
+            "ttl": 600,
+            "okna": [
+                {
+                    "dni": [0, 1, 2, 3, 4],
+                    "od": "06:00",
+                    "do": "08:00",
+                    "ttl": 30
+                },
+                {
+                    "dni": [0, 1, 2, 3, 4],
+                    "od": "08:00",
+                    "do": "16:00",
+                    "ttl": 60
+                }
+            ],
+            "mnoznik": 2,
+            "nieaktualne": 300,
+            "awaryjne": 86400,
+            "sesja": {
+                "polaczenia": 5,
+                "polaczenie": 3,
+                "odczyt": 8,
+                "calkowity": 10
+            }
         },
         "grupy": [
             "1/3", "2/3", "3/3", "1/2", "2/2", "1/1", "j1", "j2"
@@ -122,6 +171,74 @@ def wczytajKonfiguracje() -> Konfiguracja:
             "12": "14:15-14:45",
             "13": "14:50-15:20",
             "14": "15:25-15:55"
+        },
+        "pamiec": {
+            "limit": 268435456,
+            "mnoznik": 50
+        },
+        "odswiezanie": {
+            "wlaczone": True,
+            "interwal": 30,
+            "wspolbieznosc": 3,
+            "rozrzut": 0.2
+        },
+        "wersje": {
+            "wlaczone": True,
+            "limit": 50
+        },
+        "ograniczenia": {
+            "poczatkowy": 5,
+            "minimalny": 1,
+            "maksymalny": 20,
+            "tolerancja": 2.0
+        },
+        "ponawianie": {
+            "proby": 3,
+            "opoznienie": 0.25,
+            "maksymalne": 2.0
+        },
+        "bezpiecznik": {
+            "prog": 5,
+            "przerwa": 30
+        },
+        "dublowanie": {
+            "wlaczone": True,
+            "percentyl": 0.95,
+            "budzet": 0.05
+        },
+        "epoka": {
+            "wlaczone": True,
+            "interwal": 60
+        },
+        "przewidywanie": {
+            "wlaczone": True,
+            "interwal": 20,
+            "k": 20,
+            "prog": 3,
+            "odstep": 60,
+            "wspolbieznosc": 2,
+            "szerokosc": 1024,
+            "glebokosc": 4
+        },
+        "strumieniowanie": {
+            "wlaczone": True,
+            "fragment": 16384,
+            "profile": {
+                "etykieta": [".tytulnapis"],
+                "tabela": ["table.tabela"]
+            }
+        },
+        "przetwarzanie": {
+            "silnik": "html.parser",
+            "watki": 2,
+            "fragmenty": 4096,
+            "filtry": {
+                "lista": ["a[href]"]
+            }
+        },
+        "odsmiecanie": {
+            "progi": [10000, 10, 10],
+            "zamrozenie": True
         }
     }
 
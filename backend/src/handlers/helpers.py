@@ -10,6 +10,17 @@
 #
 #
 
+# Standardowe biblioteki
+import re
+from urllib.parse import urlparse
+
+# Zewnętrzne biblioteki
+from bs4 import (
+    CData,
+    NavigableString,
+    Tag
+)
+
 # Wewnętrzne importy
 from src.handlers.configuration import konfiguracja
 
@@ -50,3 +61,89 @@ def sprawdźGrupę(
         ]
 
     return not wybraneGrupy or grupa in wybraneGrupy
+
+
+def sprawdźSerwer(
+    url: str | None,
+    źródło: str = "plany"
+) -> bool:
+    """
+    Sprawdza, czy adres strony internetowej wskazuje na serwer główny lub jeden z serwerów lustrzanych źródła danych z pliku konfiguracyjnego.
+
+    Args:
+        url (str | None): Adres strony internetowej.
+        źródło (str): Nazwa źródła danych (`lista`, `plany` lub `zastepstwa`).
+
+    Returns:
+        bool: True jeśli adres wskazuje na serwer źródła danych, False w przeciwnym wypadku.
+    """
+
+    if not url:
+        return False
+
+    ustawienia = konfiguracja.get(źródło, {})
+    adresy = [ustawienia.get("url"), *ustawienia.get("lustra", [])]
+
+    return urlparse(url).netloc in {urlparse(adres).netloc for adres in adresy if adres}
+
+
+def wyodrębnijTekst(węzeł: Tag | str | None) -> str:
+    """
+    Wyodrębnia i normalizuje tekst elementu strony internetowej w jednym przejściu po jego istniejącym drzewie, bez ponownego przetwarzania HTML. Uwzględniany jest wyłącznie tekst strony, bez komentarzy i deklaracji. Znaki końca wiersza z treści strony są pomijane, znaczniki `<br>` zamieniane są na znaki nowej linii, a twarde spacje na zwykłe spacje.
+
+    Args:
+        węzeł (Tag | str | None): Element strony internetowej lub tekst do przetworzenia.
+
+    Returns:
+        str: Oczyszczony i znormalizowany tekst.
+    """
+
+    if not węzeł:
+        return ""
+
+    if isinstance(węzeł, Tag):
+        części: list[str] = []
+
+        for element in (węzeł, *węzeł.descendants):
+            if type(element) is NavigableString or type(element) is CData:
+                części.append(element.replace("\n", "").replace("\r", ""))
+            elif element.name == "br":
+                części.append("\n")
+
+        tekst = "".join(części)
+    else:
+        tekst = węzeł.replace("\n", "").replace("\r", "")
+
+    tekst = tekst.replace("\xa0", " ")
+    tekst = re.sub(r"[ \t]*\n[ \t]*", "\n", tekst)
+    tekst = re.sub(r"[ \t]{2,}", " ", tekst)
+    tekst = re.sub(r"\n{3,}", "\n\n", tekst)
+
+    return tekst.strip("\n ")
+
+
+def zwróćSygnaturę(węzeł: Tag) -> tuple:
+    """
+    Zwraca sygnaturę zawartości elementu strony internetowej (np. komórki tabeli), jednoznacznie opisującą jego znaczniki, ich atrybuty i zagnieżdżenie oraz tekst. Elementy o takiej samej sygnaturze mają taką samą treść HTML, a jej wyznaczenie jest znacznie tańsze od serializacji elementu.
+
+    Args:
+        węzeł (Tag): Element strony internetowej.
+
+    Returns:
+        tuple: Krotka opisująca kolejne elementy zawartości.
+    """
+
+    return tuple(
+        (
+            potomek.name,
+            len(potomek.contents),
+            tuple(
+                (nazwa, tuple(wartość) if isinstance(wartość, list) else wartość)
+                for nazwa, wartość in potomek.attrs.items()
+            )
+        )
+        if isinstance(potomek, Tag)
+        else str(potomek) if type(potomek) is NavigableString
+        else (type(potomek).__name__, str(potomek))
+        for potomek in węzeł.descendants
+    )
@@ -12,50 +12,331 @@
 
 # Standardowe biblioteki
 import asyncio
+import hashlib
+import random
+import time
 
 # Zewnętrzne biblioteki
 import aiohttp
 from bs4 import BeautifulSoup
 
 # Wewnętrzne importy
+from src.classes.atom import Atom
+from src.classes.breaker import bezpiecznik
+from src.classes.cache import pamięć
+from src.classes.flight import scalanie
+from src.classes.hedging import dublowanie
+from src.classes.mirrors import lustra
+from src.classes.parser import analizator
+from src.classes.scheduler import harmonogram
+from src.classes.semaphore import semafor
+from src.handlers.configuration import konfiguracja
 from src.handlers.logging import logowanie
 
-async def pobierzZawartośćStrony(
-    atom: aiohttp.ClientSession,
+def zwróćKlucz(
+    url: str,
+    profil: str | None
+) -> str:
+    """
+    Zwraca klucz, pod którym strona internetowa zapisywana jest w pamięci podręcznej. Strony przetworzone tylko do wymaganych elementów profilu zapisywane są oddzielnie od stron przetworzonych w całości.
+
+    Args:
+        url (str): Adres strony internetowej.
+        profil (str | None): Nazwa profilu przetwarzania strony.
+
+    Returns:
+        str: Klucz strony internetowej w pamięci podręcznej.
+    """
+
+    return url if profil is None else f"{url}#{profil}"
+
+
+async def wykonajZapytanie(
+    atom: Atom,
+    url: str,
+    adres: str,
+    kodowanie: str,
+    profil: str | None = None
+) -> BeautifulSoup:
+    """
+    Wykonuje pojedyncze, w miarę możliwości warunkowe zapytanie o zawartość strony internetowej, przetwarza ją i zapisuje w pamięci podręcznej. Jeśli treść strony nie zmieniła się od ostatniego pobrania, zwracany jest dotychczasowy obiekt dokumentu.
+
+    Args:
+        atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonania zapytania.
+        url (str): Adres strony internetowej na serwerze głównym, pod którym zapisywana jest ona w pamięci podręcznej.
+        adres (str): Adres strony internetowej na serwerze wybranym do wykonania zapytania.
+        kodowanie (str): Kodowanie strony internetowej potrzebne do prawidłowego odczytu jej treści.
+        profil (str | None): Nazwa profilu przetwarzania określającego elementy strony wymagane przez wywołującego.
+
+    Returns:
+        BeautifulSoup: Obiekt BeautifulSoup reprezentujący stronę HTML.
+
+    Raises:
+        asyncio.TimeoutError: Gdy przekroczono czas oczekiwania na odpowiedź serwera.
+        aiohttp.ClientError: Gdy wystąpi błąd połączenia lub serwer zwróci kod błędu.
+    """
+
+    klucz = zwróćKlucz(url, profil)
+    wpis = pamięć.wpisy.get(klucz)
+    źródło = pamięć.zwróćŹródło(url)
+    strumieniowanie, fragment = analizator.zwróćUstawienia()
+
+    async with semafor.ogranicz(adres) as pomiar:
+        async with atom.zwróćSesję(url).get(adres, headers=pamięć.zwróćNagłówki(wpis)) as odpowiedź:
+            if odpowiedź.status == 304 and wpis is not None:
+                pamięć.odnów(klucz, harmonogram.zarejestruj(klucz, wpis["źródło"], wpis["skrot"]))
+                return wpis["dokument"]
+
+            odpowiedź.raise_for_status()
+            etag = odpowiedź.headers.get("ETag")
+            ostatniaModyfikacja = odpowiedź.headers.get("Last-Modified")
+
+            if strumieniowanie and wpis is None:
+                skrót = hashlib.sha1()
+                analiza = analizator.rozpocznij(kodowanie, profil, źródło)
+
+                async for dane in odpowiedź.content.iter_chunked(fragment):
+                    skrót.update(dane)
+                    początek = time.monotonic()
+                    await analizator.wykonaj(analiza.dodaj, dane)
+                    pomiar.pominięte += time.monotonic() - początek
+            else:
+                dane = await odpowiedź.read()
+
+    if strumieniowanie and wpis is None:
+        if analiza.kompletna:
+            analizator.przerwane += 1
+            analizator.pominięte += analiza.pominięte
+
+        dokument = await analizator.wykonaj(analiza.zakończ)
+        rozmiar = analiza.rozmiar
+        skrót = skrót.hexdigest()
+    else:
+        rozmiar = len(dane)
+        skrót = hashlib.sha1(dane).hexdigest()
+
+        if wpis is not None and wpis["skrot"] == skrót:
+            analizator.niezmienione += 1
+            dokument = wpis["dokument"]
+        else:
+            dokument = await analizator.wykonaj(analizator.przetwórz, dane.decode(kodowanie, errors="ignore"), profil, źródło)
+
+    pamięć.zapisz(klucz, {
+        "etag": etag,
+        "ostatniaModyfikacja": ostatniaModyfikacja,
+        "dokument": dokument,
+        "źródło": źródło,
+        "pobrano": time.monotonic(),
+        "ttl": harmonogram.zarejestruj(klucz, źródło, skrót),
+        "rozmiar": pamięć.oszacujRozmiar(rozmiar),
+        "skrot": skrót,
+        "epoka": pamięć.epoka
+    })
+
+    return dokument
+
+
+async def wykonajZapytanieDublowane(
+    atom: Atom,
     url: str,
-    kodowanie: str
+    adres: str,
+    kodowanie: str,
+    profil: str | None = None
+) -> BeautifulSoup:
+    """
+    Wykonuje zapytanie o zawartość strony internetowej, wysyłając drugie, dublujące zapytanie, jeśli serwer nie odpowiedział w czasie odpowiadającym wybranemu percentylowi jego dotychczasowych czasów odpowiedzi. Zwracany jest wynik szybszego z zapytań, a wolniejsze jest anulowane.
+
+    Args:
+        atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonania zapytania.
+        url (str): Adres strony internetowej na serwerze głównym, pod którym zapisywana jest ona w pamięci podręcznej.
+        adres (str): Adres strony internetowej na serwerze wybranym do wykonania zapytania.
+        kodowanie (str): Kodowanie strony internetowej potrzebne do prawidłowego odczytu jej treści.
+        profil (str | None): Nazwa profilu przetwarzania określającego elementy strony wymagane przez wywołującego.
+
+    Returns:
+        BeautifulSoup: Obiekt BeautifulSoup reprezentujący stronę HTML.
+
+    Raises:
+        asyncio.TimeoutError: Gdy przekroczono czas oczekiwania na odpowiedź serwera.
+        aiohttp.ClientError: Gdy wystąpi błąd połączenia lub serwer zwróci kod błędu.
+    """
+
+    próg = dublowanie.zwróćPróg(adres)
+    if próg is None:
+        return await wykonajZapytanie(atom, url, adres, kodowanie, profil)
+
+    pierwsze = asyncio.ensure_future(wykonajZapytanie(atom, url, adres, kodowanie, profil))
+    zadania = {pierwsze}
+
+    try:
+        gotowe, _ = await asyncio.wait(zadania, timeout=próg)
+        if gotowe or not dublowanie.zezwól(adres):
+            return await pierwsze
+
+        drugie = asyncio.ensure_future(wykonajZapytanie(atom, url, adres, kodowanie, profil))
+        zadania.add(drugie)
+
+        while True:
+            gotowe, zadania = await asyncio.wait(zadania, return_when=asyncio.FIRST_COMPLETED)
+
+            udane = [zadanie for zadanie in gotowe if zadanie.exception() is None]
+
+            if udane:
+                if udane[0] is drugie:
+                    dublowanie.wygrane += 1
+                return udane[0].result()
+
+            if not zadania:
+                return gotowe.pop().result()
+    finally:
+        for zadanie in zadania:
+            zadanie.cancel()
+
+
+async def zaktualizujZawartośćStrony(
+    atom: Atom,
+    url: str,
+    kodowanie: str,
+    profil: str | None = None
 ) -> BeautifulSoup | None:
     """
-    Pobiera zawartość strony internetowej.
+    Pobiera zawartość strony internetowej z najszybszego dostępnego serwera spośród serwera głównego i serwerów lustrzanych, ponawiając nieudane zapytania na kolejnym serwerze lub, gdy wszystkie zawiodły, z losowo wydłużanym opóźnieniem. Zapytania do serwerów, których bezpieczniki są otwarte, nie są wykonywane.
 
     Args:
-        atom (aiohttp.ClientSession): Aktywna sesja HTTP używana do wykonania zapytania.
+        atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonania zapytania.
         url (str): Adres strony internetowej przeznaczonej do pobrania.
         kodowanie (str): Kodowanie strony internetowej potrzebne do prawidłowego odczytu jej treści.
+        profil (str | None): Nazwa profilu przetwarzania określającego elementy strony wymagane przez wywołującego.
 
     Returns:
         BeautifulSoup | None: Obiekt BeautifulSoup reprezentujący stronę HTML.
     """
 
-    try:
-        async with atom.get(url) as odpowiedź:
-            odpowiedź.raise_for_status()
-            tekst = await odpowiedź.text(
-                encoding=kodowanie,
-                errors="ignore"
+    ponawianie = konfiguracja.get("ponawianie", {})
+    próby = max(1, int(ponawianie.get("proby", 3)))
+    opóźnienie = float(ponawianie.get("opoznienie", 0.25))
+    maksymalne = float(ponawianie.get("maksymalne", 2.0))
+    pominięte: set[str] = set()
+
+    for próba in range(1, próby + 1):
+        adres = lustra.wybierz(url, pominięte)
+
+        if adres is None:
+            logowanie.warning(
+                f"Bezpieczniki wszystkich serwerów są otwarte. Pomijanie pobierania strony ({url})."
             )
+            return None
+
+        try:
+            dokument = await wykonajZapytanieDublowane(atom, url, adres, kodowanie, profil)
+            bezpiecznik.zgłośSukces(adres)
+            return dokument
+        except asyncio.TimeoutError:
+            bezpiecznik.zgłośBłąd(adres)
+            if próba == próby:
+                logowanie.warning(
+                    f"Przekroczono czas oczekiwania na połączenie ({adres})."
+                )
+        except aiohttp.ClientResponseError as e:
+            if e.status < 500 and e.status != 429:
+                bezpiecznik.zgłośSukces(adres)
+                logowanie.exception(
+                    f"Wystąpił błąd klienta HTTP podczas pobierania strony. Więcej informacji: {e}"
+                )
+                return None
+
+            bezpiecznik.zgłośBłąd(adres)
+            if próba == próby:
+                logowanie.exception(
+                    f"Wystąpił błąd klienta HTTP podczas pobierania strony. Więcej informacji: {e}"
+                )
+        except aiohttp.ClientError as e:
+            bezpiecznik.zgłośBłąd(adres)
+            if próba == próby:
+                logowanie.exception(
+                    f"Wystąpił błąd klienta HTTP podczas pobierania strony. Więcej informacji: {e}"
+                )
+        except Exception as e:
+            bezpiecznik.zgłośBłąd(adres)
+            logowanie.exception(
+                f"Wystąpił błąd podczas pobierania strony. Więcej informacji: {e}"
+            )
+            return None
+
+        pominięte.add(adres)
+
+        if próba < próby and pominięte.issuperset(lustra.zwróćAdresy(url)):
+            pominięte.clear()
+            await asyncio.sleep(random.uniform(0, min(maksymalne, opóźnienie * 2 ** (próba - 1))))
+
+    return None
+
+
+async def odświeżZawartośćStrony(
+    atom: Atom,
+    url: str,
+    kodowanie: str,
+    profil: str | None = None
+) -> BeautifulSoup | None:
+    """
+    Odświeża zawartość strony internetowej w pamięci podręcznej niezależnie od jej świeżości, dołączając do trwającego pobierania tej samej strony, jeśli takie istnieje.
+
+    Args:
+        atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonania zapytania.
+        url (str): Adres strony internetowej przeznaczonej do pobrania.
+        kodowanie (str): Kodowanie strony internetowej potrzebne do prawidłowego odczytu jej treści.
+        profil (str | None): Nazwa profilu przetwarzania określającego elementy strony wymagane przez wywołującego.
+
+    Returns:
+        BeautifulSoup | None: Obiekt BeautifulSoup reprezentujący stronę HTML.
+    """
+
+    return await scalanie.wykonaj(zwróćKlucz(url, profil), lambda: zaktualizujZawartośćStrony(atom, url, kodowanie, profil))
 
-            return BeautifulSoup(tekst, "html.parser")
-    except asyncio.TimeoutError:
+
+async def pobierzZawartośćStrony(
+    atom: Atom,
+    url: str,
+    kodowanie: str,
+    profil: str | None = None
+) -> BeautifulSoup | None:
+    """
+    Pobiera zawartość strony internetowej, korzystając z pamięci podręcznej, w której nieaktualne strony odświeżane są w tle. Jeśli podano profil przetwarzania, zwracana jest świeża strona przetworzona w całości, o ile jest dostępna, a w przeciwnym razie strona przetworzona tylko do elementów wymaganych przez profil.
+
+    Args:
+        atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonania zapytania.
+        url (str): Adres strony internetowej przeznaczonej do pobrania.
+        kodowanie (str): Kodowanie strony internetowej potrzebne do prawidłowego odczytu jej treści.
+        profil (str | None): Nazwa profilu przetwarzania określającego elementy strony wymagane przez wywołującego.
+
+    Returns:
+        BeautifulSoup | None: Obiekt BeautifulSoup reprezentujący stronę HTML.
+    """
+
+    klucz = zwróćKlucz(url, profil)
+
+    if profil is not None:
+        pełny = pamięć.wpisy.get(url)
+
+        if pełny is not None and pamięć.sprawdźŚwieżość(pełny):
+            return pamięć.pobierz(url)["dokument"]
+
+    wpis = pamięć.pobierz(klucz)
+
+    if wpis is not None:
+        if pamięć.sprawdźŚwieżość(wpis):
+            return wpis["dokument"]
+
+        if pamięć.sprawdźPrzydatność(wpis):
+            pamięć.zaplanujOdświeżenie(klucz, lambda: odświeżZawartośćStrony(atom, url, kodowanie, profil))
+            return wpis["dokument"]
+
+    dokument = await odświeżZawartośćStrony(atom, url, kodowanie, profil)
+
+    if dokument is None and wpis is not None and pamięć.sprawdźPrzydatność(wpis, awaryjnie=True):
         logowanie.warning(
-            f"Przekroczono czas oczekiwania na połączenie ({url})."
-        )
-    except aiohttp.ClientError as e:
-        logowanie.exception(
-            f"Wystąpił błąd klienta HTTP podczas pobierania strony. Więcej informacji: {e}"
+            f"Zwracanie nieaktualnej zawartości strony z pamięci podręcznej ({url})."
         )
-    except Exception as e:
-        logowanie.exception(
-            f"Wystąpił błąd podczas pobierania strony. Więcej informacji: {e}"
-        )
-    return None
+        return wpis["dokument"]
+
+    return dokument
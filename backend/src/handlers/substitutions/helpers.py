@@ -11,6 +11,7 @@
 #
 
 # Standardowe biblioteki
+from functools import lru_cache
 import re
 import unicodedata
 
@@ -64,3 +65,42 @@ def zwróćNazwyKluczy(nazwa: str) -> set[str]:
         klucze.add(f"{części[0][0]}{części[-1]}")
 
     return klucze
+
+
+@lru_cache(maxsize=8)
+def zbudujWzorzecOddziałów(oddziały: tuple[str, ...]) -> re.Pattern[str] | None:
+    """
+    Tworzy jedno skompilowane wyrażenie regularne dopasowujące znormalizowaną nazwę któregokolwiek z oddziałów jako osobne słowo. Wyrażenie tworzone jest raz dla każdej wersji listy oddziałów.
+
+    Args:
+        oddziały (tuple[str, ...]): Krotka nazw wszystkich oddziałów.
+
+    Returns:
+        re.Pattern[str] | None: Skompilowane wyrażenie regularne lub None, jeśli lista oddziałów jest pusta.
+    """
+
+    nazwy = sorted({normalizujTekst(oddział) for oddział in oddziały} - {""}, key=lambda nazwa: (-len(nazwa), nazwa))
+
+    if not nazwy:
+        return None
+
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, nazwy)) + r")\b")
+
+
+@lru_cache(maxsize=8)
+def zbudujWzorceOddziałów(oddziały: tuple[str, ...]) -> dict[str, re.Pattern[str]]:
+    """
+    Tworzy skompilowane wyrażenia regularne dopasowujące znormalizowaną nazwę każdego z oddziałów jako osobne słowo, dopuszczając dowolne odstępy pomiędzy jej częściami. Wyrażenia tworzone są raz dla każdej wersji listy oddziałów.
+
+    Args:
+        oddziały (tuple[str, ...]): Krotka nazw wszystkich oddziałów.
+
+    Returns:
+        dict[str, re.Pattern[str]]: Słownik wyrażeń regularnych według nazwy oddziału.
+    """
+
+    return {
+        oddział: re.compile(r"\b" + r"\s*".join(map(re.escape, normalizujTekst(oddział).split())) + r"\b")
+        for oddział in oddziały
+        if normalizujTekst(oddział)
+    }
@@ -11,12 +11,12 @@
 #
 
 # Standardowe biblioteki
+import copy
 import re
 from typing import Iterable
 from datetime import datetime
 
 # Zewnętrzne biblioteki
-import aiohttp
 from bs4 import (
     BeautifulSoup,
     NavigableString,
@@ -24,21 +24,31 @@ from bs4 import (
 )
 
 # Wewnętrzne importy
+from src.classes.atom import Atom
+from src.classes.memo import zapamiętywanie
 from src.classes.types import (
     ListaNauczycieli,
     ListaOddziałów,
+    StrukturaZastępstw,
+    WierszZastępstw,
     Zastępstwa,
     Zastępstwo
 )
+from src.handlers.helpers import (
+    wyodrębnijTekst,
+    zwróćSygnaturę
+)
 from src.handlers.substitutions.helpers import (
     normalizujTekst,
+    zbudujWzorceOddziałów,
+    zbudujWzorzecOddziałów,
     zwróćNazwyKluczy
 )
 from src.handlers.substitutions.resolver import uzupełnijZastępstwa
 from src.handlers.logging import logowanie
 
 async def wyodrębnijZastępstwa(
-    atom: aiohttp.ClientSession,
+    atom: Atom,
     zawartośćStrony: BeautifulSoup | None,
     listaOddziałów: ListaOddziałów | None,
     listaNauczycieli: ListaNauczycieli | None,
@@ -48,10 +58,10 @@ async def wyodrębnijZastępstwa(
     przedmiotyDodatkowe: dict[str, bool] | None
 ) -> Zastępstwa:
     """
-    Wyodrębnia, przetwarza i filtruje dane zastępstw z pliku strony internetowej.
+    Wyodrębnia, przetwarza i filtruje dane zastępstw z pliku strony internetowej. Wiersze zastępstw zapamiętywane są dla obiektu dokumentu, więc strona, której treść nie zmieniła się od ostatniego pobrania, nie jest przetwarzana ponownie, a wybrany oddział lub nauczyciel stosowany jest dopiero do zapamiętanych wierszy.
 
     Args:
-        atom (aiohttp.ClientSession): Aktywna sesja HTTP używana do wykonania zapytania.
+        atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonania zapytania.
         zawartośćStrony (BeautifulSoup | None): Obiekt BeautifulSoup reprezentujący stronę HTML.
         listaOddziałów (ListaOddziałów | None): Słownik wszystkich oddziałów.
         listaNauczycieli (ListaNauczycieli | None): Słownik wszystkich nauczycieli.
@@ -64,48 +74,6 @@ async def wyodrębnijZastępstwa(
         Zastępstwa: Słownik zawierający informacje o zastępstwach.
     """
 
-    def wyczyśćTekst(węzeł: Tag | str | None) -> str:
-        """
-        Czyści i normalizuje zawartość tekstu.
-
-        Args:
-            węzeł (Tag | str | None): Element strony internetowej do przetworzenia.
-
-        Returns:
-            str: Oczyszczony i znormalizowany tekst.
-        """
-
-        if not węzeł:
-            return ""
-
-        tymczasowy = BeautifulSoup(str(węzeł), "html.parser")
-
-        try:
-            for element in tymczasowy.find_all(string=True):
-                if isinstance(element, NavigableString):
-                    element.replace_with(
-                        element.replace("\n", "").replace("\r", "")
-                    )
-
-            for br in tymczasowy.find_all("br"):
-                br.replace_with(NavigableString("\n"))
-
-            for tag in tymczasowy.find_all(True):
-                tag.unwrap()
-        except Exception as e:
-            logowanie.exception(
-                f"Wystąpił błąd podczas rozpakowywania tagów. Więcej informacji: {e}"
-            )
-
-        tekst = tymczasowy.get_text(separator="")
-        tekst = tekst.replace("\r\n", "\n").replace("\r", "\n")
-        tekst = tekst.replace("\xa0", " ")
-        tekst = re.sub(r"[ \t]*\n[ \t]*", "\n", tekst)
-        tekst = re.sub(r"[ \t]{2,}", " ", tekst)
-        tekst = re.sub(r"\n{3,}", "\n\n", tekst)
-
-        return tekst.strip("\n ")
-
     def sprawdźKlasyKomórki(
         komórka: Tag,
         nazwy: Iterable[str]
@@ -148,7 +116,8 @@ async def wyodrębnijZastępstwa(
 
     def sprawdźOddział(
         komórkiWiersza: list[str],
-        wybranyOddział: str | None
+        wybranyOddział: str | None,
+        wzorceOddziałów: dict[str, re.Pattern[str]]
     ) -> bool:
         """
         Sprawdza, czy wiersz HTML (lista wartości z wiersza tabeli) odpowiada wybranemu oddziałowi.
@@ -156,14 +125,16 @@ async def wyodrębnijZastępstwa(
         Args:
             komórkiWiersza (list[str]): Lista wartości z wiersza tabeli (np. lekcja, opis, zastępca, uwagi).
             wybranyOddział (str): Wybrany oddział przeznaczony do dopasowania.
+            wzorceOddziałów (dict[str, re.Pattern[str]]): Słownik wyrażeń regularnych dopasowujących nazwę każdego z oddziałów.
 
         Returns:
             bool: True, jeśli wiersz pasuje do wybranego oddziału, False w przeciwnym razie.
         """
 
         komórki = komórkiWiersza[:]
+        wzorzec = wzorceOddziałów.get(wybranyOddział) if wybranyOddział else None
 
-        if not wybranyOddział:
+        if wzorzec is None:
             return False
 
         if len(komórki) > 1 and komórki[1]:
@@ -174,14 +145,7 @@ async def wyodrębnijZastępstwa(
         tekst = re.sub(r"[\(\)]", " ", tekst)
         tekst = re.sub(r"\s+", " ", tekst)
 
-        znormalizowanyOddział = normalizujTekst(wybranyOddział)
-        części = znormalizowanyOddział.split()
-        wzór = r"\b" + r"\s*".join(map(re.escape, części)) + r"\b"
-
-        if re.search(wzór, tekst):
-            return True
-
-        return False
+        return wzorzec.search(tekst) is not None
 
     def sprawdźNauczyciela(
         wyodrębnieniNauczyciele: set[str],
@@ -228,7 +192,7 @@ async def wyodrębnijZastępstwa(
             komórki = wiersz.find_all("td")
 
             if len(komórki) >= 4:
-                teksty = [wyczyśćTekst(td).lower() for td in komórki[:4]]
+                teksty = [wyodrębnijTekst(td).lower() for td in komórki[:4]]
                 jestPuste = all(tekst == "" or tekst == "&nbsp;" for tekst in teksty)
                 jestNagłówek = set(tekst.strip().lower() for tekst in teksty) <= nagłówki
 
@@ -257,17 +221,18 @@ async def wyodrębnijZastępstwa(
                 if not sprawdźKlasyKomórki(komórka, {nazwaKlasy}):
                     continue
 
-                surowyTekst = wyczyśćTekst(komórka).strip()
+                surowyTekst = wyodrębnijTekst(komórka).strip()
                 if not surowyTekst or surowyTekst == "&nbsp;":
                     continue
 
+                komórka = copy.copy(komórka)
                 link = komórka.find("a")
                 if link and link.get("href"):
-                    tekstLinku = wyczyśćTekst(link)
+                    tekstLinku = wyodrębnijTekst(link)
                     urlLinku = link.get("href")
                     link.replace_with(NavigableString(f"[{tekstLinku}]({urlLinku})"))
 
-                tekst = wyczyśćTekst(komórka)
+                tekst = wyodrębnijTekst(komórka)
                 tekst = re.sub(r"[ \t]+", " ", tekst)
                 tekst = re.sub(r"\n+\[", " [", tekst)
 
@@ -357,42 +322,16 @@ async def wyodrębnijZastępstwa(
 
         return wyodrębnieniNauczyciele
 
-    if zawartośćStrony is None:
-        logowanie.warning(
-            "Brak treści pobranej ze strony. Zwracanie pustej zawartości."
-        )
-        return {
-            "identyfikator": None,
-            "dzien": None,
-            "informacje": "",
-            "skrocone": None,
-            "zastepstwa": []
-        }
+    def wyodrębnijStrukturę() -> StrukturaZastępstw:
+        """
+        Wyodrębnia z obiektu dokumentu informacje dodatkowe oraz przydatne wiersze zastępstw w postaci niezależnej od parametrów filtracji, tak aby mogły zostać zapamiętane i wykorzystane dla dowolnego oddziału lub nauczyciela. Tekst wierszy zapamiętywany jest według ich treści, więc po ponownym opublikowaniu strony przetwarzane są tylko wiersze dodane lub zmienione.
 
-    if not isinstance(listaOddziałów, dict) or not isinstance(listaNauczycieli, dict):
-        logowanie.warning(
-            "Brak listy oddziałów lub listy nauczycieli. Zwracanie pustej zawartości."
-        )
-        return {
-            "identyfikator": None,
-            "dzien": None,
-            "informacje": "",
-            "skrocone": None,
-            "zastepstwa": []
-        }
+        Returns:
+            StrukturaZastępstw: Słownik zawierający informacje dodatkowe, dzień tygodnia, flagę skróconych lekcji oraz wiersze zastępstw.
+        """
 
-    try:
-        identyfikator: str | None = None
         wiersze = zawartośćStrony.find_all("tr")
-        wpisyZastępstw: list[Zastępstwo] = []
-
-        if wybranyOddział and listaOddziałów:
-            dane = listaOddziałów.get(wybranyOddział)
-            identyfikator = dane.get("identyfikator") if dane else None
-
-        elif wybranyNauczyciel and listaNauczycieli:
-            dane = listaNauczycieli.get(wybranyNauczyciel)
-            identyfikator = dane.get("identyfikator") if dane else None
+        wierszeZastępstw: list[WierszZastępstw] = []
 
         informacjeDodatkowe = wyodrębnijInformacje(wiersze, "st0")
         dzień = wyodrębnijDzień(informacjeDodatkowe) if informacjeDodatkowe else None
@@ -412,11 +351,14 @@ async def wyodrębnijZastępstwa(
 
             komórki = wiersz.find_all("td")
             if len(komórki) == 1:
-                aktualnyNauczyciel = wyczyśćTekst(komórki[0])
+                aktualnyNauczyciel = wyodrębnijTekst(komórki[0])
                 continue
 
             if len(komórki) >= 4:
-                teksty = [wyczyśćTekst(komórka) for komórka in komórki[:4]]
+                teksty = zapamiętywanie.pobierzFragment(
+                    ("wiersz", tuple(zwróćSygnaturę(komórka) for komórka in komórki[:4])),
+                    lambda: tuple(wyodrębnijTekst(komórka) for komórka in komórki[:4])
+                )
                 lekcja, opis, zastępca, uwagi = teksty
                 pola = [lekcja, opis, zastępca, uwagi]
                 etykiety = ["Lekcja", "Opis", "Zastępca", "Uwagi"]
@@ -424,52 +366,112 @@ async def wyodrębnijZastępstwa(
                 if not any(sprawdźPrzydatne(wartość, etykieta) for wartość, etykieta in zip(pola, etykiety)):
                     continue
 
-                komórkiWiersza = [lekcja, opis, zastępca, uwagi]
-                dopasowaneDoOddziału = sprawdźOddział(
-                    komórkiWiersza,
-                    wybranyOddział
-                )
-                wyodrębnieniNauczyciele = wyodrębnijNauczycieli(aktualnyNauczyciel, zastępca)
-                dopasowaneDoNauczyciela = sprawdźNauczyciela(
-                    wyodrębnieniNauczyciele,
-                    wybranyNauczyciel
-                )
-                zidentyfikowane: bool = True
-                pełnyTekst = " ".join(komórkiWiersza)
-
-                if listaOddziałów:
-                    znalezionoOddziały = any(
-                        re.search(
-                            r"\b" + re.escape(normalizujTekst(oddział)) + r"\b",
-                            normalizujTekst(pełnyTekst)
-                        )
-                        for oddział in listaOddziałów.keys()
-                    )
-                    zidentyfikowane = znalezionoOddziały
-                else:
-                    if not re.search(r"\d", pełnyTekst):
-                        zidentyfikowane = False
-
-                if (
-                    (not wybranyOddział and not wybranyNauczyciel)
-                    or (wybranyOddział and (dopasowaneDoOddziału or not zidentyfikowane))
-                    or (wybranyNauczyciel and dopasowaneDoNauczyciela)
-                ):
-                    nazwaNauczyciela = aktualnyNauczyciel or ", ".join(wyodrębnieniNauczyciele) or "Nieznany"
-                    wpisyZastępstw.append({
-                        "zidentyfikowane": zidentyfikowane,
-                        "grupa": None,
-                        "nauczyciel": nazwaNauczyciela,
-                        "lekcja": int(lekcja) if sprawdźPrzydatne(lekcja, "Lekcja") else None,
-                        "opis": opis if sprawdźPrzydatne(opis, "Opis") else None,
-                        "zastepca": zastępca if sprawdźPrzydatne(zastępca, "Zastępca") else None,
-                        "uwagi": uwagi if sprawdźPrzydatne(uwagi, "Uwagi") else None
-                    })
+                wierszeZastępstw.append({
+                    "nauczyciel": aktualnyNauczyciel,
+                    "nauczyciele": wyodrębnijNauczycieli(aktualnyNauczyciel, zastępca),
+                    "lekcja": lekcja,
+                    "opis": opis,
+                    "zastepca": zastępca,
+                    "uwagi": uwagi
+                })
 
         if not informacjeDodatkowe and not sprawdźIstnienieZastępstw(wiersze):
             informacjeDodatkowe = wyodrębnijInformacje(wiersze, "st1")
             dzień = None
 
+        return {
+            "informacje": informacjeDodatkowe,
+            "dzien": dzień,
+            "skrocone": skrócone,
+            "wiersze": wierszeZastępstw
+        }
+
+    if zawartośćStrony is None:
+        logowanie.warning(
+            "Brak treści pobranej ze strony. Zwracanie pustej zawartości."
+        )
+        return {
+            "identyfikator": None,
+            "dzien": None,
+            "informacje": "",
+            "skrocone": None,
+            "zastepstwa": []
+        }
+
+    if not isinstance(listaOddziałów, dict) or not isinstance(listaNauczycieli, dict):
+        logowanie.warning(
+            "Brak listy oddziałów lub listy nauczycieli. Zwracanie pustej zawartości."
+        )
+        return {
+            "identyfikator": None,
+            "dzien": None,
+            "informacje": "",
+            "skrocone": None,
+            "zastepstwa": []
+        }
+
+    try:
+        identyfikator: str | None = None
+        wpisyZastępstw: list[Zastępstwo] = []
+
+        if wybranyOddział and listaOddziałów:
+            dane = listaOddziałów.get(wybranyOddział)
+            identyfikator = dane.get("identyfikator") if dane else None
+
+        elif wybranyNauczyciel and listaNauczycieli:
+            dane = listaNauczycieli.get(wybranyNauczyciel)
+            identyfikator = dane.get("identyfikator") if dane else None
+
+        struktura = await zapamiętywanie.pobierzWTle(zawartośćStrony, ("zastepstwa",), wyodrębnijStrukturę)
+        informacjeDodatkowe = struktura["informacje"]
+        dzień = struktura["dzien"]
+        skrócone = struktura["skrocone"]
+
+        wzorzecOddziałów = zbudujWzorzecOddziałów(tuple(listaOddziałów)) if listaOddziałów else None
+        wzorceOddziałów = zbudujWzorceOddziałów(tuple(listaOddziałów)) if listaOddziałów else {}
+        for wiersz in struktura["wiersze"]:
+            aktualnyNauczyciel = wiersz["nauczyciel"]
+            lekcja = wiersz["lekcja"]
+            opis = wiersz["opis"]
+            zastępca = wiersz["zastepca"]
+            uwagi = wiersz["uwagi"]
+
+            komórkiWiersza = [lekcja, opis, zastępca, uwagi]
+            dopasowaneDoOddziału = sprawdźOddział(
+                komórkiWiersza,
+                wybranyOddział,
+                wzorceOddziałów
+            )
+            wyodrębnieniNauczyciele = wiersz["nauczyciele"]
+            dopasowaneDoNauczyciela = sprawdźNauczyciela(
+                wyodrębnieniNauczyciele,
+                wybranyNauczyciel
+            )
+            zidentyfikowane: bool = True
+            pełnyTekst = " ".join(komórkiWiersza)
+
+            if wzorzecOddziałów is not None:
+                zidentyfikowane = wzorzecOddziałów.search(normalizujTekst(pełnyTekst)) is not None
+            else:
+                if not re.search(r"\d", pełnyTekst):
+                    zidentyfikowane = False
+
+            if (
+                (not wybranyOddział and not wybranyNauczyciel)
+                or (wybranyOddział and (dopasowaneDoOddziału or not zidentyfikowane))
+                or (wybranyNauczyciel and dopasowaneDoNauczyciela)
+            ):
+                nazwaNauczyciela = aktualnyNauczyciel or ", ".join(wyodrębnieniNauczyciele) or "Nieznany"
+                wpisyZastępstw.append({
+                    "zidentyfikowane": zidentyfikowane,
+                    "grupa": None,
+                    "nauczyciel": nazwaNauczyciela,
+                    "lekcja": int(lekcja) if sprawdźPrzydatne(lekcja, "Lekcja") else None,
+                    "opis": opis if sprawdźPrzydatne(opis, "Opis") else None,
+                    "zastepca": zastępca if sprawdźPrzydatne(zastępca, "Zastępca") else None,
+                    "uwagi": uwagi if sprawdźPrzydatne(uwagi, "Uwagi") else None
+                })
+
         if wybranyOddział and wpisyZastępstw and identyfikator and dzień:
             wpisyZastępstw = await uzupełnijZastępstwa(atom, wpisyZastępstw, identyfikator, dzień, listaOddziałów, grupy, przedmiotyDodatkowe)
 
@@ -13,11 +13,10 @@
 # Standardowe biblioteki
 import re
 
-# Zewnętrzne biblioteki
-import aiohttp
-
 # Wewnętrzne importy
-from src.classes.semaphore import semafor
+from src.classes.atom import Atom
+from src.classes.cache import pamięć
+from src.classes.memo import zapamiętywanie
 from src.classes.types import (
     ListaOddziałów,
     Zastępstwo
@@ -30,7 +29,7 @@ from src.handlers.substitutions.helpers import zwróćNazwyKluczy
 from src.handlers.timetables.parser import wyodrębnijPlanLekcji
 
 async def uzupełnijZastępstwa(
-    atom: aiohttp.ClientSession,
+    atom: Atom,
     wpisyZastępstw: list[Zastępstwo],
     identyfikator: str,
     dzień: str,
@@ -39,10 +38,10 @@ async def uzupełnijZastępstwa(
     przedmiotyDodatkowe: dict[str, bool] | None
 ) -> list[Zastępstwo]:
     """
-    Uzupełnia niezidentyfikowane wpisy zastępstw i przetwarza zastępstwa z wybranymi grupami dla konkretnego oddziału, na podstawie jego planu lekcji oraz planu lekcji nauczyciela.
+    Uzupełnia niezidentyfikowane wpisy zastępstw i przetwarza zastępstwa z wybranymi grupami dla konkretnego oddziału, na podstawie jego planu lekcji oraz planu lekcji nauczyciela. Wyniki dopasowania zapamiętywane są dla planu lekcji oddziału, więc po zmianie strony zastępstw dopasowywane są tylko wpisy nowe lub zmienione, a plan lekcji oddziału przetwarzany jest tylko wtedy, gdy takie wpisy istnieją, i wyłącznie dla dnia zastępstw. Wynik dopasowania nie jest zapamiętywany, jeśli nie udało się pobrać któregoś z planów lekcji nauczycieli.
 
     Args:
-        atom (aiohttp.ClientSession): Aktywna sesja HTTP używana do wykonania zapytania.
+        atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonania zapytania.
         wpisyZastępstw (list[Zastępstwo]): Lista wpisów zastępstw.
         identyfikator (str): Identyfikator oddziału.
         dzień (str): Dzień tygodnia, na który wpisane są zastępstwa.
@@ -66,8 +65,7 @@ async def uzupełnijZastępstwa(
             return wpisyZastępstw
 
         url = f"{katalog}{identyfikator}.html"
-        async with semafor:
-            zawartośćPlanuOddziału = await pobierzZawartośćStrony(atom, url, kodowanie)
+        zawartośćPlanuOddziału = await pobierzZawartośćStrony(atom, url, kodowanie)
 
         if zawartośćPlanuOddziału is None:
             logowanie.warning(
@@ -75,16 +73,19 @@ async def uzupełnijZastępstwa(
             )
             return wpisyZastępstw
 
-        planLekcjiOddziału = await wyodrębnijPlanLekcji(atom, zawartośćPlanuOddziału, listaOddziałów, None, grupy, przedmiotyDodatkowe, url)
-        if not planLekcjiOddziału:
-            logowanie.warning(
-                "Brak planu lekcji oddziału. Zwracanie nieuzupełnionej zawartości."
-            )
-            return wpisyZastępstw
-
-        tymczasowy: dict[str, set[str] | None] = {}
-        planWszystkichDni = planLekcjiOddziału.get("plan", {})
-        planDnia = planWszystkichDni.get(dzień, [])
+        rozwiązania = zapamiętywanie.pobierz(
+            zawartośćPlanuOddziału,
+            (
+                "rozwiazania",
+                dzień,
+                tuple(grupy) if grupy is not None else None,
+                tuple(sorted(przedmiotyDodatkowe.items())) if przedmiotyDodatkowe is not None else None,
+                pamięć.epoka
+            ),
+            dict
+        )
+        zapamiętane: list[tuple[Zastępstwo, dict]] = []
+        oczekujące: list[tuple[Zastępstwo, tuple, int]] = []
 
         for wpis in wpisyZastępstw:
             surowyOpis = wpis.get("opis")
@@ -100,6 +101,34 @@ async def uzupełnijZastępstwa(
             except ValueError:
                 continue
 
+            klucz = (wpis.get("nauczyciel"), wpis["lekcja"], surowyOpis, wpis.get("zidentyfikowane"))
+
+            if klucz in rozwiązania:
+                zapamiętane.append((wpis, rozwiązania[klucz]))
+            else:
+                oczekujące.append((wpis, klucz, numerLekcji))
+
+        if oczekujące:
+            planLekcjiOddziału = await wyodrębnijPlanLekcji(atom, zawartośćPlanuOddziału, listaOddziałów, None, grupy, przedmiotyDodatkowe, url, [dzień])
+            if not planLekcjiOddziału:
+                logowanie.warning(
+                    "Brak planu lekcji oddziału. Zwracanie nieuzupełnionej zawartości."
+                )
+                return wpisyZastępstw
+        else:
+            planLekcjiOddziału = {}
+
+        for wpis, zmiany in zapamiętane:
+            wpis.update(zmiany)
+
+        tymczasowy: dict[str, set[str] | None] = {}
+        planWszystkichDni = planLekcjiOddziału.get("plan", {})
+        planDnia = planWszystkichDni.get(dzień, [])
+
+        for wpis, klucz, numerLekcji in oczekujące:
+            surowyOpis = wpis.get("opis")
+            zmiany = {}
+            niepełne = False
             kluczeZastępstwa = zwróćNazwyKluczy(wpis.get("nauczyciel"))
 
             for godzina in planDnia:
@@ -115,8 +144,7 @@ async def uzupełnijZastępstwa(
                         continue
 
                     if urlPlanu not in tymczasowy:
-                        async with semafor:
-                            zawartośćPlanuNauczyciela = await pobierzZawartośćStrony(atom, urlPlanu, kodowanie)
+                        zawartośćPlanuNauczyciela = await pobierzZawartośćStrony(atom, urlPlanu, kodowanie, "etykieta")
 
                         if zawartośćPlanuNauczyciela is None:
                             tymczasowy[urlPlanu] = None
@@ -124,13 +152,17 @@ async def uzupełnijZastępstwa(
                             etykietaPlanu = zawartośćPlanuNauczyciela.select_one(".tytulnapis")
 
                             if not etykietaPlanu:
-                                tymczasowy[urlPlanu] = None
+                                tymczasowy[urlPlanu] = set()
                             else:
                                 nauczyciel = etykietaPlanu.get_text(strip=True)
                                 nauczyciel = re.sub(r"\s*\([^)]*\)\s*$", "", nauczyciel).strip()
                                 tymczasowy[urlPlanu] = zwróćNazwyKluczy(nauczyciel)
 
                     kluczePlanu = tymczasowy.get(urlPlanu)
+                    if kluczePlanu is None:
+                        niepełne = True
+                        continue
+
                     if not kluczePlanu:
                         continue
 
@@ -143,8 +175,7 @@ async def uzupełnijZastępstwa(
                             if not sprawdźGrupę(grupa, grupy):
                                 continue
 
-                            wpis["grupa"] = grupa
-                            wpis["zidentyfikowane"] = True
+                            zmiany = {"grupa": grupa, "zidentyfikowane": True}
                             break
 
                         if not grupa:
@@ -157,13 +188,17 @@ async def uzupełnijZastępstwa(
                         if not sprawdźGrupę(grupa, grupy):
                             continue
 
-                        wpis["grupa"] = grupa
-                        wpis["zidentyfikowane"] = True
+                        zmiany = {"grupa": grupa, "zidentyfikowane": True}
                         break
 
-                if wpis.get("zidentyfikowane"):
+                if zmiany or wpis.get("zidentyfikowane"):
                     break
 
+            wpis.update(zmiany)
+
+            if zmiany or not niepełne:
+                rozwiązania[klucz] = zmiany
+
         wynik = []
 
         for wpis in wpisyZastępstw:
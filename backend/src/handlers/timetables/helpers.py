@@ -11,7 +11,14 @@
 #
 
 # Standardowe biblioteki
-from urllib.parse import urlparse
+from functools import lru_cache
+from urllib.parse import (
+    urljoin,
+    urlparse
+)
+
+# Zewnętrzne biblioteki
+from bs4 import Tag
 
 # Wewnętrzne importy
 from src.classes.types import ElementPlanu
@@ -39,6 +46,26 @@ def wydobądźIdentyfikator(url: str | None) -> str | None:
     return None
 
 
+@lru_cache(maxsize=1024)
+def zbudujAdresElementu(
+    katalog: str,
+    href: str
+) -> tuple[str, str | None]:
+    """
+    Zwraca pełny adres strony internetowej i identyfikator oddziału, nauczyciela lub sali na podstawie odnośnika z komórki planu lekcji. Wyniki zapamiętywane są między stronami, ponieważ te same odnośniki powtarzają się w planach lekcji oddziałów, nauczycieli i sal.
+
+    Args:
+        katalog (str): Adres katalogu planów lekcji z pliku konfiguracyjnego.
+        href (str): Odnośnik znajdujący się w komórce planu lekcji.
+
+    Returns:
+        tuple[str, str | None]: Krotka pełnego adresu strony internetowej i identyfikatora planu lekcji.
+    """
+
+    url = urljoin(katalog, href)
+    return url, wydobądźIdentyfikator(url)
+
+
 def zwróćPustySłownik() -> ElementPlanu:
     """
     Zwraca pusty słownik danych wykorzystywany jako reprezentacja elementu.
@@ -52,3 +79,70 @@ def zwróćPustySłownik() -> ElementPlanu:
         "url": None,
         "identyfikator": None
     }
+
+
+def podzielKomórkę(td: Tag) -> list[list[Tag | str]]:
+    """
+    Dzieli zawartość komórki tabeli na logiczne bloki oddzielone znacznikami `<br>`.
+
+    Args:
+        td (Tag): Znacznik `<td>` reprezentujący pojedynczą komórkę planu lekcji.
+
+    Returns:
+        list[list[Tag | str]]: Lista bloków, gdzie każdy blok jest listą elementów HTML lub tekstu.
+    """
+
+    bloki: list[list[Tag | str]] = []
+    aktualny: list[Tag | str] = []
+
+    for element in td.children:
+        if getattr(element, "name", None) == "br":
+            if aktualny:
+                bloki.append(aktualny)
+                aktualny = []
+
+            continue
+
+        if isinstance(element, str) and not element.strip():
+            continue
+
+        aktualny.append(element)
+
+    if aktualny:
+        bloki.append(aktualny)
+
+    return bloki
+
+
+def sklasyfikujBlok(blok: list[Tag | str]) -> dict[str, list[Tag]]:
+    """
+    Grupuje etykiety przedmiotów, nauczycieli, sal i oddziałów bloku komórki według ich klas w jednym przejściu po istniejących elementach, bez ponownego przetwarzania HTML bloku.
+
+    Args:
+        blok (list[Tag | str]): Blok komórki będący listą elementów HTML lub tekstu.
+
+    Returns:
+        dict[str, list[Tag]]: Słownik etykiet bloku pogrupowanych według klasy (`p`, `n`, `s`, `o`) w kolejności ich występowania.
+    """
+
+    etykiety: dict[str, list[Tag]] = {
+        "p": [],
+        "n": [],
+        "s": [],
+        "o": []
+    }
+
+    for element in blok:
+        if not isinstance(element, Tag):
+            continue
+
+        for węzeł in (element, *element.find_all(True)):
+            klasy = węzeł.get("class")
+            if not klasy:
+                continue
+
+            for klasa, lista in etykiety.items():
+                if klasa in klasy:
+                    lista.append(węzeł)
+
+    return etykiety
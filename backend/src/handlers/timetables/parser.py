@@ -12,56 +12,66 @@
 
 # Standardowe biblioteki
 import asyncio
-from urllib.parse import (
-    urljoin,
-    urlparse
-)
 
 # Zewnętrzne biblioteki
-import aiohttp
 from bs4 import (
     BeautifulSoup,
     Tag
 )
 
 # Wewnętrzne importy
+from src.classes.atom import Atom
+from src.classes.memo import zapamiętywanie
 from src.classes.types import (
+    BlokKomórki,
+    BlokLekcji,
     ElementPlanu,
     Lekcja,
     LekcjaStandardowa,
     LekcjaNiestandardowa,
     ListaOddziałów,
-    PlanLekcji
+    PlanLekcji,
+    StrukturaPlanu,
+    WierszPlanu
 )
 from src.handlers.configuration import konfiguracja
-from src.handlers.helpers import sprawdźGrupę
+from src.handlers.helpers import (
+    sprawdźGrupę,
+    sprawdźSerwer,
+    zwróćSygnaturę
+)
 from src.handlers.logging import logowanie
 from src.handlers.timetables.helpers import (
+    podzielKomórkę,
+    sklasyfikujBlok,
     wydobądźIdentyfikator,
+    zbudujAdresElementu,
     zwróćPustySłownik
 )
 from src.handlers.timetables.resolver import uzupełnijNauczyciela
 
 async def wyodrębnijPlanLekcji(
-    atom: aiohttp.ClientSession,
+    atom: Atom,
     zawartośćStrony: BeautifulSoup | None,
     listaOddziałów: ListaOddziałów | None,
     dzieńSkróconych: str | None,
     grupy: list[str] | None,
     przedmiotyDodatkowe: dict[str, bool] | None,
-    url: str | None
+    url: str | None,
+    dni: list[str] | None
 ) -> PlanLekcji | None:
     """
-    Wyodrębnia, przetwarza i strukturyzuje dane planu lekcji z pliku strony internetowej.
+    Wyodrębnia, przetwarza i strukturyzuje dane planu lekcji z pliku strony internetowej. Struktura tabeli planu lekcji zapamiętywana jest dla obiektu dokumentu, więc strona, której treść nie zmieniła się od ostatniego pobrania, nie jest przetwarzana ponownie, a grupy, przedmioty dodatkowe oraz dzień skróconych lekcji stosowane są dopiero do zapamiętanej struktury. Jeśli podano dni tygodnia, przetwarzane są wyłącznie ich kolumny tabeli i tylko dla nich uzupełniani są brakujący nauczyciele.
 
     Args:
-        atom (aiohttp.ClientSession): Aktywna sesja HTTP używana do wykonania zapytania.
+        atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonania zapytania.
         zawartośćStrony (BeautifulSoup | None): Obiekt BeautifulSoup reprezentujący stronę HTML.
         listaOddziałów (ListaOddziałów | None): Słownik wszystkich oddziałów.
         dzieńSkróconych (str | None): Dzień tygodnia, dla którego obowiązuje skrócony rozkład zajęć.
         grupy (list[str] | None): Lista oznaczeń określających grupę przedmiotów.
         przedmiotyDodatkowe (dict[str, bool] | None): Słownik przedmiotów dodatkowych przeznaczonych do filtracji.
         url (str | None): Adres strony internetowej planu lekcji użyty do pobrania jej zawartości.
+        dni (list[str] | None): Lista dni tygodnia, które mają znaleźć się w planie lekcji, bez względu na wielkość liter. Wszystkie dni tygodnia, jeśli nie podano.
 
     Returns:
         PlanLekcji | None: Słownik zawierający ustrukturyzowany plan lekcji.
@@ -125,113 +135,87 @@ async def wyodrębnijPlanLekcji(
         return element
 
     def wydobądźElementy(
-        fragment: BeautifulSoup,
-        url: str | None
+        etykiety: dict[str, list[Tag]],
+        katalog: str | None
     ) -> tuple[ElementPlanu, ElementPlanu, list[ElementPlanu]]:
         """
-        Wyodrębnia informacje o nauczycielu, sali oraz oddziałach z fragmentu HTML.
+        Wyodrębnia informacje o nauczycielu, sali oraz oddziałach z etykiet bloku komórki.
 
         Args:
-            fragment (BeautifulSoup): Fragment obiektu BeautifulSoup reprezentującego strukturę HTML zawierający dane pojedynczej lekcji.
-            url (str | None): Adres strony internetowej planu lekcji użyty do pobrania jej zawartości.
+            etykiety (dict[str, list[Tag]]): Słownik etykiet bloku komórki pogrupowanych według klasy (`p`, `n`, `s`, `o`).
+            katalog (str | None): Adres katalogu planów lekcji lub None, jeśli adres strony planu lekcji nie wskazuje na serwer źródła danych.
 
         Returns:
             tuple[ElementPlanu, ElementPlanu, list[ElementPlanu]]: Krotka słowników nauczyciela, sali i oddziałów.
         """
 
-        katalog = konfiguracja.get("plany", {}).get("url")
         nauczyciel = zwróćPustySłownik()
         sala = zwróćPustySłownik()
         oddziały: list[ElementPlanu] = []
 
-        if not katalog or not url or urlparse(url).netloc != urlparse(katalog).netloc:
-            logowanie.warning(
-                "Otrzymany URL nie zgadza się z wartością URL znajdującego się w pliku konfiguracyjnym. Zwracanie nieuzupełnionych elementów."
-            )
+        if not katalog:
             return nauczyciel, sala, oddziały
 
-        for etykietaOddziału in fragment.select(".o"):
+        for etykietaOddziału in etykiety["o"]:
             hrefOddziału = etykietaOddziału.get("href")
-            urlOddziału = urljoin(katalog, hrefOddziału) if katalog and hrefOddziału else None
+            urlOddziału, identyfikatorOddziału = zbudujAdresElementu(katalog, hrefOddziału) if hrefOddziału else (None, None)
 
             oddziały.append({
                 "tekst": normalizujElementy(etykietaOddziału),
                 "url": urlOddziału,
-                "identyfikator": wydobądźIdentyfikator(urlOddziału)
+                "identyfikator": identyfikatorOddziału
             })
 
-        etykietaNauczyciela = fragment.select_one(".n")
-        if etykietaNauczyciela:
+        if etykiety["n"]:
+            etykietaNauczyciela = etykiety["n"][0]
             hrefNauczyciela = etykietaNauczyciela.get("href")
-            urlNauczyciela = urljoin(katalog, hrefNauczyciela) if katalog and hrefNauczyciela else None
+            urlNauczyciela, identyfikatorNauczyciela = zbudujAdresElementu(katalog, hrefNauczyciela) if hrefNauczyciela else (None, None)
 
             nauczyciel = {
                 "tekst": etykietaNauczyciela.get_text(strip=True),
                 "url": urlNauczyciela,
-                "identyfikator": wydobądźIdentyfikator(urlNauczyciela)
+                "identyfikator": identyfikatorNauczyciela
             }
 
-        etykietaSali = fragment.select_one(".s")
-        if etykietaSali:
+        if etykiety["s"]:
+            etykietaSali = etykiety["s"][0]
             hrefSali = etykietaSali.get("href")
-            urlSali = urljoin(katalog, hrefSali) if katalog and hrefSali else None
+            urlSali, identyfikatorSali = zbudujAdresElementu(katalog, hrefSali) if hrefSali else (None, None)
 
             sala = {
                 "tekst": etykietaSali.get_text(strip=True),
                 "url": urlSali,
-                "identyfikator": wydobądźIdentyfikator(urlSali)
+                "identyfikator": identyfikatorSali
             }
 
         return nauczyciel, sala, oddziały
 
-    def podzielKomórkę(td: Tag) -> list[list[Tag | str]]:
-        """
-        Dzieli zawartość komórki tabeli na logiczne bloki oddzielone znacznikami `<br>`.
-
-        Args:
-            td (Tag): Znacznik `<td>` reprezentujący pojedynczą komórkę planu lekcji.
-
-        Returns:
-            list[list[Tag | str]]: Lista bloków, gdzie każdy blok jest listą elementów HTML lub tekstu.
-        """
-
-        bloki: list[list[Tag | str]] = []
-        aktualny: list[Tag | str] = []
-
-        for element in td.children:
-            if getattr(element, "name", None) == "br":
-                if aktualny:
-                    bloki.append(aktualny)
-                    aktualny = []
-
-                continue
-
-            if isinstance(element, str) and not element.strip():
-                continue
-
-            aktualny.append(element)
-
-        if aktualny:
-            bloki.append(aktualny)
-
-        return bloki
-
-    def rozpoznajLekcję(fragment: BeautifulSoup) -> LekcjaNiestandardowa | None:
+    def rozpoznajLekcję(
+        blok: list[Tag | str],
+        etykiety: dict[str, list[Tag]]
+    ) -> LekcjaNiestandardowa | None:
         """
         Rozpoznaje niestandardową lekcję, która nie zawiera oznaczeń przedmiotu.
 
         Args:
-            fragment (BeautifulSoup): Fragment obiektu BeautifulSoup reprezentującego strukturę HTML zawierający dane pojedynczego bloku komórki.
+            blok (list[Tag | str]): Blok komórki będący listą elementów HTML lub tekstu.
+            etykiety (dict[str, list[Tag]]): Słownik etykiet bloku komórki pogrupowanych według klasy (`p`, `n`, `s`, `o`).
 
         Returns:
-            LekcjaNiestandardowa | None: Słownik opisujący lekcję niestandardową, jeśli fragment ją reprezentuje.
+            LekcjaNiestandardowa | None: Słownik opisujący lekcję niestandardową, jeśli blok ją reprezentuje.
         """
 
-        etykietyPrzedmiotu = fragment.select(".p")
-        if etykietyPrzedmiotu:
+        if etykiety["p"]:
             return None
 
-        tekst = fragment.get_text(" ", strip=True)
+        tekst = " ".join(
+            część
+            for część in (
+                element.get_text(" ", strip=True) if isinstance(element, Tag) else element.strip()
+                for element in blok
+            )
+            if część
+        )
         if not tekst:
             return None
 
@@ -240,19 +224,19 @@ async def wyodrębnijPlanLekcji(
             "tekst": tekst
         }
 
-    def pobierzPrzedmioty(fragment: BeautifulSoup) -> list[str]:
+    def pobierzPrzedmioty(etykiety: dict[str, list[Tag]]) -> list[str]:
         """
-        Wyodrębnia i normalizuje listę przedmiotów z fragmentu lekcji.
+        Wyodrębnia i normalizuje listę przedmiotów z etykiet bloku komórki.
 
         Args:
-            fragment (BeautifulSoup): Fragment obiektu BeautifulSoup reprezentującego strukturę HTML zawierający dane pojedynczej lekcji.
+            etykiety (dict[str, list[Tag]]): Słownik etykiet bloku komórki pogrupowanych według klasy (`p`, `n`, `s`, `o`).
 
         Returns:
             list[str]: Lista znormalizowanych nazw przedmiotów.
         """
 
         przedmioty = []
-        for etykieta in fragment.select(".p"):
+        for etykieta in etykiety["p"]:
             nazwa = normalizujElementy(etykieta)
 
             if nazwa:
@@ -286,21 +270,20 @@ async def wyodrębnijPlanLekcji(
         )
 
     def sparsujLekcje(
-        fragment: BeautifulSoup,
+        blok: BlokLekcji,
         dzień: str,
         numer: int,
         nazwa: str | None,
         rozwinięciaOddziałów: set[str],
         potrzebniNauczyciele: set[tuple[str | None, str, int]],
         grupy: list[str] | None,
-        przedmiotyDodatkowe: dict[str, bool] | None,
-        url: str | None
+        przedmiotyDodatkowe: dict[str, bool] | None
     ) -> list[LekcjaStandardowa]:
         """
-        Parsuje standardowe lekcje z fragmentu komórki planu lekcji.
+        Parsuje standardowe lekcje z bloku komórki planu lekcji, filtrując przedmioty według grup i przedmiotów dodatkowych.
 
         Args:
-            fragment (BeautifulSoup): Fragment obiektu BeautifulSoup reprezentującego strukturę HTML zawierający dane pojedynczego bloku komórki.
+            blok (BlokLekcji): Słownik przedmiotów, nauczyciela, sali oraz oddziałów wyodrębnionych z bloku komórki.
             dzień (str): Dzień tygodnia, dla którego przetwarzana jest lekcja.
             numer (int): Numer lekcji w danym dniu tygodnia.
             nazwa (str | None): Nazwa aktualnie przetwarzanego planu lekcji.
@@ -308,18 +291,18 @@ async def wyodrębnijPlanLekcji(
             potrzebniNauczyciele (set[tuple[str | None, str, int]]): Zbiór lekcji, dla których należy uzupełnić dane nauczyciela.
             grupy (list[str] | None): Lista oznaczeń określających grupę przedmiotów.
             przedmiotyDodatkowe (dict[str, bool] | None): Słownik przedmiotów dodatkowych przeznaczonych do filtracji.
-            url (str | None): Adres strony internetowej planu lekcji użyty do pobrania jej zawartości.
 
         Returns:
             list[LekcjaStandardowa]: Lista słowników opisujących lekcje standardowe.
         """
 
         lekcje: list[LekcjaStandardowa] = []
-        nauczyciel, sala, oddziały = wydobądźElementy(fragment, url)
-        przedmioty = pobierzPrzedmioty(fragment)
+        nauczyciel = dict(blok["nauczyciel"])
+        sala = dict(blok["sala"])
+        oddziały = [dict(oddział) for oddział in blok["oddzialy"]]
         aktywnaLekcja: LekcjaStandardowa | None = None
 
-        for przedmiot in przedmioty:
+        for przedmiot in blok["przedmioty"]:
             if przedmiot.startswith("#"):
                 if aktywnaLekcja is not None:
                     aktywnaLekcja["przedmiot"] += f" {przedmiot}"
@@ -359,22 +342,71 @@ async def wyodrębnijPlanLekcji(
 
         return lekcje
 
-    def wyczyśćKomórkę(
+    def przetwórzKomórkę(
         td: Tag,
+        katalog: str | None
+    ) -> list[BlokKomórki]:
+        """
+        Dzieli komórkę tabeli planu lekcji na bloki i wyodrębnia z nich przedmioty, nauczyciela, salę oraz oddziały, niezależnie od parametrów filtracji.
+
+        Args:
+            td (Tag): Znacznik `<td>` reprezentujący pojedynczą komórkę planu lekcji.
+            katalog (str | None): Adres katalogu planów lekcji lub None, jeśli adres strony planu lekcji nie wskazuje na serwer źródła danych.
+
+        Returns:
+            list[BlokKomórki]: Lista bloków komórki, z których każdy jest lekcją niestandardową lub blokiem lekcji standardowych.
+        """
+
+        wynik: list[BlokKomórki] = []
+        bloki = podzielKomórkę(td)
+
+        if not bloki:
+            tekst = td.get_text(" ", strip=True)
+
+            if tekst:
+                return [{
+                    "standard": False,
+                    "tekst": tekst
+                }]
+
+            return []
+
+        for blok in bloki:
+            etykiety = sklasyfikujBlok(blok)
+
+            niestandardowa = rozpoznajLekcję(blok, etykiety)
+            if niestandardowa:
+                wynik.append(niestandardowa)
+                continue
+
+            nauczyciel, sala, oddziały = wydobądźElementy(etykiety, katalog)
+            przedmioty = pobierzPrzedmioty(etykiety)
+
+            if przedmioty:
+                wynik.append({
+                    "przedmioty": przedmioty,
+                    "nauczyciel": nauczyciel,
+                    "sala": sala,
+                    "oddzialy": oddziały
+                })
+
+        return wynik
+
+    def wyczyśćKomórkę(
+        bloki: list[BlokKomórki],
         dzień: str,
         numer: int,
         nazwa: str | None,
         rozwinięciaOddziałów: set[str],
         potrzebniNauczyciele: set[tuple[str | None, str, int]],
         grupy: list[str] | None,
-        przedmiotyDodatkowe: dict[str, bool] | None,
-        url: str | None
+        przedmiotyDodatkowe: dict[str, bool] | None
     ) -> list[Lekcja]:
         """
-        Czyści, interpretuje i strukturyzuje zawartość pojedynczej komórki tabeli planu lekcji.
+        Interpretuje i strukturyzuje bloki pojedynczej komórki tabeli planu lekcji zgodnie z parametrami filtracji.
 
         Args:
-            td (Tag): Znacznik `<td>` reprezentujący pojedynczą komórkę planu lekcji.
+            bloki (list[BlokKomórki]): Lista bloków komórki wyodrębnionych z tabeli planu lekcji.
             dzień (str): Dzień tygodnia, dla którego przetwarzana jest komórka.
             numer (int): Numer lekcji w danym dniu tygodnia.
             nazwa (str | None): Nazwa aktualnie przetwarzanego planu lekcji.
@@ -382,59 +414,32 @@ async def wyodrębnijPlanLekcji(
             potrzebniNauczyciele (set[tuple[str | None, str, int]]): Zbiór lekcji, dla których należy uzupełnić dane nauczyciela.
             grupy (list[str] | None): Lista oznaczeń określających grupę przedmiotów.
             przedmiotyDodatkowe (dict[str, bool] | None): Słownik przedmiotów dodatkowych przeznaczonych do filtracji.
-            url (str | None): Adres strony internetowej planu lekcji użyty do pobrania jej zawartości.
 
         Returns:
             list[Lekcja]: Lista słowników opisujących lekcje znajdujące się w danej komórce tabeli.
         """
 
         lekcje: list[Lekcja] = []
-        bloki = podzielKomórkę(td)
-
-        if not bloki:
-            tekst = td.get_text(" ", strip=True)
-
-            if tekst:
-                return [{
-                    "standard": False,
-                    "tekst": tekst
-                }]
-
-            return []
 
         for blok in bloki:
-            fragment = BeautifulSoup("".join(map(str, blok)), "html.parser")
-
-            niestandardowa = rozpoznajLekcję(fragment)
-            if niestandardowa:
-                lekcje.append(niestandardowa)
+            if "standard" in blok:
+                lekcje.append(dict(blok))
                 continue
 
-            lekcje.extend(sparsujLekcje(fragment, dzień, numer, nazwa, rozwinięciaOddziałów, potrzebniNauczyciele, grupy, przedmiotyDodatkowe, url))
+            lekcje.extend(sparsujLekcje(blok, dzień, numer, nazwa, rozwinięciaOddziałów, potrzebniNauczyciele, grupy, przedmiotyDodatkowe))
 
         return lekcje
 
-    if zawartośćStrony is None:
-        logowanie.warning(
-            "Brak treści pobranej ze strony. Zwracanie pustej zawartości."
-        )
-        return None
-
-    if not isinstance(listaOddziałów, dict):
-        logowanie.warning(
-            "Nieprawidłowy typ danych listy oddziałów. Zwracanie pustej zawartości."
-        )
-        return None
+    def wyodrębnijStrukturę(wybraneDni: frozenset[str] | None) -> StrukturaPlanu | None:
+        """
+        Wyodrębnia z obiektu dokumentu nazwę, daty i tabelę planu lekcji w postaci niezależnej od parametrów filtracji, tak aby mogła zostać zapamiętana i wykorzystana dla dowolnych grup, przedmiotów dodatkowych i dnia skróconych lekcji. Przetworzone komórki tabeli zapamiętywane są według ich treści, więc komórki powtarzające się na tej samej lub innych stronach, również po ponownym opublikowaniu planów lekcji, nie są przetwarzane ponownie.
 
-    if not isinstance(url, str) or not url.startswith(("http://", "https://")):
-        logowanie.warning(
-            "Nieprawidłowy URL wejściowy. Zwracanie pustej zawartości."
-        )
-        return None
+        Args:
+            wybraneDni (frozenset[str] | None): Zbiór nazw dni tygodnia zapisanych małymi literami, których komórki mają zostać przetworzone. Komórki pozostałych dni pozostają puste.
 
-    try:
-        potrzebniNauczyciele: set[tuple[str | None, str, int]] = set()
-        rozwinięciaOddziałów: set[str] = set()
+        Returns:
+            StrukturaPlanu | None: Słownik zawierający nazwę, daty, dni tygodnia oraz wiersze tabeli planu lekcji lub None, jeśli strona nie zawiera tabeli.
+        """
 
         etykietaPlanu = zawartośćStrony.select_one(".tytulnapis")
         tabela = zawartośćStrony.select_one("table.tabela")
@@ -445,13 +450,6 @@ async def wyodrębnijPlanLekcji(
             "obowiazuje": None,
             "wygasa": None
         }
-        wyniki = []
-
-        for dane in listaOddziałów.values():
-            rozwinięcie = dane.get("rozwiniecie")
-
-            if isinstance(rozwinięcie, str) and rozwinięcie:
-                rozwinięciaOddziałów.add(rozwinięcie)
 
         if etykietaPlanu:
             nazwa = etykietaPlanu.get_text(strip=True)
@@ -484,26 +482,116 @@ async def wyodrębnijPlanLekcji(
         if not tabela:
             return None
 
-        rozkładSkrócony = konfiguracja.get("skrocone", {})
-        schematSkróconych: dict[int, str] = {
-            int(numer): zakres
-            for numer, zakres in rozkładSkrócony.items()
-        }
+        katalog = konfiguracja.get("plany", {}).get("url")
+        if not katalog or not sprawdźSerwer(url):
+            logowanie.warning(
+                "Otrzymany URL nie zgadza się z wartością URL znajdującego się w pliku konfiguracyjnym. Zwracanie nieuzupełnionych elementów."
+            )
+            katalog = None
 
         dniTygodnia = wydobądźDniTygodnia(tabela)
-        wiersze = tabela.find_all("tr")[1:]
-        plan = {dzień: [] for dzień in dniTygodnia}
+        wiersze: list[WierszPlanu] = []
 
-        for wiersz in wiersze:
+        for wiersz in tabela.find_all("tr")[1:]:
             komórki = wiersz.find_all("td")
 
             if len(komórki) < 7:
                 continue
 
             numer = int(komórki[0].get_text(strip=True))
+            komórkiDni: list[list[BlokKomórki]] = []
+
+            for indeks in range(len(dniTygodnia)):
+                if wybraneDni is not None and dniTygodnia[indeks].casefold() not in wybraneDni:
+                    komórkiDni.append([])
+                    continue
 
-            for indeks, dzień in enumerate(dniTygodnia):
                 td = komórki[indeks + 2]
+                komórkiDni.append(zapamiętywanie.pobierzFragment(
+                    ("komorka", katalog, zwróćSygnaturę(td)),
+                    lambda: przetwórzKomórkę(td, katalog)
+                ))
+
+            wiersze.append({
+                "numer": numer,
+                "godziny": komórki[1].get_text(strip=True).replace(" ", ""),
+                "komorki": komórkiDni
+            })
+
+        return {
+            "nazwa": nazwa,
+            "wygenerowano": wygenerowano,
+            "data": data,
+            "dni": dniTygodnia,
+            "wiersze": wiersze
+        }
+
+    if zawartośćStrony is None:
+        logowanie.warning(
+            "Brak treści pobranej ze strony. Zwracanie pustej zawartości."
+        )
+        return None
+
+    if not isinstance(listaOddziałów, dict):
+        logowanie.warning(
+            "Nieprawidłowy typ danych listy oddziałów. Zwracanie pustej zawartości."
+        )
+        return None
+
+    if not isinstance(url, str) or not url.startswith(("http://", "https://")):
+        logowanie.warning(
+            "Nieprawidłowy URL wejściowy. Zwracanie pustej zawartości."
+        )
+        return None
+
+    try:
+        potrzebniNauczyciele: set[tuple[str | None, str, int]] = set()
+        rozwinięciaOddziałów: set[str] = set()
+
+        wyniki = []
+
+        for dane in listaOddziałów.values():
+            rozwinięcie = dane.get("rozwiniecie")
+
+            if isinstance(rozwinięcie, str) and rozwinięcie:
+                rozwinięciaOddziałów.add(rozwinięcie)
+
+        dniPlanu = frozenset(dzień.strip().casefold() for dzień in dni) if dni is not None else None
+        wybraneDni = dniPlanu
+        kluczStruktury = ("plan", url)
+
+        if wybraneDni is not None and not zapamiętywanie.zawiera(zawartośćStrony, kluczStruktury):
+            kluczStruktury = ("plan", url, wybraneDni)
+        else:
+            wybraneDni = None
+
+        struktura = await zapamiętywanie.pobierzWTle(zawartośćStrony, kluczStruktury, lambda: wyodrębnijStrukturę(wybraneDni))
+        if struktura is None:
+            return None
+
+        nazwa = struktura["nazwa"]
+        wygenerowano = struktura["wygenerowano"]
+        data = dict(struktura["data"])
+
+        rozkładSkrócony = konfiguracja.get("skrocone", {})
+        schematSkróconych: dict[int, str] = {
+            int(numer): zakres
+            for numer, zakres in rozkładSkrócony.items()
+        }
+
+        dniTygodnia = list(struktura["dni"])
+        plan = {
+            dzień: []
+            for dzień in dniTygodnia
+            if dniPlanu is None or dzień.casefold() in dniPlanu
+        }
+
+        for wiersz in struktura["wiersze"]:
+            numer = wiersz["numer"]
+
+            for dzień, bloki in zip(dniTygodnia, wiersz["komorki"]):
+                if dzień not in plan:
+                    continue
 
                 if dzieńSkróconych is not None and dzień == dzieńSkróconych:
                     godziny = schematSkróconych.get(numer)
@@ -511,11 +599,11 @@ async def wyodrębnijPlanLekcji(
                     godziny = None
 
                 if not godziny:
-                    godziny = komórki[1].get_text(strip=True).replace(" ", "")
+                    godziny = wiersz["godziny"]
 
                 początek, koniec = godziny.split("-", 1)
 
-                lekcje = wyczyśćKomórkę(td, dzień, numer, nazwa, rozwinięciaOddziałów, potrzebniNauczyciele, grupy, przedmiotyDodatkowe, url)
+                lekcje = wyczyśćKomórkę(bloki, dzień, numer, nazwa, rozwinięciaOddziałów, potrzebniNauczyciele, grupy, przedmiotyDodatkowe)
                 if not lekcje:
                     continue
 
@@ -11,18 +11,13 @@
 #
 
 # Standardowe biblioteki
-from urllib.parse import (
-    urljoin,
-    urlparse
-)
-
-# Zewnętrzne biblioteki
-import aiohttp
+from urllib.parse import urljoin
 
 # Wewnętrzne importy
-from src.classes.semaphore import semafor
+from src.classes.atom import Atom
 from src.classes.types import ElementPlanu
 from src.handlers.configuration import konfiguracja
+from src.handlers.helpers import sprawdźSerwer
 from src.handlers.timetables.helpers import (
     wydobądźIdentyfikator,
     zwróćPustySłownik
@@ -31,7 +26,7 @@ from src.handlers.scraper import pobierzZawartośćStrony
 from src.handlers.logging import logowanie
 
 async def uzupełnijNauczyciela(
-    atom: aiohttp.ClientSession,
+    atom: Atom,
     url: str,
     dniTygodnia: list[str],
     dzień: str,
@@ -41,7 +36,7 @@ async def uzupełnijNauczyciela(
     Uzupełnia dane nauczyciela dla konkretnej lekcji w planie oddziału na podstawie URL do strony planu lekcji sali.
 
     Args:
-        atom (aiohttp.ClientSession): Aktywna sesja HTTP używana do wykonania zapytania.
+        atom (Atom): Obiekt zarządzający sesjami HTTP używanymi do wykonania zapytania.
         url (str): Adres strony planu lekcji sali.
         dniTygodnia (list[str]): Lista dni tygodnia.
         dzień (str): Dzień tygodnia, w którym odbywa się lekcja.
@@ -62,14 +57,13 @@ async def uzupełnijNauczyciela(
             )
             return zwróćPustySłownik()
 
-        if urlparse(url).netloc != urlparse(katalog).netloc:
+        if not sprawdźSerwer(url):
             logowanie.warning(
                 "Otrzymany URL nie zgadza się z wartością URL znajdującego się w pliku konfiguracyjnym. Zwracanie pustego słownika elementu."
             )
             return zwróćPustySłownik()
 
-        async with semafor:
-            zawartośćStrony = await pobierzZawartośćStrony(atom, url, kodowanie)
+        zawartośćStrony = await pobierzZawartośćStrony(atom, url, kodowanie, "tabela")
 
         if zawartośćStrony is None:
             logowanie.warning(
@@ -0,0 +1,119 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+from typing import (
+    Callable,
+    Iterator
+)
+
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+import pytest
+
+# Wewnętrzne importy
+from korpus import (
+    ADRESY,
+    zwróćŚcieżkę
+)
+from src.classes.breaker import bezpiecznik
+from src.classes.cache import pamięć
+from src.classes.flight import scalanie
+from src.classes.hedging import dublowanie
+from src.classes.memo import zapamiętywanie
+from src.classes.parser import analizator
+from src.classes.scheduler import harmonogram
+from src.classes.semaphore import semafor
+from src.handlers.configuration import konfiguracja
+import src.handlers.substitutions.resolver
+import src.handlers.timetables.resolver
+
+@pytest.fixture(params=["html.parser", "lxml"])
+def silnik(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """
+    Ustawia silnik przetwarzania HTML oraz adresy źródeł danych zapisanych stron i czyści fragmenty zapamiętane przez poprzedni test, aby wyniki żadnego silnika nie były przenoszone do kolejnego.
+
+    Yields:
+        str: Nazwa silnika przetwarzania HTML.
+    """
+
+    if builder_registry.lookup(request.param) is None:
+        pytest.skip(f"Silnik przetwarzania HTML ({request.param}) nie jest zainstalowany.")
+
+    monkeypatch.setitem(konfiguracja["przetwarzanie"], "silnik", request.param)
+    for źródło, url in ADRESY.items():
+        monkeypatch.setitem(konfiguracja[źródło], "url", url)
+        monkeypatch.setitem(konfiguracja[źródło], "lustra", [])
+
+    zapamiętywanie.fragmenty.clear()
+    yield request.param
+    zapamiętywanie.fragmenty.clear()
+
+
+@pytest.fixture(params=["calosc", "strumieniowo"])
+def pobierz(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch, silnik: str) -> Callable[[str], BeautifulSoup]:
+    """
+    Podmienia pobieranie stron w modułach uzupełniających dane planów lekcji i zastępstw na odczyt zapisanych stron, przetwarzanych w całości lub przyrostowo, tak jak przez moduł pobierający strony.
+
+    Returns:
+        Callable[[str], BeautifulSoup]: Funkcja zwracająca przetworzoną zapisaną stronę dla adresu strony internetowej.
+    """
+
+    def przetwórz(url: str, profil: str | None = None) -> BeautifulSoup:
+        """
+        Przetwarza zapisaną stronę wybranym silnikiem, ograniczając drzewo dokumentu do elementów wymaganych przez profil lub wskazanych dla źródła danych.
+
+        Args:
+            url (str): Adres strony internetowej.
+            profil (str | None): Nazwa profilu przetwarzania określającego elementy strony wymagane przez wywołującego.
+
+        Returns:
+            BeautifulSoup: Obiekt BeautifulSoup reprezentujący stronę HTML.
+        """
+
+        ścieżka, kodowanie = zwróćŚcieżkę(url)
+        dane = ścieżka.read_bytes()
+        źródło = pamięć.zwróćŹródło(url)
+
+        if request.param == "calosc":
+            return analizator.przetwórz(dane.decode(kodowanie, errors="ignore"), profil, źródło)
+
+        analiza = analizator.rozpocznij(kodowanie, profil, źródło)
+        for początek in range(0, len(dane), 1024):
+            analiza.dodaj(dane[początek:początek + 1024])
+        return analiza.zakończ()
+
+    async def pobierzZawartośćStrony(atom: object, url: str, kodowanie: str, profil: str | None = None) -> BeautifulSoup:
+        """
+        Zastępuje pobieranie strony internetowej odczytem zapisanej strony.
+
+        Returns:
+            BeautifulSoup: Obiekt BeautifulSoup reprezentujący stronę HTML.
+        """
+
+        return przetwórz(url, profil)
+
+    monkeypatch.setattr(src.handlers.timetables.resolver, "pobierzZawartośćStrony", pobierzZawartośćStrony)
+    monkeypatch.setattr(src.handlers.substitutions.resolver, "pobierzZawartośćStrony", pobierzZawartośćStrony)
+    return przetwórz
+
+
+@pytest.fixture
+def stan(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Przywraca początkowy stan pamięci podręcznej, scalania zapytań, bezpieczników, ograniczeń, harmonogramu i dublowania zapytań na czas testu, aby stan pozostawiony przez inne testy nie wpływał na wynik.
+    """
+
+    for obiekt in (pamięć, scalanie, bezpiecznik, semafor, harmonogram, dublowanie):
+        for nazwa, wartość in vars(type(obiekt)()).items():
+            monkeypatch.setattr(obiekt, nazwa, wartość)
@@ -0,0 +1,103 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+from types import SimpleNamespace
+
+# Zewnętrzne biblioteki
+import pytest
+
+# Wewnętrzne importy
+from src.classes.breaker import Breaker
+import src.classes.breaker
+from src.handlers.configuration import konfiguracja
+
+URL = "https://plan.zse.bydgoszcz.pl/plany/o1.html"
+
+@pytest.fixture
+def zegar(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """
+    Podmienia zegar bezpiecznika na zegar przesuwany przez test oraz ustawia próg 3 kolejnych błędów i przerwę 30 sekund.
+
+    Returns:
+        list[float]: Jednoelementowa lista z bieżącym czasem zegara (w sekundach).
+    """
+
+    czas = [1000.0]
+    monkeypatch.setattr(src.classes.breaker, "time", SimpleNamespace(monotonic=lambda: czas[0]))
+    monkeypatch.setitem(konfiguracja, "bezpiecznik", {"prog": 3, "przerwa": 30})
+    return czas
+
+
+def test_otwarcie(zegar: list[float]) -> None:
+    """
+    Sprawdza, czy bezpiecznik otwiera się dopiero po osiągnięciu progu kolejnych błędów, a poprawna odpowiedź zeruje ich licznik.
+    """
+
+    bezpiecznik = Breaker()
+
+    bezpiecznik.zgłośBłąd(URL)
+    bezpiecznik.zgłośBłąd(URL)
+    bezpiecznik.zgłośSukces(URL)
+    bezpiecznik.zgłośBłąd(URL)
+    bezpiecznik.zgłośBłąd(URL)
+
+    assert bezpiecznik.sprawdź(URL)
+
+    bezpiecznik.zgłośBłąd(URL)
+
+    assert not bezpiecznik.sprawdź(URL)
+    assert bezpiecznik.zwróćStatystyki()["plan.zse.bydgoszcz.pl"] == {"stan": "otwarty", "bledy": 3, "otwarcia": 1, "odrzucone": 1}
+
+
+@pytest.mark.parametrize(("sukces", "stan"), [(True, "zamkniety"), (False, "otwarty")])
+def test_zapytaniePróbne(zegar: list[float], sukces: bool, stan: str) -> None:
+    """
+    Sprawdza, czy po upływie przerwy bezpiecznik przepuszcza jedno zapytanie próbne, kolejne odrzuca do upływu następnej przerwy, a wynik zapytania próbnego zamyka lub ponownie otwiera bezpiecznik.
+    """
+
+    bezpiecznik = Breaker()
+
+    for _ in range(3):
+        bezpiecznik.zgłośBłąd(URL)
+
+    zegar[0] += 29
+
+    assert not bezpiecznik.sprawdź(URL)
+
+    zegar[0] += 1
+
+    assert bezpiecznik.sprawdź(URL)
+    assert bezpiecznik.zwróćObwód(URL).stan == "polotwarty"
+    assert not bezpiecznik.sprawdź(URL)
+
+    if sukces:
+        bezpiecznik.zgłośSukces(URL)
+    else:
+        bezpiecznik.zgłośBłąd(URL)
+
+    assert bezpiecznik.zwróćObwód(URL).stan == stan
+    assert bezpiecznik.sprawdź(URL) == sukces
+
+
+def test_osobneSerwery(zegar: list[float]) -> None:
+    """
+    Sprawdza, czy błędy jednego serwera nie otwierają bezpiecznika innego serwera.
+    """
+
+    bezpiecznik = Breaker()
+
+    for _ in range(3):
+        bezpiecznik.zgłośBłąd(URL)
+
+    assert not bezpiecznik.sprawdź(URL)
+    assert bezpiecznik.sprawdź("https://lustro.zse.bydgoszcz.pl/plany/o1.html")
@@ -0,0 +1,65 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+from typing import Callable
+
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+import pytest
+
+# Wewnętrzne importy
+from src.api.timetables.exceptions import NieprawidłowyDzień
+import src.api.timetables.service
+from src.api.timetables.service import pobierzPlanLekcji
+from tests.test_silniki import WYNIKI
+
+@pytest.fixture
+def usługa(pobierz: Callable[[str], BeautifulSoup], monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Podmienia pobieranie stron w usłudze planów lekcji na odczyt zapisanych stron.
+    """
+
+    async def pobierzZawartośćStrony(atom: object, url: str, kodowanie: str, profil: str | None = None) -> BeautifulSoup:
+        """
+        Zastępuje pobieranie strony internetowej odczytem zapisanej strony.
+
+        Returns:
+            BeautifulSoup: Obiekt BeautifulSoup reprezentujący stronę HTML.
+        """
+
+        return pobierz(url, profil)
+
+    monkeypatch.setattr(src.api.timetables.service, "pobierzZawartośćStrony", pobierzZawartośćStrony)
+
+
+@pytest.mark.parametrize("dzień", ["Środa", "środa", "ŚRODA", " Środa "])
+def test_dzieńBezWzględuNaWielkośćLiter(usługa: None, dzień: str) -> None:
+    """
+    Sprawdza, czy nazwa dnia tygodnia dopasowywana jest do nagłówka tabeli planu lekcji bez względu na wielkość liter i otaczające odstępy.
+    """
+
+    planLekcji = asyncio.run(pobierzPlanLekcji("o1", None, None, None, None, dzień))
+
+    assert planLekcji == {**WYNIKI["plan/o1.html"], "plan": {"Środa": WYNIKI["plan/o1.html"]["plan"]["Środa"]}}
+
+
+@pytest.mark.parametrize("dzień", ["Sobota", "Sroda", ""])
+def test_nieprawidłowyDzień(usługa: None, dzień: str) -> None:
+    """
+    Sprawdza, czy dzień tygodnia, który nie występuje w nagłówku tabeli planu lekcji, jest odrzucany.
+    """
+
+    with pytest.raises(NieprawidłowyDzień):
+        asyncio.run(pobierzPlanLekcji("o1", None, None, None, None, dzień))
+
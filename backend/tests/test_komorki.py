@@ -0,0 +1,53 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+import json
+from pathlib import Path
+from typing import (
+    Any,
+    Callable
+)
+
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+import pytest
+
+# Wewnętrzne importy
+from korpus import ADRESY
+from src.handlers.lists.parser import wyodrębnijListy
+from src.handlers.timetables.parser import wyodrębnijPlanLekcji
+
+WYNIKI: dict[str, Any] = json.loads((Path(__file__).resolve().parent / "fixtures" / "komorki.json").read_text(encoding="utf-8"))
+URL = ADRESY["plany"] + "komorki.html"
+
+@pytest.mark.parametrize(("klucz", "dzieńSkróconych", "grupy", "przedmiotyDodatkowe"), [
+    ("komorki", None, None, None),
+    ("komorki/filtry", "Środa", ["1/2", "j1"], {"religia": False, "zdrowotna": False}),
+    ("komorki/grupy", None, ["2/2", "j2"], {"religia": True, "zdrowotna": True})
+])
+def test_komórki(
+    pobierz: Callable[[str], BeautifulSoup],
+    klucz: str,
+    dzieńSkróconych: str | None,
+    grupy: list[str] | None,
+    przedmiotyDodatkowe: dict[str, bool] | None
+) -> None:
+    """
+    Sprawdza, czy komórki z lekcjami kilku grup, kilkoma przedmiotami w jednym bloku, pustymi blokami, samym tekstem, dodatkowymi oznaczeniami przedmiotu oraz brakującym nauczycielem dają ten sam plan lekcji co przed zmianą sposobu rozpoznawania etykiet bloku.
+    """
+
+    listaOddziałów = wyodrębnijListy(pobierz(ADRESY["lista"]), ADRESY["lista"])["oddzialy"]
+    planLekcji = asyncio.run(wyodrębnijPlanLekcji(None, pobierz(URL), listaOddziałów, dzieńSkróconych, grupy, przedmiotyDodatkowe, URL, None))
+
+    assert planLekcji == WYNIKI[klucz]
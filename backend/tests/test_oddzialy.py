@@ -0,0 +1,56 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Zewnętrzne biblioteki
+import pytest
+
+# Wewnętrzne importy
+from src.handlers.substitutions.helpers import (
+    normalizujTekst,
+    zbudujWzorceOddziałów,
+    zbudujWzorzecOddziałów
+)
+
+ODDZIAŁY = ("1 2", "2 a", "3TI", "3 TIP", "4a")
+
+@pytest.mark.parametrize(("tekst", "oddział", "dopasowany"), [
+    ("1 2 a", "1 2", True),
+    ("1 2 a", "2 a", True),
+    ("1 2a", "2 a", True),
+    ("3 TIP fizyka", "3TI", False),
+    ("3TIP fizyka", "3 TIP", True),
+    ("(4a) matematyka", "4a", True),
+    ("14a matematyka", "4a", False)
+])
+def test_wzorzecOddziału(tekst: str, oddział: str, dopasowany: bool) -> None:
+    """
+    Sprawdza, czy wybrany oddział dopasowywany jest jako osobne słowo z dowolnymi odstępami pomiędzy częściami nazwy, również wtedy, gdy jego nazwa nakłada się w wierszu na nazwę innego oddziału.
+    """
+
+    tekst = normalizujTekst(tekst.replace("(", " ").replace(")", " "))
+
+    assert (zbudujWzorceOddziałów(ODDZIAŁY)[oddział].search(tekst) is not None) == dopasowany
+
+
+@pytest.mark.parametrize(("tekst", "zidentyfikowany"), [
+    ("1 2 a", True),
+    ("x 2 a", True),
+    ("12a", False),
+    ("3 tip", True),
+    ("5b", False)
+])
+def test_wzorzecOddziałów(tekst: str, zidentyfikowany: bool) -> None:
+    """
+    Sprawdza, czy wiersz uznawany jest za przypisany do oddziału, gdy zawiera dokładną nazwę któregokolwiek z oddziałów jako osobne słowo.
+    """
+
+    assert (zbudujWzorzecOddziałów(ODDZIAŁY).search(normalizujTekst(tekst)) is not None) == zidentyfikowany
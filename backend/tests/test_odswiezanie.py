@@ -0,0 +1,82 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+import time
+
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+import pytest
+
+# Wewnętrzne importy
+from korpus import (
+    ADRESY,
+    zwróćŚcieżkę
+)
+from src.classes.cache import pamięć
+import src.classes.crawler
+from src.classes.crawler import Crawler
+from src.handlers.configuration import konfiguracja
+
+@pytest.mark.parametrize("wpis", [False, True])
+def test_brakującaLista(stan: None, monkeypatch: pytest.MonkeyPatch, wpis: bool) -> None:
+    """
+    Sprawdza, czy przejście odświeżania pobiera listę ponownie, gdy jej wpisu brakuje w pamięci podręcznej (np. po nieudanym pobraniu lub usunięciu), mimo że od ostatniej próby jej odświeżenia nie upłynął czas świeżości, a gdy wpis istnieje, korzysta z zapisanej listy.
+    """
+
+    ścieżka, kodowanie = zwróćŚcieżkę(ADRESY["lista"])
+    lista = BeautifulSoup(ścieżka.read_text(encoding=kodowanie), "html.parser")
+    sprawdzenia: list[object] = []
+
+    async def sprawdź(atom: object) -> BeautifulSoup:
+        """
+        Zastępuje sprawdzenie epoki planu lekcji zwróceniem zapisanej listy.
+
+        Returns:
+            BeautifulSoup: Obiekt BeautifulSoup reprezentujący stronę HTML listy.
+        """
+
+        sprawdzenia.append(atom)
+        return lista
+
+    async def odświeżZawartośćStrony(atom: object, url: str, kodowanie: str, profil: str | None = None) -> None:
+        """
+        Zastępuje odświeżenie strony planu lekcji niepowodzeniem.
+        """
+
+        return None
+
+    for źródło, url in ADRESY.items():
+        monkeypatch.setitem(konfiguracja, źródło, {**konfiguracja.get(źródło, {}), "url": url, "lustra": []})
+    monkeypatch.setattr(src.classes.crawler.epoka, "sprawdź", sprawdź)
+    monkeypatch.setattr(src.classes.crawler, "odświeżZawartośćStrony", odświeżZawartośćStrony)
+
+    if wpis:
+        pamięć.zapisz(ADRESY["lista"], {
+            "etag": None,
+            "ostatniaModyfikacja": None,
+            "dokument": lista,
+            "źródło": "lista",
+            "pobrano": time.monotonic() - 3600,
+            "ttl": 10,
+            "rozmiar": 0,
+            "skrot": "",
+            "epoka": pamięć.epoka
+        })
+
+    odświeżanie = Crawler()
+    odświeżanie.próby[ADRESY["lista"]] = time.monotonic()
+    asyncio.run(odświeżanie.przeszukaj(None))
+
+    assert len(sprawdzenia) == (0 if wpis else 1)
+    assert odświeżanie.przejścia == 1
@@ -0,0 +1,108 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+
+# Zewnętrzne biblioteki
+import aiohttp
+import pytest
+
+# Wewnętrzne importy
+from src.classes.semaphore import Semaphore
+from src.handlers.configuration import konfiguracja
+
+URL = "https://plan.zse.bydgoszcz.pl/plany/o1.html"
+
+@pytest.fixture
+def semafor(monkeypatch: pytest.MonkeyPatch) -> Semaphore:
+    """
+    Tworzy semafor z początkowym limitem 2 jednoczesnych zapytań, w zakresie od 1 do 4.
+
+    Returns:
+        Semaphore: Adaptacyjny semafor bez obserwowanych serwerów.
+    """
+
+    monkeypatch.setitem(konfiguracja, "ograniczenia", {"poczatkowy": 2, "minimalny": 1, "maksymalny": 4, "tolerancja": 2.0})
+    return Semaphore()
+
+
+def test_limitJednoczesnychZapytań(semafor: Semaphore) -> None:
+    """
+    Sprawdza, czy liczba jednocześnie wykonywanych zapytań do serwera nie przekracza jego limitu, a pozostałe oczekują w kolejce.
+    """
+
+    wToku: list[int] = []
+
+    async def zapytanie() -> None:
+        """
+        Wykonuje zapytanie, odnotowując liczbę zapytań wykonywanych w tym samym czasie.
+        """
+
+        async with semafor.ogranicz(URL):
+            wToku.append(semafor.zwróćLimit(URL).wToku)
+            await asyncio.sleep(0.01)
+
+    async def wykonaj() -> None:
+        """
+        Wykonuje jednocześnie pięć zapytań.
+        """
+
+        await asyncio.gather(*[zapytanie() for _ in range(5)])
+
+    asyncio.run(wykonaj())
+
+    assert max(wToku) == 2
+    assert semafor.zwróćLimit(URL).wToku == 0
+
+
+def test_dostosowanieLimitu(semafor: Semaphore) -> None:
+    """
+    Sprawdza, czy limit zwiększany jest addytywnie po poprawnej odpowiedzi, a zmniejszany o połowę po błędzie połączenia.
+    """
+
+    async def wykonaj() -> None:
+        """
+        Wykonuje jedno poprawne zapytanie i jedno zakończone błędem połączenia.
+        """
+
+        async with semafor.ogranicz(URL):
+            pass
+
+        with pytest.raises(aiohttp.ClientConnectionError):
+            async with semafor.ogranicz(URL):
+                raise aiohttp.ClientConnectionError
+
+    asyncio.run(wykonaj())
+    limit = semafor.zwróćLimit(URL)
+
+    assert limit.limit == pytest.approx(1.25)
+    assert (limit.zapytania, limit.błędy) == (2, 1)
+
+
+def test_pominiętyCzas(semafor: Semaphore) -> None:
+    """
+    Sprawdza, czy czas oznaczony przez wywołującego jako pominięty, np. czas przetwarzania strony, nie jest wliczany do czasu odpowiedzi serwera.
+    """
+
+    async def wykonaj() -> None:
+        """
+        Wykonuje zapytanie trwające 50 ms, z czego 40 ms oznaczone jest jako pominięte.
+        """
+
+        async with semafor.ogranicz(URL) as pomiar:
+            await asyncio.sleep(0.05)
+            pomiar.pominięte += 0.04
+
+    asyncio.run(wykonaj())
+
+    assert semafor.zwróćLimit(URL).czasy[0] < 0.03
@@ -0,0 +1,215 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+import time
+
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+import pytest
+
+# Wewnętrzne importy
+from korpus import ADRESY
+from src.classes.cache import pamięć
+from src.classes.types import WpisPamięci
+from src.handlers.configuration import konfiguracja
+import src.handlers.scraper
+from src.handlers.scraper import pobierzZawartośćStrony
+
+def zwróćWpis(
+    źródło: str,
+    wiek: float,
+    rozmiar: int = 100,
+    etag: str | None = None,
+    ostatniaModyfikacja: str | None = None
+) -> WpisPamięci:
+    """
+    Zwraca wpis strony internetowej pobranej przed podanym czasem, z czasem świeżości 10 sekund.
+
+    Args:
+        źródło (str): Nazwa źródła danych.
+        wiek (float): Czas, który upłynął od pobrania strony (w sekundach).
+        rozmiar (int): Rozmiar wpisu (w bajtach).
+        etag (str | None): Wartość nagłówka `ETag`.
+        ostatniaModyfikacja (str | None): Wartość nagłówka `Last-Modified`.
+
+    Returns:
+        WpisPamięci: Wpis strony internetowej.
+    """
+
+    return {
+        "etag": etag,
+        "ostatniaModyfikacja": ostatniaModyfikacja,
+        "dokument": BeautifulSoup("<p>strona</p>", "html.parser"),
+        "źródło": źródło,
+        "pobrano": time.monotonic() - wiek,
+        "ttl": 10,
+        "rozmiar": rozmiar,
+        "skrot": "",
+        "epoka": pamięć.epoka
+    }
+
+
+@pytest.fixture
+def źródła(stan: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Ustawia adresy źródeł danych oraz dodatkowy czas wykorzystania nieaktualnych wpisów: 20 sekund podczas odświeżania w tle i 100 sekund podczas niedostępności serwera.
+    """
+
+    for źródło, url in ADRESY.items():
+        monkeypatch.setitem(konfiguracja, źródło, {**konfiguracja.get(źródło, {}), "url": url, "lustra": [], "nieaktualne": 20, "awaryjne": 100})
+
+
+def test_usuwanieNajdawniejUżywanych(źródła: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Sprawdza, czy po przekroczeniu limitu rozmiaru usuwany jest najdawniej używany wpis, a wpis większy od limitu nie jest zapisywany.
+    """
+
+    monkeypatch.setattr(pamięć, "limit", 300)
+
+    for nazwa in "abc":
+        pamięć.zapisz(nazwa, zwróćWpis("plany", 0))
+
+    pamięć.pobierz("a")
+    pamięć.zapisz("d", zwróćWpis("plany", 0))
+    pamięć.zapisz("e", zwróćWpis("plany", 0, rozmiar=301))
+
+    assert list(pamięć.wpisy) == ["c", "a", "d"]
+    assert pamięć.rozmiar == 300
+    assert pamięć.statystyki["usuniecia"] == 1
+
+
+def test_ponownyZapisZmieniaRozmiar(źródła: None) -> None:
+    """
+    Sprawdza, czy ponowny zapis strony zastępuje rozmiar poprzedniego wpisu zamiast go powiększać.
+    """
+
+    pamięć.zapisz("a", zwróćWpis("plany", 0, rozmiar=100))
+    pamięć.zapisz("a", zwróćWpis("plany", 0, rozmiar=40))
+
+    assert pamięć.rozmiar == 40
+
+
+@pytest.mark.parametrize(("wiek", "świeży", "przydatny", "awaryjny"), [
+    (5, True, True, True),
+    (15, False, True, True),
+    (50, False, False, True),
+    (150, False, False, False)
+])
+def test_czasWykorzystania(źródła: None, wiek: float, świeży: bool, przydatny: bool, awaryjny: bool) -> None:
+    """
+    Sprawdza, czy wpis jest świeży w czasie świeżości, może zostać zwrócony podczas odświeżania w tle w dodatkowym czasie nieaktualności, a podczas niedostępności serwera w dodatkowym czasie awaryjnym.
+    """
+
+    wpis = zwróćWpis("plany", wiek)
+
+    assert pamięć.sprawdźŚwieżość(wpis) == świeży
+    assert pamięć.sprawdźPrzydatność(wpis) == przydatny
+    assert pamięć.sprawdźPrzydatność(wpis, awaryjnie=True) == awaryjny
+
+
+def test_epoka(źródła: None) -> None:
+    """
+    Sprawdza, czy po rozpoczęciu nowej epoki strony planów lekcji przestają być aktualne, lecz pozostają dostępne awaryjnie, a strony pozostałych źródeł danych nie są przez nią unieważniane.
+    """
+
+    plan = zwróćWpis("plany", 0)
+    lista = zwróćWpis("lista", 0)
+    pamięć.rozpocznijEpokę()
+
+    assert not pamięć.sprawdźŚwieżość(plan)
+    assert not pamięć.sprawdźPrzydatność(plan)
+    assert pamięć.sprawdźPrzydatność(plan, awaryjnie=True)
+    assert pamięć.sprawdźŚwieżość(lista)
+
+
+def test_nagłówkiWarunkowe() -> None:
+    """
+    Sprawdza, czy nagłówki zapytania warunkowego budowane są z walidatorów wpisu, a bez wpisu zapytanie nie jest warunkowe.
+    """
+
+    wpis = zwróćWpis("plany", 0, etag='"v1"', ostatniaModyfikacja="Mon, 01 Sep 2025 08:00:00 GMT")
+
+    assert pamięć.zwróćNagłówki(wpis) == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Sep 2025 08:00:00 GMT"}
+    assert pamięć.zwróćNagłówki(zwróćWpis("plany", 0)) == {}
+    assert pamięć.zwróćNagłówki(None) == {}
+
+
+@pytest.mark.parametrize(("wiek", "pobierane", "zwracany"), [
+    (5, 0, "zapisany"),
+    (15, 1, "zapisany"),
+    (50, 1, "pobrany")
+])
+def test_pobieranieZPamięci(źródła: None, monkeypatch: pytest.MonkeyPatch, wiek: float, pobierane: int, zwracany: str) -> None:
+    """
+    Sprawdza, czy świeża strona zwracana jest bez pobierania, nieaktualna zwracana jest od razu i odświeżana w tle tylko raz mimo kilku zapytań, a przestarzała pobierana jest przed zwróceniem.
+    """
+
+    url = ADRESY["plany"] + "o1.html"
+    wpis = zwróćWpis("plany", wiek)
+    pobrany = BeautifulSoup("<p>nowa</p>", "html.parser")
+    pobrania: list[str] = []
+
+    async def odświeżZawartośćStrony(atom: object, url: str, kodowanie: str, profil: str | None = None) -> BeautifulSoup:
+        """
+        Zastępuje pobranie strony internetowej zapisaniem w pamięci podręcznej nowego dokumentu.
+
+        Returns:
+            BeautifulSoup: Obiekt BeautifulSoup reprezentujący stronę HTML.
+        """
+
+        pobrania.append(url)
+        await asyncio.sleep(0)
+        pamięć.zapisz(url, {**zwróćWpis("plany", 0), "dokument": pobrany})
+        return pobrany
+
+    async def wykonaj() -> list[BeautifulSoup | None]:
+        """
+        Wykonuje kolejno trzy zapytania o stronę i czeka na zakończenie odświeżania w tle.
+
+        Returns:
+            list[BeautifulSoup | None]: Lista zwróconych dokumentów.
+        """
+
+        wyniki = [await pobierzZawartośćStrony(None, url, "utf-8") for _ in range(3)]
+        await asyncio.gather(*pamięć.zadania)
+        return wyniki
+
+    monkeypatch.setattr(src.handlers.scraper, "odświeżZawartośćStrony", odświeżZawartośćStrony)
+    pamięć.zapisz(url, wpis)
+    wyniki = asyncio.run(wykonaj())
+
+    assert len(pobrania) == pobierane
+    assert wyniki[0] is (wpis["dokument"] if zwracany == "zapisany" else pobrany)
+
+
+@pytest.mark.parametrize(("wiek", "awaryjny"), [(50, True), (150, False)])
+def test_pobieranieAwaryjne(źródła: None, monkeypatch: pytest.MonkeyPatch, wiek: float, awaryjny: bool) -> None:
+    """
+    Sprawdza, czy przy niedostępności serwera zwracana jest nieaktualna strona z pamięci podręcznej, o ile mieści się w dodatkowym czasie awaryjnym.
+    """
+
+    url = ADRESY["plany"] + "o1.html"
+    wpis = zwróćWpis("plany", wiek)
+
+    async def odświeżZawartośćStrony(atom: object, url: str, kodowanie: str, profil: str | None = None) -> None:
+        """
+        Zastępuje pobranie strony internetowej niepowodzeniem wszystkich prób.
+        """
+
+        return None
+
+    monkeypatch.setattr(src.handlers.scraper, "odświeżZawartośćStrony", odświeżZawartośćStrony)
+    pamięć.zapisz(url, wpis)
+
+    assert asyncio.run(pobierzZawartośćStrony(None, url, "utf-8")) is (wpis["dokument"] if awaryjny else None)
@@ -0,0 +1,160 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+# Zewnętrzne biblioteki
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+# Wewnętrzne importy
+from src.classes.atom import Atom
+from src.classes.cache import pamięć
+from src.classes.semaphore import semafor
+from src.handlers.configuration import konfiguracja
+from src.handlers.scraper import odświeżZawartośćStrony
+
+TREŚĆ = "<html><body><p>plan</p></body></html>"
+
+@asynccontextmanager
+async def uruchom(
+    monkeypatch: pytest.MonkeyPatch,
+    strumieniowanie: bool,
+    zapytania: list[dict[str, str]]
+) -> AsyncIterator[tuple[Atom, str]]:
+    """
+    Uruchamia lokalny serwer planów lekcji odpowiadający `304 Not Modified` na zapytania warunkowe ze zgodnym `ETag`, ustawia go jako źródło planów lekcji i tworzy sesje HTTP.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Obiekt podmieniający konfigurację na czas testu.
+        strumieniowanie (bool): Flaga informująca, czy strona ma być przetwarzana strumieniowo.
+        zapytania (list[dict[str, str]]): Lista, do której dopisywane są nagłówki warunkowe kolejnych zapytań.
+
+    Yields:
+        tuple[Atom, str]: Obiekt zarządzający sesjami HTTP oraz adres strony planu lekcji.
+    """
+
+    async def obsłuż(zapytanie: web.Request) -> web.Response:
+        """
+        Odpowiada treścią strony lub `304 Not Modified`, odnotowując nagłówki warunkowe zapytania.
+
+        Returns:
+            web.Response: Odpowiedź serwera.
+        """
+
+        zapytania.append({nazwa: wartość for nazwa, wartość in zapytanie.headers.items() if nazwa.startswith("If-")})
+
+        if zapytanie.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+
+        return web.Response(text=TREŚĆ, content_type="text/html", headers={"ETag": '"v1"'})
+
+    aplikacja = web.Application()
+    aplikacja.router.add_get("/plany/{nazwa}", obsłuż)
+
+    async with TestServer(aplikacja) as serwer:
+        katalog = str(serwer.make_url("/plany/"))
+        monkeypatch.setitem(konfiguracja, "plany", {**konfiguracja.get("plany", {}), "url": katalog, "lustra": []})
+        monkeypatch.setitem(konfiguracja, "ponawianie", {"proby": 1})
+        monkeypatch.setitem(konfiguracja, "dublowanie", {"wlaczone": False})
+        monkeypatch.setitem(konfiguracja, "strumieniowanie", {**konfiguracja.get("strumieniowanie", {}), "wlaczone": strumieniowanie})
+
+        atom = Atom()
+        await atom.start()
+
+        try:
+            yield atom, katalog + "o1.html"
+        finally:
+            await atom.close()
+
+
+@pytest.mark.parametrize("strumieniowanie", [False, True])
+def test_zapytanieWarunkowe(stan: None, monkeypatch: pytest.MonkeyPatch, strumieniowanie: bool) -> None:
+    """
+    Sprawdza, czy ponowne pobranie strony wysyła zapytanie warunkowe z walidatorem zapisanego wpisu, a odpowiedź `304 Not Modified` zwraca dotychczasowy dokument i odnawia wpis.
+    """
+
+    zapytania: list[dict[str, str]] = []
+
+    async def wykonaj() -> None:
+        """
+        Pobiera stronę dwukrotnie i porównuje zwrócone dokumenty.
+        """
+
+        async with uruchom(monkeypatch, strumieniowanie, zapytania) as (atom, url):
+            pierwszy = await odświeżZawartośćStrony(atom, url, "utf-8")
+            pobrano = pamięć.wpisy[url]["pobrano"]
+            await asyncio.sleep(0.01)
+            drugi = await odświeżZawartośćStrony(atom, url, "utf-8")
+
+            assert pierwszy is not None and pierwszy.p.string == "plan"
+            assert drugi is pierwszy
+            assert pamięć.wpisy[url]["pobrano"] > pobrano
+
+    asyncio.run(wykonaj())
+
+    assert zapytania == [{}, {"If-None-Match": '"v1"'}]
+
+
+@pytest.mark.parametrize("strumieniowanie", [False, True])
+def test_zapytanieBezWpisu(stan: None, monkeypatch: pytest.MonkeyPatch, strumieniowanie: bool) -> None:
+    """
+    Sprawdza, czy strona zapisana w pamięci podręcznej przez inne zapytanie podczas oczekiwania na wolne miejsce w limicie serwera nie sprawia, że zapytanie rozpoczęte bez wpisu zostanie wysłane jako warunkowe i obsłużone jako `304 Not Modified` bez dokumentu.
+    """
+
+    zapytania: list[dict[str, str]] = []
+    ogranicz = semafor.ogranicz
+
+    async def wykonaj() -> None:
+        """
+        Pobiera stronę, zapisując w pamięci podręcznej wpis z walidatorem tuż przed wysłaniem zapytania.
+        """
+
+        async with uruchom(monkeypatch, strumieniowanie, zapytania) as (atom, url):
+
+            @asynccontextmanager
+            async def ograniczIZapisz(adres: str) -> AsyncIterator[object]:
+                """
+                Zapisuje wpis strony tak, jakby zrobiło to inne zapytanie, i oczekuje na wolne miejsce w limicie serwera.
+
+                Yields:
+                    object: Obiekt pomiaru czasu zapytania.
+                """
+
+                pamięć.zapisz(url, {
+                    "etag": '"v1"',
+                    "ostatniaModyfikacja": None,
+                    "dokument": None,
+                    "źródło": "plany",
+                    "pobrano": 0.0,
+                    "ttl": 0,
+                    "rozmiar": 0,
+                    "skrot": "",
+                    "epoka": pamięć.epoka
+                })
+
+                async with ogranicz(adres) as pomiar:
+                    yield pomiar
+
+            monkeypatch.setattr(semafor, "ogranicz", ograniczIZapisz)
+            dokument = await odświeżZawartośćStrony(atom, url, "utf-8")
+
+            assert dokument is not None and dokument.p.string == "plan"
+            assert pamięć.wpisy[url]["dokument"] is dokument
+
+    asyncio.run(wykonaj())
+
+    assert zapytania == [{}]
@@ -0,0 +1,70 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+import logging
+
+# Zewnętrzne biblioteki
+import pytest
+
+# Wewnętrzne importy
+from src.classes.prefetcher import (
+    Prefetcher,
+    spekulacja
+)
+from src.handlers.configuration import konfiguracja
+
+@pytest.mark.parametrize("błąd", [False, True])
+def test_wykonanieZWyprzedzeniem(stan: None, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture, błąd: bool) -> None:
+    """
+    Sprawdza, czy zapytanie zaplanowane z wyprzedzeniem wykonywane jest jako spekulacyjne, a jego niepowodzenie jest logowane i zliczane jako nieudane.
+    """
+
+    przewidywanie = Prefetcher()
+    wywołania: list[tuple[dict[str, str], bool]] = []
+
+    async def obsługa(**parametry: str) -> None:
+        """
+        Odnotowuje parametry zapytania i to, czy zostało wykonane z wyprzedzeniem.
+
+        Raises:
+            RuntimeError: Gdy test sprawdza niepowodzenie zapytania.
+        """
+
+        wywołania.append((parametry, spekulacja.get()))
+
+        if błąd:
+            raise RuntimeError("błąd")
+
+    async def wykonaj() -> bool:
+        """
+        Planuje zapytanie i czeka na jego zakończenie.
+
+        Returns:
+            bool: Flaga informująca, czy zapytanie zostało zaplanowane.
+        """
+
+        zaplanowane = przewidywanie.zaplanuj(przewidywanie.zwróćKlucz("planlekcji", {"identyfikator": "o1"}))
+        await asyncio.gather(*przewidywanie.zadania)
+        return zaplanowane
+
+    monkeypatch.setitem(konfiguracja, "przewidywanie", {**konfiguracja.get("przewidywanie", {}), "wspolbieznosc": 2, "odstep": 60})
+    przewidywanie.zarejestrujObsługę("planlekcji", obsługa)
+
+    with caplog.at_level(logging.ERROR, logger="Atom API"):
+        assert asyncio.run(wykonaj())
+
+    assert wywołania == [({"identyfikator": "o1"}, True)]
+    assert (przewidywanie.wykonane, przewidywanie.nieudane) == ((0, 1) if błąd else (1, 0))
+    assert any("z wyprzedzeniem" in wpis.message for wpis in caplog.records) == błąd
+    assert not przewidywanie.wykonywane
@@ -0,0 +1,130 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+
+# Zewnętrzne biblioteki
+import pytest
+
+# Wewnętrzne importy
+from src.classes.flight import SingleFlight
+
+def test_scalanie() -> None:
+    """
+    Sprawdza, czy jednoczesne wywołania operacji o tym samym kluczu wykonują ją raz i otrzymują ten sam wynik, a wywołania o innym kluczu lub po jej zakończeniu wykonują ją ponownie.
+    """
+
+    scalanie = SingleFlight()
+    wykonania: list[str] = []
+
+    async def operacja(klucz: str) -> object:
+        """
+        Odnotowuje wykonanie i zwraca nowy obiekt po przełączeniu pętli zdarzeń.
+
+        Returns:
+            object: Wynik operacji.
+        """
+
+        wykonania.append(klucz)
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def wykonaj() -> tuple[list[object], object]:
+        """
+        Wykonuje jednocześnie trzy operacje o kluczu `a` i jedną o kluczu `b`, a następnie ponownie operację o kluczu `a`.
+
+        Returns:
+            tuple[list[object], object]: Wyniki jednoczesnych operacji oraz wynik operacji wykonanej po ich zakończeniu.
+        """
+
+        wyniki = await asyncio.gather(*[scalanie.wykonaj(klucz, lambda klucz=klucz: operacja(klucz)) for klucz in "aaab"])
+        return wyniki, await scalanie.wykonaj("a", lambda: operacja("a"))
+
+    wyniki, ponowny = asyncio.run(wykonaj())
+
+    assert wykonania == ["a", "b", "a"]
+    assert wyniki[0] is wyniki[1] is wyniki[2]
+    assert wyniki[3] is not wyniki[0] and ponowny is not wyniki[0]
+    assert scalanie.zwróćStatystyki() == {"wToku": 0, "wykonane": 3, "scalone": 2}
+
+
+def test_anulowanieOczekującego() -> None:
+    """
+    Sprawdza, czy anulowanie oczekiwania jednego z wywołujących nie przerywa operacji pozostałym.
+    """
+
+    scalanie = SingleFlight()
+
+    async def operacja() -> str:
+        """
+        Zwraca wynik po przełączeniu pętli zdarzeń.
+
+        Returns:
+            str: Wynik operacji.
+        """
+
+        await asyncio.sleep(0.01)
+        return "wynik"
+
+    async def wykonaj() -> str:
+        """
+        Anuluje pierwsze z dwóch oczekiwań na tę samą operację i zwraca wynik drugiego.
+
+        Returns:
+            str: Wynik operacji otrzymany przez drugiego wywołującego.
+        """
+
+        pierwszy = asyncio.ensure_future(scalanie.wykonaj("a", operacja))
+        drugi = asyncio.ensure_future(scalanie.wykonaj("a", operacja))
+        await asyncio.sleep(0)
+        pierwszy.cancel()
+        return await drugi
+
+    assert asyncio.run(wykonaj()) == "wynik"
+
+
+def test_błądOperacji() -> None:
+    """
+    Sprawdza, czy błąd operacji przekazywany jest wszystkim oczekującym, a klucz jest zwalniany, aby kolejne wywołanie wykonało operację ponownie.
+    """
+
+    scalanie = SingleFlight()
+
+    async def operacja() -> None:
+        """
+        Zgłasza błąd po przełączeniu pętli zdarzeń.
+
+        Raises:
+            RuntimeError: Zawsze.
+        """
+
+        await asyncio.sleep(0.01)
+        raise RuntimeError("błąd")
+
+    async def wykonaj() -> list[BaseException | None]:
+        """
+        Wykonuje jednocześnie dwie operacje o tym samym kluczu.
+
+        Returns:
+            list[BaseException | None]: Wyniki obu wywołań.
+        """
+
+        return await asyncio.gather(scalanie.wykonaj("a", operacja), scalanie.wykonaj("a", operacja), return_exceptions=True)
+
+    wyniki = asyncio.run(wykonaj())
+
+    assert all(isinstance(wynik, RuntimeError) for wynik in wyniki)
+    assert not scalanie.wToku
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(scalanie.wykonaj("a", operacja))
@@ -0,0 +1,117 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+import asyncio
+import json
+from pathlib import Path
+from typing import (
+    Any,
+    Callable
+)
+
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+import pytest
+
+# Wewnętrzne importy
+from korpus import (
+    ADRESY,
+    STRONY
+)
+from src.handlers.lists.parser import wyodrębnijListy
+from src.handlers.substitutions.parser import wyodrębnijZastępstwa
+from src.handlers.timetables.parser import wyodrębnijPlanLekcji
+
+WYNIKI: dict[str, Any] = json.loads((Path(__file__).resolve().parent / "fixtures" / "wyniki.json").read_text(encoding="utf-8"))
+PLANY = sorted(ścieżka.name for ścieżka in (STRONY / "plany").glob("[ons]*.html"))
+ODDZIAŁY = [nazwa for nazwa in PLANY if nazwa.startswith("o")]
+
+def zwróćListy(pobierz: Callable[[str], BeautifulSoup]) -> dict[str, Any]:
+    """
+    Wyodrębnia listy oddziałów, nauczycieli oraz sal z zapisanej strony listy.
+
+    Args:
+        pobierz (Callable[[str], BeautifulSoup]): Funkcja zwracająca przetworzoną zapisaną stronę.
+
+    Returns:
+        dict[str, Any]: Słownik zawierający listy oddziałów, nauczycieli oraz sal.
+    """
+
+    return wyodrębnijListy(pobierz(ADRESY["lista"]), ADRESY["lista"])
+
+
+def test_listy(pobierz: Callable[[str], BeautifulSoup]) -> None:
+    """
+    Sprawdza, czy listy wyodrębnione ze strony przetworzonej każdym silnikiem są zgodne z zapisanym wynikiem.
+    """
+
+    assert zwróćListy(pobierz) == WYNIKI["listy"]
+
+
+@pytest.mark.parametrize("nazwa", PLANY)
+def test_planLekcji(pobierz: Callable[[str], BeautifulSoup], nazwa: str) -> None:
+    """
+    Sprawdza, czy plan lekcji oddziału, nauczyciela lub sali wyodrębniony ze strony przetworzonej każdym silnikiem jest zgodny z zapisanym wynikiem.
+    """
+
+    url = ADRESY["plany"] + nazwa
+    listaOddziałów = zwróćListy(pobierz)["oddzialy"]
+    planLekcji = asyncio.run(wyodrębnijPlanLekcji(None, pobierz(url), listaOddziałów, None, None, None, url, None))
+
+    assert planLekcji == WYNIKI[f"plan/{nazwa}"]
+
+
+@pytest.mark.parametrize("nazwa", ODDZIAŁY)
+def test_planLekcjiFiltrowany(pobierz: Callable[[str], BeautifulSoup], nazwa: str) -> None:
+    """
+    Sprawdza, czy plan lekcji oddziału z wybranymi grupami, przedmiotami dodatkowymi i dniem skróconych lekcji oraz plan ograniczony do jednego dnia tygodnia są zgodne z zapisanymi wynikami.
+    """
+
+    url = ADRESY["plany"] + nazwa
+    listaOddziałów = zwróćListy(pobierz)["oddzialy"]
+    planLekcji = asyncio.run(wyodrębnijPlanLekcji(None, pobierz(url), listaOddziałów, "Wtorek", ["1/2", "j1"], {"religia": False, "zdrowotna": True}, url, None))
+
+    assert planLekcji == WYNIKI[f"plan/{nazwa}/filtry"]
+
+    for dzień, lekcje in WYNIKI[f"plan/{nazwa}"]["plan"].items():
+        planDnia = asyncio.run(wyodrębnijPlanLekcji(None, pobierz(url), listaOddziałów, None, None, None, url, [dzień]))
+        assert planDnia == {**WYNIKI[f"plan/{nazwa}"], "plan": {dzień: lekcje}}
+
+
+def test_zastępstwa(pobierz: Callable[[str], BeautifulSoup]) -> None:
+    """
+    Sprawdza, czy zastępstwa wyodrębnione ze strony przetworzonej każdym silnikiem, bez filtrów oraz dla każdego oddziału i nauczyciela, są zgodne z zapisanymi wynikami.
+    """
+
+    listy = zwróćListy(pobierz)
+    listaOddziałów = listy["oddzialy"]
+    listaNauczycieli = listy["nauczyciele"]
+
+    async def wyodrębnij(oddział: str | None, nauczyciel: str | None, grupy: list[str] | None, przedmiotyDodatkowe: dict[str, bool] | None) -> Any:
+        """
+        Wyodrębnia zastępstwa z zapisanej strony dla wybranego oddziału lub nauczyciela.
+
+        Returns:
+            Any: Słownik zawierający informacje o zastępstwach.
+        """
+
+        return await wyodrębnijZastępstwa(None, pobierz(ADRESY["zastepstwa"]), listaOddziałów, listaNauczycieli, oddział, nauczyciel, grupy, przedmiotyDodatkowe)
+
+    assert asyncio.run(wyodrębnij(None, None, None, None)) == WYNIKI["zastepstwa"]
+
+    for oddział in sorted(listaOddziałów):
+        assert asyncio.run(wyodrębnij(oddział, None, None, None)) == WYNIKI[f"zastepstwa/{oddział}"]
+        assert asyncio.run(wyodrębnij(oddział, None, ["2/2"], {"religia": False})) == WYNIKI[f"zastepstwa/{oddział}/filtry"]
+
+    for nauczyciel in sorted(listaNauczycieli):
+        assert asyncio.run(wyodrębnij(None, nauczyciel, None, None)) == WYNIKI[f"zastepstwa/{nauczyciel}"]
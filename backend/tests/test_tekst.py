@@ -0,0 +1,31 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Zewnętrzne biblioteki
+from bs4 import BeautifulSoup
+import pytest
+
+# Wewnętrzne importy
+from src.handlers.helpers import wyodrębnijTekst
+
+@pytest.mark.parametrize(("html", "tekst"), [
+    ("<td>1a<!-- komentarz --> j.polski</td>", "1a j.polski"),
+    ("<td>Kowalski<br>\r\n<br><br><br>Nowak</td>", "Kowalski\n\nNowak"),
+    ("<td>&nbsp;&nbsp;<b>2b</b>\n &nbsp; <i>fiz</i>&nbsp;</td>", "2b fiz"),
+    ("<td></td>", "")
+])
+def test_wyodrębnijTekst(silnik: str, html: str, tekst: str) -> None:
+    """
+    Sprawdza, czy tekst komórki wyodrębniany jest bez komentarzy, z zachowaniem znaczników `<br>` jako znaków nowej linii i ze znormalizowanymi odstępami.
+    """
+
+    assert wyodrębnijTekst(BeautifulSoup(f"<table><tr>{html}</tr></table>", silnik).td) == tekst
@@ -0,0 +1,151 @@
+#
+#
+#     ▄▄     ▄▄▄▄▄▄▄▄    ▄▄▄▄    ▄▄▄  ▄▄▄               ▄▄     ▄▄▄▄▄▄     ▄▄▄▄▄▄
+#    ████    ▀▀▀██▀▀▀   ██▀▀██   ███  ███              ████    ██▀▀▀▀█▄   ▀▀██▀▀
+#    ████       ██     ██    ██  ████████              ████    ██    ██     ██
+#   ██  ██      ██     ██    ██  ██ ██ ██             ██  ██   ██████▀      ██
+#   ██████      ██     ██    ██  ██ ▀▀ ██             ██████   ██           ██
+#  ▄██  ██▄     ██      ██▄▄██   ██    ██            ▄██  ██▄  ██         ▄▄██▄▄
+#  ▀▀    ▀▀     ▀▀       ▀▀▀▀    ▀▀    ▀▀            ▀▀    ▀▀  ▀▀         ▀▀▀▀▀▀
+#
+#
+
+# Standardowe biblioteki
+from pathlib import Path
+from typing import Iterator
+
+# Zewnętrzne biblioteki
+import pytest
+
+# Wewnętrzne importy
+from src.classes.snapshots import Snapshots
+from src.classes.types import (
+    Lekcja,
+    PlanLekcji,
+    WpisPlanu
+)
+from src.handlers.configuration import konfiguracja
+
+def zwróćLekcję(przedmiot: str, sala: str = "101") -> Lekcja:
+    """
+    Zwraca standardową lekcję oddziału 1a.
+
+    Args:
+        przedmiot (str): Nazwa przedmiotu.
+        sala (str): Numer sali.
+
+    Returns:
+        Lekcja: Słownik lekcji.
+    """
+
+    return {
+        "standard": True,
+        "przedmiot": przedmiot,
+        "grupa": None,
+        "nauczyciel": {"tekst": "Kowalski", "url": "n1.html", "identyfikator": "n1"},
+        "sala": {"tekst": sala, "url": "s1.html", "identyfikator": "s1"},
+        "oddzialy": [{"tekst": "1a", "url": "o1.html", "identyfikator": "o1"}]
+    }
+
+
+def zwróćPlan(plan: dict[str, list[WpisPlanu]]) -> PlanLekcji:
+    """
+    Zwraca plan lekcji oddziału 1a o podanych wpisach.
+
+    Args:
+        plan (dict[str, list[WpisPlanu]]): Wpisy planu lekcji według dnia tygodnia.
+
+    Returns:
+        PlanLekcji: Słownik planu lekcji.
+    """
+
+    return {
+        "nazwa": "1a",
+        "kategoria": "oddzial",
+        "url": "https://plan.zse.bydgoszcz.pl/plany/o1.html",
+        "identyfikator": "o1",
+        "wygenerowano": None,
+        "data": None,
+        "plan": plan
+    }
+
+
+@pytest.fixture
+def baza(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Snapshots]:
+    """
+    Otwiera bazę danych wersji planów lekcji w katalogu tymczasowym.
+
+    Yields:
+        Snapshots: Obiekt przechowujący wersje planów lekcji.
+    """
+
+    monkeypatch.setitem(konfiguracja, "wersje", {**konfiguracja.get("wersje", {}), "wlaczone": True, "limit": 0})
+    wersje = Snapshots()
+    wersje.start(tmp_path)
+    yield wersje
+    wersje.close()
+
+
+def test_porównaj(baza: Snapshots) -> None:
+    """
+    Sprawdza, czy porównanie wersji planu lekcji zgłasza dodane i usunięte lekcje dla dnia i numeru lekcji, uwzględniając powtórzone lekcje i zmianę godzin, a pomija zmianę kolejności lekcji w obrębie jednej godziny.
+    """
+
+    poprzedni = zwróćPlan({
+        "Poniedziałek": [
+            {"numer": 1, "poczatek": "8:00", "koniec": "8:45", "lekcje": [zwróćLekcję("matematyka"), zwróćLekcję("fizyka")]},
+            {"numer": 2, "poczatek": "8:50", "koniec": "9:35", "lekcje": [zwróćLekcję("wf"), zwróćLekcję("wf")]},
+            {"numer": 3, "poczatek": "9:45", "koniec": "10:30", "lekcje": [zwróćLekcję("chemia")]}
+        ],
+        "Wtorek": [
+            {"numer": 1, "poczatek": "8:00", "koniec": "8:45", "lekcje": [zwróćLekcję("historia")]}
+        ]
+    })
+    następny = zwróćPlan({
+        "Poniedziałek": [
+            {"numer": 1, "poczatek": "8:00", "koniec": "8:45", "lekcje": [zwróćLekcję("fizyka"), zwróćLekcję("matematyka")]},
+            {"numer": 2, "poczatek": "8:50", "koniec": "9:35", "lekcje": [zwróćLekcję("wf")]},
+            {"numer": 3, "poczatek": "9:50", "koniec": "10:35", "lekcje": [zwróćLekcję("chemia")]}
+        ],
+        "Wtorek": [
+            {"numer": 1, "poczatek": "8:00", "koniec": "8:45", "lekcje": [zwróćLekcję("historia", "102")]},
+            {"numer": 2, "poczatek": "8:50", "koniec": "9:35", "lekcje": [zwróćLekcję("biologia")]}
+        ]
+    })
+
+    od = baza.zapisz(poprzedni)
+    do = baza.zapisz(następny)
+
+    assert baza.porównaj("o1", od) == {
+        "identyfikator": "o1",
+        "od": od,
+        "do": do,
+        "zmiany": [
+            {"dzien": "Poniedziałek", "numer": 2, "poczatek": "8:50", "koniec": "9:35", "dodane": [], "usuniete": [zwróćLekcję("wf")]},
+            {"dzien": "Poniedziałek", "numer": 3, "poczatek": "9:50", "koniec": "10:35", "dodane": [], "usuniete": []},
+            {"dzien": "Wtorek", "numer": 1, "poczatek": "8:00", "koniec": "8:45", "dodane": [zwróćLekcję("historia", "102")], "usuniete": [zwróćLekcję("historia")]},
+            {"dzien": "Wtorek", "numer": 2, "poczatek": "8:50", "koniec": "9:35", "dodane": [zwróćLekcję("biologia")], "usuniete": []}
+        ]
+    }
+
+
+def test_porównajPowrótDoWcześniejszejWersji(baza: Snapshots) -> None:
+    """
+    Sprawdza, czy powrót planu lekcji do wcześniejszej postaci zapisywany jest jako nowa wersja, a ta sama postać zapisana ponownie nie tworzy wersji.
+    """
+
+    pierwszy = zwróćPlan({"Poniedziałek": [{"numer": 1, "poczatek": "8:00", "koniec": "8:45", "lekcje": [zwróćLekcję("matematyka")]}]})
+    drugi = zwróćPlan({"Poniedziałek": [{"numer": 1, "poczatek": "8:00", "koniec": "8:45", "lekcje": [zwróćLekcję("fizyka")]}]})
+
+    a = baza.zapisz(pierwszy)
+    b = baza.zapisz(drugi)
+
+    assert baza.zapisz(drugi) is None
+
+    c = baza.zapisz(pierwszy)
+
+    assert [wersja["numer"] for wersja in baza.zwróćWersje("o1")] == [a, b, c]
+    assert baza.porównaj("o1", a, c)["zmiany"] == []
+    assert baza.porównaj("o1", b)["zmiany"] == [
+        {"dzien": "Poniedziałek", "numer": 1, "poczatek": "8:00", "koniec": "8:45", "dodane": [zwróćLekcję("matematyka")], "usuniete": [zwróćLekcję("fizyka")]}
+    ]